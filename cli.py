@@ -313,18 +313,11 @@ def create_feed(
     )
 
     try:
-        state_args = state.to_state_args(session.config.default_property_package)
+        session.feed_state = state.to_feed_state(session.config.default_property_package)
     except ValueError as e:
         rprint(f"[red]Error: {e}[/red]")
         raise typer.Exit(1)
 
-    session.feed_state = {
-        "flow_vol_m3_hr": flow,
-        "temperature_C": temperature,
-        "pressure_bar": pressure,
-        "components": comps,
-        "state_args": state_args,
-    }
     session_manager.save(session)
 
     rprint("[green]Feed created[/green]")
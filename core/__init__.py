@@ -11,7 +11,9 @@ from .property_registry import (
 from .translator_registry import (
     TranslatorSpec,
     TRANSLATORS,
+    TRANSLATORS_BY_NAME,
     get_translator,
+    get_translator_by_name,
     find_translator_chain,
     check_compatibility,
     list_translators,
@@ -23,7 +25,7 @@ from .unit_registry import (
     get_unit_spec,
 )
 from .water_state import WaterTAPState
-from .session import SessionConfig, FlowsheetSession, SessionManager, UnitInstance, Connection
+from .session import SessionConfig, FlowsheetSession, SessionManager, SessionStatus, UnitInstance, Connection
 from .unit_registry import list_units
 
 __all__ = [
@@ -36,7 +38,9 @@ __all__ = [
     # Translators
     "TranslatorSpec",
     "TRANSLATORS",
+    "TRANSLATORS_BY_NAME",
     "get_translator",
+    "get_translator_by_name",
     "find_translator_chain",
     "check_compatibility",
     "list_translators",
@@ -52,6 +56,7 @@ __all__ = [
     "SessionConfig",
     "FlowsheetSession",
     "SessionManager",
+    "SessionStatus",
     "UnitInstance",
     "Connection",
 ]
@@ -4,15 +4,43 @@ Provides session configuration and persistence for flowsheet building.
 """
 
 import json
+import os
+import tempfile
 import uuid
+from collections import OrderedDict
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from .property_registry import PropertyPackageType
 
+try:
+    import orjson
+except ImportError:  # Optional accelerator; the stdlib parser is the fallback
+    orjson = None
+
+
+def _read_json(path: Path) -> Any:
+    """Parse a JSON file, with orjson when it is installed.
+
+    Files containing NaN/Infinity (valid for the stdlib encoder, rejected
+    by orjson) are re-parsed with the stdlib.
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    if orjson is None:
+        with open(path) as f:
+            return json.load(f)
+    raw = path.read_bytes()
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return json.loads(raw)
+
 
 def _serialize_dict_keys(obj: Any) -> Any:
     """Recursively convert tuple keys to strings for JSON serialization."""
@@ -156,6 +184,27 @@ class FlowsheetSession:
     # Costing configuration
     costing_config: Optional[Dict[str, Any]] = None
 
+    # Derived read-only payloads (not serialized, cleared on mutation)
+    _views: Dict[str, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def cached_view(self, key: str, build: Callable[[], Any]) -> Any:
+        """Return a derived value, computing it once per session state.
+
+        Args:
+            key: Name of the derived value
+            build: Zero-argument function computing it
+
+        Returns:
+            Cached or freshly built value
+        """
+        if key not in self._views:
+            self._views[key] = build()
+        return self._views[key]
+
+    def clear_views(self) -> None:
+        """Drop derived values after the session has been modified."""
+        self._views.clear()
+
     def add_unit(
         self,
         unit_id: str,
@@ -188,12 +237,15 @@ class FlowsheetSession:
         self._update_timestamp()
         return unit
 
-    def remove_unit(self, unit_id: str) -> None:
+    def remove_unit(self, unit_id: str) -> List[Connection]:
         """Remove a unit from the flowsheet.
 
         Args:
             unit_id: Unit to remove
 
+        Returns:
+            Connections that were removed along with the unit
+
         Raises:
             KeyError: If unit not found
         """
@@ -203,13 +255,51 @@ class FlowsheetSession:
         # Remove unit
         del self.units[unit_id]
 
-        # Remove associated connections
-        self.connections = [
-            c for c in self.connections
-            if c.source_unit != unit_id and c.dest_unit != unit_id
-        ]
+        # Compact surviving connections in place, collecting the removed ones
+        conns = self.connections
+        removed = []
+        keep = 0
+        for c in conns:
+            if c.source_unit == unit_id or c.dest_unit == unit_id:
+                removed.append(c)
+            else:
+                conns[keep] = c
+                keep += 1
+        del conns[keep:]
 
         self._update_timestamp()
+        return removed
+
+    def adjacency(self) -> Dict[str, List[Connection]]:
+        """Get outgoing connections indexed by source unit.
+
+        Returns:
+            Dict of source unit ID -> connections leaving it, in insertion order
+        """
+        def build() -> Dict[str, List[Connection]]:
+            adj: Dict[str, List[Connection]] = {}
+            for c in self.connections:
+                adj.setdefault(c.source_unit, []).append(c)
+            return adj
+
+        return self.cached_view("adjacency", build)
+
+    def connection_dicts(self) -> List[Dict[str, str]]:
+        """Get connections in the dict form used by utils.topo_sort.
+
+        Returns:
+            List of {"src_unit", "src_port", "dest_unit", "dest_port"} dicts,
+            shared until the next mutation (do not modify)
+        """
+        return self.cached_view("connection_dicts", lambda: [
+            {
+                "src_unit": c.source_unit,
+                "src_port": c.source_port,
+                "dest_unit": c.dest_unit,
+                "dest_port": c.dest_port,
+            }
+            for c in self.connections
+        ])
 
     def add_connection(
         self,
@@ -358,6 +448,7 @@ class FlowsheetSession:
     def _update_timestamp(self) -> None:
         """Update the updated_at timestamp."""
         self.config.updated_at = datetime.now(timezone.utc).isoformat()
+        self.clear_views()
 
     def to_dict(self) -> Dict:
         """Convert to dictionary for serialization."""
@@ -410,6 +501,9 @@ class FlowsheetSession:
 class SessionManager:
     """Manager for persisting and loading flowsheet sessions."""
 
+    # Maximum number of sessions kept by load_cached()
+    CACHE_SIZE = 32
+
     def __init__(self, storage_dir: Path):
         """Initialize session manager.
 
@@ -418,20 +512,52 @@ class SessionManager:
         """
         self.storage_dir = Path(storage_dir)
         self.storage_dir.mkdir(parents=True, exist_ok=True)
+        # session_id -> ((mtime_ns, size), session), most recently used last
+        self._cache: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def _remember(self, session_id: str, stamp: tuple, session: FlowsheetSession) -> None:
+        """Store a session in the LRU cache, evicting the oldest entry."""
+        self._cache[session_id] = (stamp, session)
+        self._cache.move_to_end(session_id)
+        while len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
 
     def _session_path(self, session_id: str) -> Path:
         """Get path for session file."""
         return self.storage_dir / f"{session_id}.json"
 
+    def _warm_start_path(self, session_id: str) -> Path:
+        """Get path for a session's warm-start snapshot."""
+        return self.storage_dir / f"{session_id}.warmstart"
+
     def save(self, session: FlowsheetSession) -> None:
         """Save session to disk.
 
+        The file is written compactly to a temporary path and renamed into
+        place, so readers in other processes never see a partial session.
+        Each call gets its own temporary file, since the server and worker
+        processes may save the same session concurrently.
+
         Args:
             session: Session to save
         """
-        path = self._session_path(session.config.session_id)
-        with open(path, "w") as f:
-            json.dump(session.to_dict(), f, indent=2)
+        session_id = session.config.session_id
+        path = self._session_path(session_id)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(session.to_dict(), f, separators=(",", ":"))
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+        # Tools may edit fields directly, so derived views can't be trusted
+        session.clear_views()
+        stat = path.stat()
+        self._remember(session_id, (stat.st_mtime_ns, stat.st_size), session)
 
     def load(self, session_id: str) -> FlowsheetSession:
         """Load session from disk.
@@ -449,9 +575,48 @@ class SessionManager:
         if not path.exists():
             raise FileNotFoundError(f"Session '{session_id}' not found")
 
-        with open(path) as f:
-            data = json.load(f)
-        return FlowsheetSession.from_dict(data)
+        return FlowsheetSession.from_dict(_read_json(path))
+
+    def load_cached(self, session_id: str) -> FlowsheetSession:
+        """Load session, reusing the cached copy if the file is unchanged.
+
+        The file mtime and size are checked on every call, so writes from other
+        processes (CLI, solve worker) are picked up. The returned session is
+        shared between callers and must not be mutated without saving; use
+        load() for a private copy.
+
+        Args:
+            session_id: Session ID to load
+
+        Returns:
+            Loaded FlowsheetSession
+
+        Raises:
+            FileNotFoundError: If session not found
+        """
+        try:
+            stat = self._session_path(session_id).stat()
+        except FileNotFoundError:
+            self._cache.pop(session_id, None)
+            raise FileNotFoundError(f"Session '{session_id}' not found")
+
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = self._cache.get(session_id)
+        if cached is not None and cached[0] == stamp:
+            self._cache.move_to_end(session_id)
+            return cached[1]
+
+        session = self.load(session_id)
+        self._remember(session_id, stamp, session)
+        return session
+
+    def invalidate(self, session_id: str) -> None:
+        """Drop a session from the load cache.
+
+        Args:
+            session_id: Session ID to forget
+        """
+        self._cache.pop(session_id, None)
 
     def delete(self, session_id: str) -> None:
         """Delete a session.
@@ -466,6 +631,45 @@ class SessionManager:
         if not path.exists():
             raise FileNotFoundError(f"Session '{session_id}' not found")
         path.unlink()
+        self._warm_start_path(session_id).unlink(missing_ok=True)
+        self.invalidate(session_id)
+
+    def save_warm_start(
+        self,
+        session_id: str,
+        fingerprint: str,
+        values: Dict[str, float],
+    ) -> None:
+        """Store variable values from a successful solve for warm-starting.
+
+        Kept beside the session file rather than in session.results so the
+        (potentially large) snapshot is not returned by the results tools.
+
+        Args:
+            session_id: Session the solution belongs to
+            fingerprint: Model fingerprint of the session that was solved
+            values: Variable name -> value for the unfixed variables
+        """
+        with open(self._warm_start_path(session_id), "w") as f:
+            json.dump({"fingerprint": fingerprint, "values": values}, f, separators=(",", ":"))
+
+    def load_warm_start(self, session_id: str, fingerprint: str) -> Optional[Dict[str, float]]:
+        """Load the warm-start snapshot if it matches the current model.
+
+        Args:
+            session_id: Session to load for
+            fingerprint: Model fingerprint of the session as it is now
+
+        Returns:
+            Variable name -> value, or None if absent or stale
+        """
+        try:
+            data = _read_json(self._warm_start_path(session_id))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        if data.get("fingerprint") != fingerprint:
+            return None
+        return data.get("values")
 
     def list_sessions(self) -> List[Dict]:
         """List all sessions.
@@ -476,8 +680,7 @@ class SessionManager:
         sessions = []
         for path in self.storage_dir.glob("*.json"):
             try:
-                with open(path) as f:
-                    data = json.load(f)
+                data = _read_json(path)
                 sessions.append({
                     "session_id": data["config"]["session_id"],
                     "name": data["config"].get("name", ""),
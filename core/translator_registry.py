@@ -168,6 +168,13 @@ TRANSLATORS: Dict[Tuple[PropertyPackageType, PropertyPackageType], TranslatorSpe
 }
 
 
+# Same registry keyed by PropertyPackageType names (e.g. ("ASM1", "ADM1")),
+# for lookups straight from user-supplied package names
+TRANSLATORS_BY_NAME: Dict[Tuple[str, str], TranslatorSpec] = {
+    (source.name, dest.name): spec for (source, dest), spec in TRANSLATORS.items()
+}
+
+
 def get_translator(
     source: PropertyPackageType,
     dest: PropertyPackageType
@@ -184,6 +191,19 @@ def get_translator(
     return TRANSLATORS.get((source, dest))
 
 
+def get_translator_by_name(source: str, dest: str) -> Optional[TranslatorSpec]:
+    """Get translator specification from property package names.
+
+    Args:
+        source: Source PropertyPackageType name (e.g., "ASM1")
+        dest: Destination PropertyPackageType name (e.g., "ADM1")
+
+    Returns:
+        TranslatorSpec if a translator exists, None otherwise
+    """
+    return TRANSLATORS_BY_NAME.get((source, dest))
+
+
 def find_translator_chain(
     source: PropertyPackageType,
     dest: PropertyPackageType
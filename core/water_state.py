@@ -56,6 +56,22 @@ ION_CHARGES = {
     "CO3_2-": -2,
 }
 
+# state_args converter method per property package (one dict lookup per call)
+_STATE_ARGS_CONVERTERS = {
+    PropertyPackageType.SEAWATER: "_to_seawater_state_args",
+    PropertyPackageType.NACL: "_to_nacl_state_args",
+    PropertyPackageType.NACL_T_DEP: "_to_nacl_state_args",
+    PropertyPackageType.WATER: "_to_water_state_args",
+    PropertyPackageType.MCAS: "_to_mcas_state_args",
+    PropertyPackageType.ZERO_ORDER: "_to_zero_order_state_args",
+    PropertyPackageType.ASM1: "_to_asm_state_args",
+    PropertyPackageType.ASM2D: "_to_asm_state_args",
+    PropertyPackageType.ASM3: "_to_asm_state_args",
+    PropertyPackageType.MODIFIED_ASM2D: "_to_asm_state_args",
+    PropertyPackageType.ADM1: "_to_adm_state_args",
+    PropertyPackageType.MODIFIED_ADM1: "_to_adm_state_args",
+}
+
 
 @dataclass
 class WaterTAPState:
@@ -174,23 +190,38 @@ class WaterTAPState:
         Raises:
             ValueError: If conversion not supported or data missing
         """
-        if pkg_type == PropertyPackageType.SEAWATER:
-            return self._to_seawater_state_args()
-        elif pkg_type in (PropertyPackageType.NACL, PropertyPackageType.NACL_T_DEP):
-            return self._to_nacl_state_args()
-        elif pkg_type == PropertyPackageType.WATER:
-            return self._to_water_state_args()
-        elif pkg_type == PropertyPackageType.MCAS:
-            return self._to_mcas_state_args()
-        elif pkg_type == PropertyPackageType.ZERO_ORDER:
-            return self._to_zero_order_state_args()
-        elif pkg_type in (PropertyPackageType.ASM1, PropertyPackageType.ASM2D,
-                          PropertyPackageType.ASM3, PropertyPackageType.MODIFIED_ASM2D):
-            return self._to_asm_state_args()
-        elif pkg_type in (PropertyPackageType.ADM1, PropertyPackageType.MODIFIED_ADM1):
-            return self._to_adm_state_args()
-        else:
+        converter = _STATE_ARGS_CONVERTERS.get(pkg_type)
+        if converter is None:
             raise ValueError(f"Unsupported property package: {pkg_type}")
+        return getattr(self, converter)()
+
+    def to_feed_state(self, pkg_type: PropertyPackageType) -> Dict:
+        """Build the session feed_state record for this state.
+
+        The record holds the user-facing feed specification alongside the
+        state_args for the target property package, so callers do not have
+        to copy each field by hand.
+
+        Args:
+            pkg_type: Target property package type
+
+        Returns:
+            Dict suitable for FlowsheetSession.feed_state
+
+        Raises:
+            ValueError: If conversion not supported or data missing
+        """
+        return {
+            "flow_vol_m3_hr": self.flow_vol_m3_hr,
+            "temperature_C": self.temperature_C,
+            "pressure_bar": self.pressure_bar,
+            "components": self.components,
+            "concentration_units": self.concentration_units,
+            "concentration_basis": self.concentration_basis,
+            "component_charges": self.component_charges,
+            "electroneutrality_species": self.electroneutrality_species,
+            "state_args": self.to_state_args(pkg_type),
+        }
 
     def _to_seawater_state_args(self) -> Dict:
         """Convert to Seawater property package format."""
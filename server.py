@@ -2,16 +2,17 @@
 """WaterTAP Engine MCP Server.
 
 FastMCP server exposing WaterTAP flowsheet building and solving capabilities.
-Provides 56 atomic tools organized by category:
+Provides 58 atomic tools organized by category:
 
-Core Tools (34):
+Core Tools (36):
 - Session Management (5): create_session, create_watertap_session, get_session, list_sessions, delete_session
 - Registry/Discovery (4): list_units, list_property_packages, list_translators, get_unit_spec, get_unit_requirements
 - Flowsheet Building (8): create_feed, create_unit, create_translator, connect_ports, connect_units,
                           update_unit, delete_unit, validate_flowsheet, get_flowsheet_diagram
-- DOF Management (5): get_dof_status, check_dof, fix_variable, unfix_variable, list_unfixed_vars
-- Scaling (6): get_scaling_status, set_scaling_factor, apply_scaling, calculate_scaling_factors,
-               report_scaling_issues, autoscale_large_jac
+- DOF Management (6): get_dof_status, check_dof, fix_variable, fix_variables_batch, unfix_variable,
+                      list_unfixed_vars
+- Scaling (7): get_scaling_status, set_scaling_factor, set_scaling_factors_batch, apply_scaling,
+               calculate_scaling_factors, report_scaling_issues, autoscale_large_jac
 
 Solver Operations (10):
 - Initialization (3): initialize_unit, initialize_flowsheet, get_initialization_order, propagate_state
@@ -29,9 +30,14 @@ Design Principles:
 - Orchestrates WaterTAP/IDAES utilities rather than replacing them
 """
 
+import functools
+import heapq
+import inspect
 import json
+from collections import OrderedDict, defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from mcp.server.fastmcp import FastMCP
 
@@ -40,7 +46,7 @@ from core import (
     PROPERTY_PACKAGES,
     get_property_package_spec,
     TRANSLATORS,
-    get_translator,
+    get_translator_by_name,
     check_compatibility,
     find_translator_chain,
     UnitCategory,
@@ -51,8 +57,23 @@ from core import (
     SessionConfig,
     FlowsheetSession,
     SessionManager,
+    SessionStatus,
 )
-from utils import JobManager, JobStatus
+from utils import JobManager, JobStatus, ModelCache, session_fingerprint, structural_fingerprint
+from utils.auto_translator import check_connection_compatibility
+from utils.costing import extract_costing
+from utils.model_builder import ModelBuilder
+from utils.topo_sort import (
+    compute_initialization_order,
+    get_sequential_decomposition_order,
+    parse_tear_streams,
+    SequentialDecompositionError,
+)
+from solver.diagnostics import top_k_indices
+from solver.dof_resolver import batch_degrees_of_freedom
+
+# WaterTAP/IDAES/Pyomo imports stay inside the tools: they take seconds to
+# load and the server must start (and serve session tools) without them.
 
 
 # Initialize FastMCP server
@@ -68,6 +89,104 @@ FLOWSHEETS_DIR = STORAGE_DIR / "flowsheets"
 # Initialize managers
 session_manager = SessionManager(FLOWSHEETS_DIR)
 job_manager = JobManager(STORAGE_DIR / "jobs")
+model_cache = ModelCache()
+
+# Structural diagnostics per structural fingerprint:
+# fingerprint -> (structural_issues, next_steps, degrees_of_freedom)
+STRUCTURAL_CACHE_SIZE = 32
+_structural_cache: "OrderedDict[str, Tuple[List[str], List[str], int]]" = OrderedDict()
+
+# Timed numerical toolbox checks run one at a time on this worker; a check
+# abandoned on timeout keeps running, and no new one starts until it ends
+_numerical_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="numerical-checks")
+_numerical_future: Optional[Future] = None
+
+
+def with_session(func: Optional[Callable] = None, *, mutate: bool = False) -> Callable:
+    """Load the session named by ``session_id`` and pass it to the tool.
+
+    The wrapped tool takes ``session`` as its first parameter; the exposed
+    signature takes ``session_id: str`` in its place. A missing session is
+    reported as the usual error dict.
+
+    Read-only tools share the cached session from
+    ``session_manager.load_cached``. Tools declared with ``mutate=True`` get
+    a private copy, which is saved when the tool returns without an
+    ``"error"`` key, so a failed mutation never reaches disk or the cache.
+
+    Args:
+        func: Tool function (when used as a bare decorator)
+        mutate: Whether the tool modifies the session
+
+    Returns:
+        Wrapped tool function
+    """
+    def decorator(fn: Callable) -> Callable:
+        # Separate wrappers per mode keep the per-call path branch-free
+        if mutate:
+            @functools.wraps(fn)
+            def wrapper(session_id: str, *args, **kwargs):
+                try:
+                    session = session_manager.load(session_id)
+                except FileNotFoundError:
+                    return {"error": f"Session '{session_id}' not found"}
+
+                result = fn(session, *args, **kwargs)
+                if not (isinstance(result, dict) and "error" in result):
+                    session_manager.save(session)
+                return result
+        else:
+            @functools.wraps(fn)
+            def wrapper(session_id: str, *args, **kwargs):
+                try:
+                    session = session_manager.load_cached(session_id)
+                except FileNotFoundError:
+                    return {"error": f"Session '{session_id}' not found"}
+                return fn(session, *args, **kwargs)
+
+        # Expose session_id instead of session to MCP and direct callers
+        sig = inspect.signature(fn)
+        params = list(sig.parameters.values())
+        params[0] = inspect.Parameter(
+            "session_id", inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=str
+        )
+        wrapper.__signature__ = sig.replace(parameters=params)
+        wrapper.__annotations__ = {
+            **{k: v for k, v in fn.__annotations__.items() if k != "session"},
+            "session_id": str,
+        }
+        return wrapper
+
+    if func is not None:
+        return decorator(func)
+    return decorator
+
+
+def _get_or_build_model(session: FlowsheetSession) -> Tuple[Any, Dict[str, Any]]:
+    """Get the built Pyomo model for a session, reusing the cached build.
+
+    The model is rebuilt only when the session's structure, fixed variables,
+    scaling or feed have changed since the cached build.
+
+    Args:
+        session: Session to build
+
+    Returns:
+        (model, units) tuple as from ModelBuilder.build()/get_units()
+
+    Raises:
+        ImportError: If WaterTAP/IDAES is not installed
+        ModelBuildError: If the model cannot be built
+    """
+    cached = model_cache.get(session)
+    if cached is not None:
+        return cached
+
+    builder = ModelBuilder(session)
+    m = builder.build()
+    units = builder.get_units()
+    model_cache.put(session, m, units)
+    return m, units
 
 
 # ============================================================================
@@ -131,7 +250,8 @@ def create_session(
 
 
 @mcp.tool()
-def get_session(session_id: str) -> Dict[str, Any]:
+@with_session
+def get_session(session: FlowsheetSession) -> Dict[str, Any]:
     """Get details of an existing session.
 
     Args:
@@ -140,11 +260,7 @@ def get_session(session_id: str) -> Dict[str, Any]:
     Returns:
         Full session state including units, connections, and DOF status
     """
-    try:
-        session = session_manager.load(session_id)
-        return session.to_dict()
-    except FileNotFoundError:
-        return {"error": f"Session '{session_id}' not found"}
+    return session.to_dict()
 
 
 @mcp.tool()
@@ -169,6 +285,7 @@ def delete_session(session_id: str) -> Dict[str, Any]:
     """
     try:
         session_manager.delete(session_id)
+        model_cache.invalidate(session_id)
         return {"deleted": session_id}
     except FileNotFoundError:
         return {"error": f"Session '{session_id}' not found"}
@@ -330,8 +447,9 @@ def get_unit_spec(unit_type: str) -> Dict[str, Any]:
 # ============================================================================
 
 @mcp.tool()
+@with_session(mutate=True)
 def create_feed(
-    session_id: str,
+    session: FlowsheetSession,
     flow_vol_m3_hr: float,
     tds_mg_L: Optional[float] = None,
     nacl_mg_L: Optional[float] = None,
@@ -361,11 +479,6 @@ def create_feed(
     Returns:
         Feed state details and state_args for property package
     """
-    try:
-        session = session_manager.load(session_id)
-    except FileNotFoundError:
-        return {"error": f"Session '{session_id}' not found"}
-
     # Build components dict
     comps = components or {}
     if tds_mg_L is not None:
@@ -375,7 +488,7 @@ def create_feed(
 
     # Validate MCAS requirements
     pkg = session.config.default_property_package
-    if pkg == PropertyPackageType.MCAS:
+    if pkg is PropertyPackageType.MCAS:
         if not component_charges:
             return {
                 "error": "MCAS property package requires component_charges dict (e.g., {'Na_+': 1, 'Cl_-': -1})"
@@ -398,32 +511,20 @@ def create_feed(
 
     # Convert to state_args for default property package
     try:
-        state_args = state.to_state_args(session.config.default_property_package)
+        session.feed_state = state.to_feed_state(session.config.default_property_package)
     except ValueError as e:
         return {"error": str(e)}
 
-    session.feed_state = {
-        "flow_vol_m3_hr": flow_vol_m3_hr,
-        "temperature_C": temperature_C,
-        "pressure_bar": pressure_bar,
-        "components": comps,
-        "concentration_units": concentration_units,
-        "concentration_basis": concentration_basis,
-        "component_charges": component_charges,
-        "electroneutrality_species": electroneutrality_species,
-        "state_args": state_args,
-    }
-    session_manager.save(session)
-
     return {
-        "session_id": session_id,
+        "session_id": session.config.session_id,
         "feed_state": session.feed_state,
     }
 
 
 @mcp.tool()
+@with_session(mutate=True)
 def create_unit(
-    session_id: str,
+    session: FlowsheetSession,
     unit_id: str,
     unit_type: str,
     config: Optional[Dict[str, Any]] = None,
@@ -439,11 +540,6 @@ def create_unit(
     Returns:
         Unit details and DOF requirements
     """
-    try:
-        session = session_manager.load(session_id)
-    except FileNotFoundError:
-        return {"error": f"Session '{session_id}' not found"}
-
     spec = get_unit_spec(unit_type)
     if "error" in spec:
         return spec
@@ -453,10 +549,8 @@ def create_unit(
     except ValueError as e:
         return {"error": str(e)}
 
-    session_manager.save(session)
-
     return {
-        "session_id": session_id,
+        "session_id": session.config.session_id,
         "unit_id": unit_id,
         "unit_type": unit_type,
         "dof_requirements": spec.get("required_fixes", []),
@@ -465,8 +559,9 @@ def create_unit(
 
 
 @mcp.tool()
+@with_session(mutate=True)
 def create_translator(
-    session_id: str,
+    session: FlowsheetSession,
     translator_id: str,
     source_package: str,
     dest_package: str,
@@ -484,21 +579,19 @@ def create_translator(
     Returns:
         Translator details or error if no translator exists
     """
-    try:
-        session = session_manager.load(session_id)
-    except FileNotFoundError:
-        return {"error": f"Session '{session_id}' not found"}
-
-    try:
-        source_pkg = PropertyPackageType[source_package.upper()]
-        dest_pkg = PropertyPackageType[dest_package.upper()]
-    except KeyError as e:
-        return {"error": f"Invalid property package: {e}"}
-
-    translator = get_translator(source_pkg, dest_pkg)
+    source_name = source_package.upper()
+    dest_name = dest_package.upper()
+    packages = PropertyPackageType.__members__
+    for name in (source_name, dest_name):
+        if name not in packages:
+            return {"error": f"Invalid property package: '{name}'"}
+
+    translator = get_translator_by_name(source_name, dest_name)
     if translator is None:
-        compat = check_compatibility(source_pkg, dest_pkg)
+        compat = check_compatibility(packages[source_name], packages[dest_name])
         return {"error": compat["message"]}
+    source_pkg = translator.source_pkg
+    dest_pkg = translator.dest_pkg
 
     # Use source_pkg/dest_pkg keys to match ModelBuilder expectations
     session.translators[translator_id] = {
@@ -508,10 +601,8 @@ def create_translator(
         "module_path": translator.module_path,
         "config": {},  # Additional config if needed
     }
-    session_manager.save(session)
-
     return {
-        "session_id": session_id,
+        "session_id": session.config.session_id,
         "translator_id": translator_id,
         "translator": translator.name,
         "source_pkg": source_pkg.value,
@@ -520,8 +611,9 @@ def create_translator(
 
 
 @mcp.tool()
+@with_session(mutate=True)
 def connect_ports(
-    session_id: str,
+    session: FlowsheetSession,
     source_unit: str,
     source_port: str,
     dest_unit: str,
@@ -541,11 +633,6 @@ def connect_ports(
     Returns:
         Connection details with compatibility warning if applicable
     """
-    try:
-        session = session_manager.load(session_id)
-    except FileNotFoundError:
-        return {"error": f"Session '{session_id}' not found"}
-
     # Check property package compatibility
     compatibility_warning = None
     if source_unit in session.units and dest_unit in session.units:
@@ -570,10 +657,11 @@ def connect_ports(
     except KeyError as e:
         return {"error": str(e)}
 
-    session_manager.save(session)
+    # The fingerprint would miss anyway; drop the old structure's build now
+    model_cache.invalidate(session.config.session_id)
 
     result = {
-        "session_id": session_id,
+        "session_id": session.config.session_id,
         "connection": {
             "source": f"{source_unit}.{source_port}",
             "dest": f"{dest_unit}.{dest_port}",
@@ -587,8 +675,45 @@ def connect_ports(
     return result
 
 
+def _render_diagram(session: FlowsheetSession) -> str:
+    """Render the ASCII flowsheet diagram for a session.
+
+    Connections are listed in depth-first order from the flowsheet sources
+    (Feed and units with no inlet connection), so each stream follows the
+    one feeding it. Every connection appears exactly once.
+    """
+    adj = session.adjacency()
+    dests = {c.dest_unit for c in session.connections}
+    # Sources first; remaining units catch anything only reachable via a recycle
+    roots = [u for u in adj if u not in dests] + list(adj)
+
+    def edges():
+        visited = set()
+        for root in roots:
+            stack = [root]
+            while stack:
+                unit = stack.pop()
+                if unit in visited:
+                    continue
+                visited.add(unit)
+                out = adj.get(unit, [])
+                yield from out
+                stack.extend(c.dest_unit for c in reversed(out))
+
+    def line(conn) -> str:
+        arrow = f" →[{conn.translator_id}]→ " if conn.translator_id else " → "
+        return f"  {conn.source_unit}.{conn.source_port}{arrow}{conn.dest_unit}.{conn.dest_port}"
+
+    header = ["Flowsheet Diagram", "=" * 40]
+    if session.feed_state:
+        header.append("Feed → ...")
+
+    return "\n".join([*header, *(line(c) for c in edges())])
+
+
 @mcp.tool()
-def get_flowsheet_diagram(session_id: str) -> Dict[str, Any]:
+@with_session
+def get_flowsheet_diagram(session: FlowsheetSession) -> Dict[str, Any]:
     """Get ASCII diagram of flowsheet structure.
 
     Args:
@@ -597,33 +722,20 @@ def get_flowsheet_diagram(session_id: str) -> Dict[str, Any]:
     Returns:
         ASCII diagram and unit/connection lists
     """
-    try:
-        session = session_manager.load(session_id)
-    except FileNotFoundError:
-        return {"error": f"Session '{session_id}' not found"}
-
-    # Build simple ASCII representation
-    lines = ["Flowsheet Diagram", "=" * 40]
-
-    if session.feed_state:
-        lines.append("Feed → ...")
-
-    for conn in session.connections:
-        arrow = " → "
-        if conn.translator_id:
-            arrow = f" →[{conn.translator_id}]→ "
-        lines.append(f"  {conn.source_unit}.{conn.source_port}{arrow}{conn.dest_unit}.{conn.dest_port}")
+    # Rendered once per session state; load_cached reuses the session object
+    diagram = session.cached_view("diagram", lambda: _render_diagram(session))
 
     return {
-        "diagram": "\n".join(lines),
+        "diagram": diagram,
         "units": list(session.units.keys()),
         "connections": len(session.connections),
     }
 
 
 @mcp.tool()
+@with_session(mutate=True)
 def update_unit(
-    session_id: str,
+    session: FlowsheetSession,
     unit_id: str,
     config: Dict[str, Any],
 ) -> Dict[str, Any]:
@@ -637,26 +749,20 @@ def update_unit(
     Returns:
         Updated unit details
     """
-    try:
-        session = session_manager.load(session_id)
-    except FileNotFoundError:
-        return {"error": f"Session '{session_id}' not found"}
-
     if unit_id not in session.units:
         return {"error": f"Unit '{unit_id}' not found"}
 
     session.units[unit_id].config.update(config)
-    session_manager.save(session)
-
     return {
-        "session_id": session_id,
+        "session_id": session.config.session_id,
         "unit_id": unit_id,
         "updated_config": config,
     }
 
 
 @mcp.tool()
-def delete_unit(session_id: str, unit_id: str) -> Dict[str, Any]:
+@with_session(mutate=True)
+def delete_unit(session: FlowsheetSession, unit_id: str) -> Dict[str, Any]:
     """Delete a unit from the flowsheet.
 
     Also removes any connections involving this unit.
@@ -668,57 +774,24 @@ def delete_unit(session_id: str, unit_id: str) -> Dict[str, Any]:
     Returns:
         Confirmation and list of removed connections
     """
+    # Remove the unit and any connections involving it
     try:
-        session = session_manager.load(session_id)
-    except FileNotFoundError:
-        return {"error": f"Session '{session_id}' not found"}
-
-    if unit_id not in session.units:
+        removed = session.remove_unit(unit_id)
+    except KeyError:
         return {"error": f"Unit '{unit_id}' not found"}
 
-    # Remove the unit
-    del session.units[unit_id]
-
-    # Remove connections involving this unit
-    removed_conns = []
-    new_conns = []
-    for conn in session.connections:
-        if conn.source_unit == unit_id or conn.dest_unit == unit_id:
-            removed_conns.append(f"{conn.source_unit}.{conn.source_port} → {conn.dest_unit}.{conn.dest_port}")
-        else:
-            new_conns.append(conn)
-    session.connections = new_conns
-
-    session_manager.save(session)
-
     return {
-        "session_id": session_id,
+        "session_id": session.config.session_id,
         "deleted": unit_id,
-        "removed_connections": removed_conns,
+        "removed_connections": [
+            f"{c.source_unit}.{c.source_port} → {c.dest_unit}.{c.dest_port}"
+            for c in removed
+        ],
     }
 
 
-@mcp.tool()
-def validate_flowsheet(session_id: str) -> Dict[str, Any]:
-    """Validate flowsheet structure before building.
-
-    Checks for:
-    - All units have connections (except feed/product)
-    - No orphan ports (required ports not connected)
-    - Property package compatibility (session package vs unit compatibility)
-    - DOF status
-
-    Args:
-        session_id: Session to validate
-
-    Returns:
-        Validation results with any issues
-    """
-    try:
-        session = session_manager.load(session_id)
-    except FileNotFoundError:
-        return {"error": f"Session '{session_id}' not found"}
-
+def _check_flowsheet(session: FlowsheetSession) -> Dict[str, Any]:
+    """Run the validate_flowsheet checks against a session."""
     issues = []
     warnings = []
 
@@ -726,14 +799,18 @@ def validate_flowsheet(session_id: str) -> Dict[str, Any]:
     if not session.feed_state:
         issues.append("No feed state defined")
 
+    # Resolve each unit's registry spec once (None for unknown unit types)
+    specs = {
+        unit_id: UNITS.get(unit_inst.unit_type)
+        for unit_id, unit_inst in session.units.items()
+    }
+
     # Check DOF
     total_dof = 0
     for unit_id, unit_inst in session.units.items():
-        spec = get_unit_spec(unit_inst.unit_type)
-        if "error" not in spec:
-            required = len(spec.get("required_fixes", []))
-            fixed = len(unit_inst.fixed_vars)
-            unit_dof = required - fixed
+        spec = specs[unit_id]
+        if spec is not None:
+            unit_dof = len(spec.required_fixes) - len(unit_inst.fixed_vars)
             total_dof += unit_dof
             if unit_dof > 0:
                 warnings.append(f"Unit '{unit_id}' has {unit_dof} unfixed DOF")
@@ -764,8 +841,8 @@ def validate_flowsheet(session_id: str) -> Dict[str, Any]:
 
     # Check for orphan ports (required ports not connected)
     for unit_id, unit_inst in session.units.items():
-        spec = get_unit_spec(unit_inst.unit_type)
-        if "error" in spec:
+        spec = specs[unit_id]
+        if spec is None:
             continue
 
         unit_connected_ports = connected_ports.get(unit_id, set())
@@ -779,14 +856,14 @@ def validate_flowsheet(session_id: str) -> Dict[str, Any]:
             continue
 
         # Check inlet ports (except for first unit in chain which may be feed)
-        for inlet_port in spec.get("inlet_names", []):
+        for inlet_port in spec.inlet_names:
             if inlet_port not in unit_connected_ports:
                 # Only warn for non-feed units
                 if len(session.units) > 1:
                     warnings.append(f"Unit '{unit_id}' inlet port '{inlet_port}' not connected")
 
         # Check outlet ports (except for last unit in chain which may be product)
-        for outlet_port in spec.get("outlet_names", []):
+        for outlet_port in spec.outlet_names:
             if outlet_port not in unit_connected_ports:
                 # Only warn for non-product units
                 if len(session.units) > 1:
@@ -795,12 +872,12 @@ def validate_flowsheet(session_id: str) -> Dict[str, Any]:
     # Check property package compatibility
     session_pkg = session.config.default_property_package
     for unit_id, unit_inst in session.units.items():
-        spec = get_unit_spec(unit_inst.unit_type)
-        if "error" in spec:
+        spec = specs[unit_id]
+        if spec is None:
             continue
 
         # Check if session's property package is compatible with unit
-        compatible_pkgs = spec.get("compatible_property_packages", [])
+        compatible_pkgs = [p.name for p in spec.compatible_property_packages]
         if compatible_pkgs:
             if session_pkg.name not in compatible_pkgs:
                 issues.append(
@@ -812,6 +889,10 @@ def validate_flowsheet(session_id: str) -> Dict[str, Any]:
     # Check connection-level property package compatibility (translator existence)
     # This catches cases where units with different property packages are connected
     # without a translator in between
+    translator_links = {
+        (t.get("inlet_unit"), t.get("outlet_unit"))
+        for t in session.translators.values()
+    }
     for conn in session.connections:
         # Skip Feed connections (Feed is always compatible)
         if conn.source_unit == "Feed":
@@ -823,29 +904,22 @@ def validate_flowsheet(session_id: str) -> Dict[str, Any]:
         if not src_unit or not dst_unit:
             continue
 
-        src_spec = get_unit_spec(src_unit.unit_type)
-        dst_spec = get_unit_spec(dst_unit.unit_type)
+        src_spec = specs[conn.source_unit]
+        dst_spec = specs[conn.dest_unit]
 
-        if "error" in src_spec or "error" in dst_spec:
+        if src_spec is None or dst_spec is None:
             continue
 
         # Get compatible packages for each unit
-        src_pkgs = set(src_spec.get("compatible_property_packages", []))
-        dst_pkgs = set(dst_spec.get("compatible_property_packages", []))
+        src_pkgs = {p.name for p in src_spec.compatible_property_packages}
+        dst_pkgs = {p.name for p in dst_spec.compatible_property_packages}
 
         # If both have restrictions and they don't overlap, translator needed
         if src_pkgs and dst_pkgs and not (src_pkgs & dst_pkgs):
             # Check if this connection has a translator
             if not conn.translator_id:
                 # Check if a translator exists in the session for this connection
-                translator_exists = False
-                for trans_id, trans_config in session.translators.items():
-                    if (trans_config.get("inlet_unit") == conn.source_unit and
-                        trans_config.get("outlet_unit") == conn.dest_unit):
-                        translator_exists = True
-                        break
-
-                if not translator_exists:
+                if (conn.source_unit, conn.dest_unit) not in translator_links:
                     issues.append(
                         f"Connection {conn.source_unit}->{conn.dest_unit} requires "
                         f"a translator: source supports {src_pkgs}, "
@@ -853,7 +927,7 @@ def validate_flowsheet(session_id: str) -> Dict[str, Any]:
                     )
 
     return {
-        "session_id": session_id,
+        "session_id": session.config.session_id,
         "valid": len(issues) == 0,
         "issues": issues,
         "warnings": warnings,
@@ -861,12 +935,34 @@ def validate_flowsheet(session_id: str) -> Dict[str, Any]:
     }
 
 
+@mcp.tool()
+@with_session
+def validate_flowsheet(session: FlowsheetSession) -> Dict[str, Any]:
+    """Validate flowsheet structure before building.
+
+    Checks for:
+    - All units have connections (except feed/product)
+    - No orphan ports (required ports not connected)
+    - Property package compatibility (session package vs unit compatibility)
+    - DOF status
+
+    Args:
+        session_id: Session to validate
+
+    Returns:
+        Validation results with any issues
+    """
+    # Only recomputed after the session changes; load_cached reuses the object
+    return session.cached_view("validation", lambda: _check_flowsheet(session))
+
+
 # ============================================================================
 # DOF MANAGEMENT TOOLS (4)
 # ============================================================================
 
 @mcp.tool()
-def get_dof_status(session_id: str) -> Dict[str, Any]:
+@with_session(mutate=True)
+def get_dof_status(session: FlowsheetSession) -> Dict[str, Any]:
     """Get degrees of freedom status for the flowsheet.
 
     Args:
@@ -875,41 +971,30 @@ def get_dof_status(session_id: str) -> Dict[str, Any]:
     Returns:
         DOF count per unit and total, plus unfixed variables
     """
-    try:
-        session = session_manager.load(session_id)
-    except FileNotFoundError:
-        return {"error": f"Session '{session_id}' not found"}
-
     # Analyze DOF per unit based on registry specs
     dof_by_unit = {}
     unfixed_vars = {}
 
     for unit_id, unit_inst in session.units.items():
-        spec = get_unit_spec(unit_inst.unit_type)
-        if "error" in spec:
+        spec = UNITS.get(unit_inst.unit_type)
+        if spec is None:
             continue
 
         # Count required fixes minus actually fixed
-        required_fixes = spec.get("required_fixes", [])
-        required = len(required_fixes)
-        fixed = len(unit_inst.fixed_vars)
-        dof = required - fixed
+        fixed_vars = unit_inst.fixed_vars
+        dof = len(spec.required_fixes) - len(fixed_vars)
 
         dof_by_unit[unit_id] = dof
 
         if dof > 0:
-            unfixed = [
-                v["name"] for v in required_fixes
-                if v["name"] not in unit_inst.fixed_vars
+            unfixed_vars[unit_id] = [
+                v.name for v in spec.required_fixes if v.name not in fixed_vars
             ]
-            unfixed_vars[unit_id] = unfixed
 
     total_dof = sum(dof_by_unit.values())
     session.update_dof_status(dof_by_unit, total_dof)
-    session_manager.save(session)
-
     return {
-        "session_id": session_id,
+        "session_id": session.config.session_id,
         "total_dof": total_dof,
         "dof_by_unit": dof_by_unit,
         "unfixed_variables": unfixed_vars,
@@ -918,8 +1003,9 @@ def get_dof_status(session_id: str) -> Dict[str, Any]:
 
 
 @mcp.tool()
+@with_session(mutate=True)
 def fix_variable(
-    session_id: str,
+    session: FlowsheetSession,
     unit_id: str,
     var_name: str,
     value: float,
@@ -935,20 +1021,13 @@ def fix_variable(
     Returns:
         Updated fixed variables for the unit
     """
-    try:
-        session = session_manager.load(session_id)
-    except FileNotFoundError:
-        return {"error": f"Session '{session_id}' not found"}
-
     try:
         session.fix_variable(unit_id, var_name, value)
     except KeyError as e:
         return {"error": str(e)}
 
-    session_manager.save(session)
-
     return {
-        "session_id": session_id,
+        "session_id": session.config.session_id,
         "unit_id": unit_id,
         "fixed": {var_name: value},
         "all_fixed_vars": session.units[unit_id].fixed_vars,
@@ -956,8 +1035,47 @@ def fix_variable(
 
 
 @mcp.tool()
+@with_session(mutate=True)
+def fix_variables_batch(
+    session: FlowsheetSession,
+    fixes: List[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Fix several variables with a single session load and save.
+
+    The batch is all-or-nothing: if any entry fails, nothing is saved.
+
+    Args:
+        session_id: Session containing the units
+        fixes: List of {"unit_id": ..., "var_name": ..., "value": ...} entries
+
+    Returns:
+        Fixed variables grouped by unit; ``count`` is the number of distinct
+        variables fixed (repeated entries for a variable count once)
+    """
+    fixed: Dict[str, Dict[str, float]] = {}
+    for i, fix in enumerate(fixes):
+        if not isinstance(fix, dict):
+            return {"error": f"fixes[{i}]: expected a dict, got {type(fix).__name__}"}
+        try:
+            unit_id, var_name, value = fix["unit_id"], fix["var_name"], fix["value"]
+            if value is None:
+                return {"error": f"fixes[{i}]: value must not be None"}
+            session.fix_variable(unit_id, var_name, value)
+        except (KeyError, TypeError) as e:
+            return {"error": f"fixes[{i}]: {e}"}
+        fixed.setdefault(unit_id, {})[var_name] = value
+
+    return {
+        "session_id": session.config.session_id,
+        "fixed": fixed,
+        "count": sum(len(unit_vars) for unit_vars in fixed.values()),
+    }
+
+
+@mcp.tool()
+@with_session(mutate=True)
 def unfix_variable(
-    session_id: str,
+    session: FlowsheetSession,
     unit_id: str,
     var_name: str,
 ) -> Dict[str, Any]:
@@ -971,20 +1089,13 @@ def unfix_variable(
     Returns:
         Updated fixed variables for the unit
     """
-    try:
-        session = session_manager.load(session_id)
-    except FileNotFoundError:
-        return {"error": f"Session '{session_id}' not found"}
-
     try:
         session.unfix_variable(unit_id, var_name)
     except KeyError as e:
         return {"error": str(e)}
 
-    session_manager.save(session)
-
     return {
-        "session_id": session_id,
+        "session_id": session.config.session_id,
         "unit_id": unit_id,
         "unfixed": var_name,
         "remaining_fixed_vars": session.units[unit_id].fixed_vars,
@@ -992,7 +1103,8 @@ def unfix_variable(
 
 
 @mcp.tool()
-def list_unfixed_vars(session_id: str, unit_id: str) -> Dict[str, Any]:
+@with_session
+def list_unfixed_vars(session: FlowsheetSession, unit_id: str) -> Dict[str, Any]:
     """List unfixed variables that need values for a unit.
 
     Args:
@@ -1002,33 +1114,28 @@ def list_unfixed_vars(session_id: str, unit_id: str) -> Dict[str, Any]:
     Returns:
         List of unfixed variables with typical values
     """
-    try:
-        session = session_manager.load(session_id)
-    except FileNotFoundError:
-        return {"error": f"Session '{session_id}' not found"}
-
     if unit_id not in session.units:
         return {"error": f"Unit '{unit_id}' not found"}
 
     unit_inst = session.units[unit_id]
-    spec = get_unit_spec(unit_inst.unit_type)
-    if "error" in spec:
+    spec = UNITS.get(unit_inst.unit_type)
+    if spec is None:
         return {"error": f"Unknown unit type: {unit_inst.unit_type}"}
 
     unfixed = []
-    for v in spec.get("required_fixes", []):
-        if v["name"] not in unit_inst.fixed_vars:
+    for v in spec.required_fixes:
+        if v.name not in unit_inst.fixed_vars:
             unfixed.append({
-                "name": v["name"],
-                "description": v.get("description"),
-                "units": v.get("units"),
-                "typical_default": v.get("typical_default"),
-                "typical_min": v.get("typical_min"),
-                "typical_max": v.get("typical_max"),
+                "name": v.name,
+                "description": v.description,
+                "units": v.units,
+                "typical_default": v.typical_default,
+                "typical_min": v.typical_min,
+                "typical_max": v.typical_max,
             })
 
     return {
-        "session_id": session_id,
+        "session_id": session.config.session_id,
         "unit_id": unit_id,
         "unit_type": unit_inst.unit_type,
         "unfixed_variables": unfixed,
@@ -1041,7 +1148,8 @@ def list_unfixed_vars(session_id: str, unit_id: str) -> Dict[str, Any]:
 # ============================================================================
 
 @mcp.tool()
-def get_scaling_status(session_id: str) -> Dict[str, Any]:
+@with_session
+def get_scaling_status(session: FlowsheetSession) -> Dict[str, Any]:
     """Get current scaling factor status.
 
     Args:
@@ -1050,38 +1158,33 @@ def get_scaling_status(session_id: str) -> Dict[str, Any]:
     Returns:
         Current scaling factors by unit and recommendations
     """
-    try:
-        session = session_manager.load(session_id)
-    except FileNotFoundError:
-        return {"error": f"Session '{session_id}' not found"}
-
     scaling_by_unit = {}
     recommendations = {}
 
     for unit_id, unit_inst in session.units.items():
         scaling_by_unit[unit_id] = unit_inst.scaling_factors
 
-        spec = get_unit_spec(unit_inst.unit_type)
-        if "error" not in spec:
+        spec = UNITS.get(unit_inst.unit_type)
+        if spec is not None:
             # Recommend defaults not yet applied
-            default_scaling = spec.get("default_scaling", {})
             recs = {
-                k: v for k, v in default_scaling.items()
+                k: v for k, v in spec.default_scaling.items()
                 if k not in unit_inst.scaling_factors
             }
             if recs:
                 recommendations[unit_id] = recs
 
     return {
-        "session_id": session_id,
+        "session_id": session.config.session_id,
         "scaling_factors": scaling_by_unit,
         "recommendations": recommendations,
     }
 
 
 @mcp.tool()
+@with_session(mutate=True)
 def set_scaling_factor(
-    session_id: str,
+    session: FlowsheetSession,
     unit_id: str,
     var_name: str,
     factor: float,
@@ -1097,26 +1200,57 @@ def set_scaling_factor(
     Returns:
         Updated scaling factors for the unit
     """
-    try:
-        session = session_manager.load(session_id)
-    except FileNotFoundError:
-        return {"error": f"Session '{session_id}' not found"}
-
     try:
         session.set_scaling_factor(unit_id, var_name, factor)
     except KeyError as e:
         return {"error": str(e)}
 
-    session_manager.save(session)
-
     return {
-        "session_id": session_id,
+        "session_id": session.config.session_id,
         "unit_id": unit_id,
         "set": {var_name: factor},
         "all_scaling_factors": session.units[unit_id].scaling_factors,
     }
 
 
+@mcp.tool()
+@with_session(mutate=True)
+def set_scaling_factors_batch(
+    session: FlowsheetSession,
+    factors: List[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Set several scaling factors with a single session load and save.
+
+    The batch is all-or-nothing: if any entry fails, nothing is saved.
+
+    Args:
+        session_id: Session containing the units
+        factors: List of {"unit_id": ..., "var_name": ..., "factor": ...} entries
+
+    Returns:
+        Scaling factors set, grouped by unit; ``count`` is the number of
+        distinct variables scaled (repeated entries for a variable count once)
+    """
+    applied: Dict[str, Dict[str, float]] = {}
+    for i, entry in enumerate(factors):
+        if not isinstance(entry, dict):
+            return {"error": f"factors[{i}]: expected a dict, got {type(entry).__name__}"}
+        try:
+            unit_id, var_name, factor = entry["unit_id"], entry["var_name"], entry["factor"]
+            if factor is None:
+                return {"error": f"factors[{i}]: factor must not be None"}
+            session.set_scaling_factor(unit_id, var_name, factor)
+        except (KeyError, TypeError) as e:
+            return {"error": f"factors[{i}]: {e}"}
+        applied.setdefault(unit_id, {})[var_name] = factor
+
+    return {
+        "session_id": session.config.session_id,
+        "set": applied,
+        "count": sum(len(unit_vars) for unit_vars in applied.values()),
+    }
+
+
 @mcp.tool()
 def apply_scaling(
     session_id: str,
@@ -1158,7 +1292,6 @@ def calculate_scaling_factors(session_id: str) -> Dict[str, Any]:
 
     # Build the Pyomo model
     try:
-        from utils.model_builder import ModelBuilder, ModelBuildError
         builder = ModelBuilder(session)
         m = builder.build()
     except ImportError as e:
@@ -1198,11 +1331,36 @@ def calculate_scaling_factors(session_id: str) -> Dict[str, Any]:
     }
 
 
+def _collect_scaling_issues(model: Any) -> Dict[str, List[str]]:
+    """Collect scaling issues from IDAES issue generators.
+
+    Args:
+        model: Built Pyomo model
+
+    Returns:
+        Dict of issue category -> list of component descriptions
+    """
+    import idaes.core.util.scaling as iscale
+
+    return {
+        "unscaled_vars": [v.name for v in iscale.unscaled_variables_generator(model)],
+        "badly_scaled_vars": [
+            f"{v.name}: {val}" for v, val in iscale.badly_scaled_var_generator(model)
+        ],
+        "unscaled_cons": [c.name for c in iscale.unscaled_constraints_generator(model)],
+        # Constraint scaling quality is judged from Jacobian row norms
+        "badly_scaled_cons": [
+            f"{c.name}: {norm}" for norm, c in iscale.extreme_jacobian_rows(model)
+        ],
+    }
+
+
 @mcp.tool()
 def report_scaling_issues(session_id: str) -> Dict[str, Any]:
     """Report unscaled or badly-scaled variables/constraints.
 
-    This calls iscale.report_scaling_issues() to identify problems.
+    Uses the IDAES scaling issue generators (unscaled/badly scaled
+    variables, unscaled constraints) and Jacobian row norms.
 
     Args:
         session_id: Session to analyze
@@ -1217,7 +1375,6 @@ def report_scaling_issues(session_id: str) -> Dict[str, Any]:
 
     # Build the Pyomo model
     try:
-        from utils.model_builder import ModelBuilder, ModelBuildError
         builder = ModelBuilder(session)
         m = builder.build()
     except ImportError as e:
@@ -1232,48 +1389,8 @@ def report_scaling_issues(session_id: str) -> Dict[str, Any]:
         }
 
     # Get scaling issues
-    unscaled_vars = []
-    badly_scaled_vars = []
-    unscaled_cons = []
-    badly_scaled_cons = []
-
     try:
-        import idaes.core.util.scaling as iscale
-        from io import StringIO
-        import sys
-
-        # Capture report_scaling_issues output
-        old_stdout = sys.stdout
-        sys.stdout = StringIO()
-        try:
-            iscale.report_scaling_issues(m)
-            output = sys.stdout.getvalue()
-        finally:
-            sys.stdout = old_stdout
-
-        # Parse output for issues (basic parsing)
-        lines = output.strip().split('\n')
-        current_section = None
-        for line in lines:
-            line = line.strip()
-            if 'Unscaled Variable' in line:
-                current_section = 'unscaled_vars'
-            elif 'Badly Scaled Variable' in line:
-                current_section = 'badly_scaled_vars'
-            elif 'Unscaled Constraint' in line:
-                current_section = 'unscaled_cons'
-            elif 'Badly Scaled Constraint' in line:
-                current_section = 'badly_scaled_cons'
-            elif line and current_section and not line.startswith('='):
-                if current_section == 'unscaled_vars':
-                    unscaled_vars.append(line)
-                elif current_section == 'badly_scaled_vars':
-                    badly_scaled_vars.append(line)
-                elif current_section == 'unscaled_cons':
-                    unscaled_cons.append(line)
-                elif current_section == 'badly_scaled_cons':
-                    badly_scaled_cons.append(line)
-
+        issues = _collect_scaling_issues(m)
     except ImportError:
         return {
             "session_id": session_id,
@@ -1285,6 +1402,11 @@ def report_scaling_issues(session_id: str) -> Dict[str, Any]:
             "error": f"Scaling analysis failed: {e}",
         }
 
+    unscaled_vars = issues["unscaled_vars"]
+    badly_scaled_vars = issues["badly_scaled_vars"]
+    unscaled_cons = issues["unscaled_cons"]
+    badly_scaled_cons = issues["badly_scaled_cons"]
+
     return {
         "session_id": session_id,
         "unscaled_variables": unscaled_vars[:20],  # Limit to 20
@@ -1318,24 +1440,20 @@ def autoscale_large_jac(session_id: str) -> Dict[str, Any]:
         return {"error": f"Session '{session_id}' not found"}
 
     try:
-        from utils.model_builder import ModelBuilder
         import idaes.core.util.scaling as iscale
 
         builder = ModelBuilder(session)
         model = builder.build()
 
-        # Get count of scaling issues before
-        import io
-        import sys
+        def count_issues() -> Optional[int]:
+            # Best-effort: the Jacobian checks need ASL and may fail
+            try:
+                return sum(len(v) for v in _collect_scaling_issues(model).values())
+            except Exception:
+                return None
 
-        old_stdout = sys.stdout
-        sys.stdout = buffer_before = io.StringIO()
-        try:
-            iscale.report_scaling_issues(model)
-        except Exception:
-            pass
-        sys.stdout = old_stdout
-        issues_before = buffer_before.getvalue().count("\n")
+        # Get count of scaling issues before
+        issues_before = count_issues()
 
         # Apply Jacobian-based autoscaling
         try:
@@ -1346,13 +1464,7 @@ def autoscale_large_jac(session_id: str) -> Dict[str, Any]:
             autoscale_error = str(e)
 
         # Get count of scaling issues after
-        sys.stdout = buffer_after = io.StringIO()
-        try:
-            iscale.report_scaling_issues(model)
-        except Exception:
-            pass
-        sys.stdout = old_stdout
-        issues_after = buffer_after.getvalue().count("\n")
+        issues_after = count_issues()
 
         if not autoscale_applied:
             return {
@@ -1366,7 +1478,10 @@ def autoscale_large_jac(session_id: str) -> Dict[str, Any]:
             "status": "success",
             "issues_before": issues_before,
             "issues_after": issues_after,
-            "issues_resolved": max(0, issues_before - issues_after),
+            "issues_resolved": (
+                max(0, issues_before - issues_after)
+                if issues_before is not None and issues_after is not None else None
+            ),
             "message": f"Jacobian-based autoscaling applied. Issues: {issues_before} → {issues_after}",
         }
 
@@ -1412,10 +1527,7 @@ def initialize_unit(
 
     # Build the Pyomo model
     try:
-        from utils.model_builder import ModelBuilder, ModelBuildError
-        builder = ModelBuilder(session)
-        m = builder.build()
-        units = builder.get_units()
+        m, units = _get_or_build_model(session)
     except ImportError as e:
         return {
             "session_id": session_id,
@@ -1459,6 +1571,8 @@ def initialize_unit(
 
         dof = degrees_of_freedom(unit_block)
     except Exception as e:
+        # Don't hand a half-initialized model to the next tool call
+        model_cache.invalidate(session_id)
         return {
             "session_id": session_id,
             "unit_id": unit_id,
@@ -1488,18 +1602,13 @@ def get_initialization_order(
 
     Args:
         session_id: Session to analyze
-        tear_streams: Optional list of arc names to treat as tear streams
+        tear_streams: Optional list of tear streams, as arc names ("arc_Source_Dest")
+            or unit pairs ("src_unit:dest_unit")
         use_sequential_decomposition: If True (default), build model and use IDAES
 
     Returns:
         Ordered list of unit IDs for initialization
     """
-    from utils.topo_sort import (
-        compute_initialization_order,
-        get_sequential_decomposition_order,
-        SequentialDecompositionError,
-    )
-
     try:
         session = session_manager.load(session_id)
     except FileNotFoundError:
@@ -1514,23 +1623,12 @@ def get_initialization_order(
         }
 
     # Convert arc names to unit pairs for tear streams
-    tear_pairs = None
-    if tear_streams:
-        tear_pairs = []
-        for arc_name in tear_streams:
-            # Parse "arc_Source_Dest" format
-            if arc_name.startswith("arc_"):
-                parts = arc_name[4:].rsplit("_", 1)
-                if len(parts) == 2:
-                    tear_pairs.append((parts[0], parts[1]))
+    tear_pairs = parse_tear_streams(tear_streams) if tear_streams else None
 
     # Try to build model and use SequentialDecomposition
     if use_sequential_decomposition:
         try:
-            from utils.model_builder import ModelBuilder, ModelBuildError
-
-            builder = ModelBuilder(session)
-            model = builder.build()
+            model, _ = _get_or_build_model(session)
 
             # Use IDAES SequentialDecomposition
             order = get_sequential_decomposition_order(model, tear_pairs)
@@ -1565,15 +1663,7 @@ def get_initialization_order(
 
     # Session-only planning (no model built)
     # Use simple topological sort for order estimation only
-    connections = [
-        {
-            "src_unit": c.source_unit,
-            "src_port": c.source_port,
-            "dest_unit": c.dest_unit,
-            "dest_port": c.dest_port,
-        }
-        for c in session.connections
-    ]
+    connections = session.connection_dicts()
 
     try:
         order = compute_initialization_order(
@@ -1621,11 +1711,7 @@ def check_dof(session_id: str) -> Dict[str, Any]:
 
     # Build the Pyomo model
     try:
-        from utils.model_builder import ModelBuilder, ModelBuildError
-
-        builder = ModelBuilder(session)
-        m = builder.build()
-        units = builder.get_units()
+        m, units = _get_or_build_model(session)
     except ImportError as e:
         return {
             "session_id": session_id,
@@ -1641,19 +1727,24 @@ def check_dof(session_id: str) -> Dict[str, Any]:
 
     # Get DOF for each unit and overall
     try:
-        from idaes.core.util.model_statistics import degrees_of_freedom
+        fs = getattr(m, 'fs', m)
+        try:
+            # One pass over the flowsheet's constraints for all units
+            unit_dof, total_dof = batch_degrees_of_freedom(fs, units)
+        except Exception:
+            # Fall back to IDAES per block, capturing per-unit errors
+            from idaes.core.util.model_statistics import degrees_of_freedom
 
-        unit_dof = {}
-        for unit_id, unit_block in units.items():
-            try:
-                dof = degrees_of_freedom(unit_block)
-                unit_dof[unit_id] = dof
-            except Exception as e:
-                unit_dof[unit_id] = f"error: {str(e)[:50]}"
+            unit_dof = {}
+            for unit_id, unit_block in units.items():
+                try:
+                    dof = degrees_of_freedom(unit_block)
+                    unit_dof[unit_id] = dof
+                except Exception as e:
+                    unit_dof[unit_id] = f"error: {str(e)[:50]}"
 
-        # Overall flowsheet DOF
-        fs = getattr(m, 'fs', m)
-        total_dof = degrees_of_freedom(fs)
+            # Overall flowsheet DOF
+            total_dof = degrees_of_freedom(fs)
 
         # Determine status
         if total_dof == 0:
@@ -1697,7 +1788,8 @@ def initialize_flowsheet(
 
     Args:
         session_id: Session to initialize
-        tear_streams: Optional list of tear stream names for recycles (format: ["src_unit:dest_unit"])
+        tear_streams: Optional list of tear stream names for recycles (format: ["src_unit:dest_unit"]
+            or arc names "arc_Source_Dest")
 
     Returns:
         Initialization status per unit
@@ -1709,10 +1801,7 @@ def initialize_flowsheet(
 
     # Build the Pyomo model
     try:
-        from utils.model_builder import ModelBuilder, ModelBuildError
-        builder = ModelBuilder(session)
-        m = builder.build()
-        units = builder.get_units()
+        m, units = _get_or_build_model(session)
     except ImportError as e:
         return {
             "session_id": session_id,
@@ -1727,33 +1816,14 @@ def initialize_flowsheet(
         }
 
     # Parse tear streams if provided
-    tear_stream_tuples = None
-    if tear_streams:
-        tear_stream_tuples = []
-        for ts in tear_streams:
-            if ":" in ts:
-                src, dst = ts.split(":", 1)
-                tear_stream_tuples.append((src.strip(), dst.strip()))
+    tear_stream_tuples = parse_tear_streams(tear_streams) if tear_streams else None
 
     # Get initialization order using IDAES SequentialDecomposition (WaterTAP standard)
     init_order = []
     init_method = "IDAES_SequentialDecomposition"
     try:
-        from utils.topo_sort import (
-            compute_initialization_order,
-            SequentialDecompositionError,
-        )
-
         # Build connection list for topo_sort
-        connections = [
-            {
-                "src_unit": conn.source_unit,
-                "src_port": conn.source_port,
-                "dest_unit": conn.dest_unit,
-                "dest_port": conn.dest_port,
-            }
-            for conn in session.connections
-        ]
+        connections = session.connection_dicts()
 
         # Use SequentialDecomposition with built model
         init_order = compute_initialization_order(
@@ -1808,7 +1878,12 @@ def initialize_flowsheet(
                 status_per_unit[unit_id] = f"failed: {str(e)[:50]}"
                 overall_status = "partial"
 
+        if overall_status != "success":
+            # Don't hand a half-initialized model to the next tool call
+            model_cache.invalidate(session_id)
+
     except Exception as e:
+        model_cache.invalidate(session_id)
         return {
             "session_id": session_id,
             "status": "error",
@@ -1856,12 +1931,17 @@ def propagate_state(
             "error": "Port format must be 'unit_id.port_name'",
         }
 
-    # Build the Pyomo model
+    # Reject unknown blocks before paying for a model build; translators
+    # are built as units too
+    if src_unit_id not in session.units and src_unit_id not in session.translators:
+        return {"error": f"Source unit '{src_unit_id}' not found"}
+    if dst_unit_id not in session.units and dst_unit_id not in session.translators:
+        return {"error": f"Destination unit '{dst_unit_id}' not found"}
+
+    # Get the Pyomo model; propagated values persist in the cached build
+    # and are seen by later initialize_unit/initialize_flowsheet calls
     try:
-        from utils.model_builder import ModelBuilder, ModelBuildError
-        builder = ModelBuilder(session)
-        m = builder.build()
-        units = builder.get_units()
+        m, units = _get_or_build_model(session)
     except ImportError as e:
         return {
             "session_id": session_id,
@@ -1986,6 +2066,10 @@ def solve(
     Solved KPIs (stream values, unit metrics) are extracted and stored
     for retrieval via get_stream_results and get_unit_results.
 
+    If nothing that affects the model has changed since the last optimal
+    solve, step 3 is skipped and the previous solution is used as a warm
+    start.
+
     Args:
         session_id: Session to solve
         solver: Solver name (default: ipopt)
@@ -1999,17 +2083,35 @@ def solve(
     except FileNotFoundError:
         return {"error": f"Session '{session_id}' not found"}
 
+    # Reuse the last solution when the model is unchanged since it was solved
+    last_fingerprint = (session.results or {}).get("preprocess_fingerprint")
+    skip_preprocessing = (
+        session.status == SessionStatus.SOLVED
+        and last_fingerprint == session_fingerprint(session)
+    )
+
+    # The solve runs in the worker; later fallbacks get a fresh build rather
+    # than one left in place by initialize_* calls
+    model_cache.invalidate(session_id)
+
     # Always use background job to avoid blocking MCP connection
     job = job_manager.submit(
         session_id=session_id,
         job_type="solve",
-        params={"solver": solver, "solver_options": solver_options or {}},
+        params={
+            "solver": solver,
+            "solver_options": solver_options or {},
+            "skip_preprocessing": skip_preprocessing,
+        },
     )
+    message = "Solve job submitted. Poll with get_solve_status."
+    if skip_preprocessing:
+        message += " Session unchanged since last solve: initialization will be skipped (warm start)."
     return {
         "session_id": session_id,
         "job_id": job.job_id,
         "status": job.status.value,
-        "message": "Solve job submitted. Poll with get_solve_status.",
+        "message": message,
     }
 
 
@@ -2041,8 +2143,87 @@ def get_solve_status(job_id: str) -> Dict[str, Any]:
 # DIAGNOSTICS TOOLS (4)
 # ============================================================================
 
+def _collect_toolbox_issues(
+    dt: Any,
+    structural: bool = True,
+    numerical: bool = True,
+    timeout: Optional[float] = None,
+) -> Tuple[List[str], List[str], Optional[List[str]], List[str]]:
+    """Collect DiagnosticsToolbox warnings and cautions as lists of strings.
+
+    Uses the toolbox's collector methods, which return the same messages
+    the report_* methods print. Older IDAES releases without them fall back
+    to capturing and parsing the printed reports.
+
+    The numerical checks (Jacobian, SVD) can take seconds on large models;
+    with a timeout they run on the shared numerical-checks worker and are
+    abandoned if they do not finish in time. While an abandoned check is
+    still running, new numerical checks are refused rather than started
+    alongside it.
+
+    Args:
+        dt: DiagnosticsToolbox for the model
+        structural: Whether to run the structural checks
+        numerical: Whether to run the (Jacobian-based) numerical checks
+        timeout: Seconds to wait for the numerical checks (None waits)
+
+    Returns:
+        (structural_issues, structural_next_steps, numerical_issues,
+        numerical_next_steps) tuple; numerical_issues is None if the
+        numerical checks timed out
+    """
+    global _numerical_future
+
+    if hasattr(dt, "_collect_structural_warnings"):
+        def structural_checks() -> Tuple[List[str], List[str]]:
+            warnings, next_steps = dt._collect_structural_warnings()
+            cautions = dt._collect_structural_cautions()
+            return [str(w) for w in (*warnings, *cautions)], [str(n) for n in next_steps]
+
+        def numerical_checks() -> Tuple[List[str], List[str]]:
+            warnings, next_steps = dt._collect_numerical_warnings()
+            cautions = dt._collect_numerical_cautions()
+            return [str(w) for w in (*warnings, *cautions)], [str(n) for n in next_steps]
+    else:
+        from contextlib import redirect_stdout
+        from io import StringIO
+
+        def report_lines(report: Callable[[], Any]) -> List[str]:
+            buffer = StringIO()
+            with redirect_stdout(buffer):
+                report()
+            return [l.strip() for l in buffer.getvalue().split('\n')
+                    if l.strip() and not l.startswith('=') and not l.startswith('-')]
+
+        def structural_checks() -> Tuple[List[str], List[str]]:
+            return report_lines(dt.report_structural_issues), []
+
+        def numerical_checks() -> Tuple[List[str], List[str]]:
+            return report_lines(dt.report_numerical_issues), []
+
+    structural_issues, structural_next = structural_checks() if structural else ([], [])
+    if not numerical:
+        return structural_issues, structural_next, [], []
+
+    if _numerical_future is not None and not _numerical_future.done():
+        return structural_issues, structural_next, [
+            "Skipped: an earlier numerical check that timed out is still running; "
+            "try again shortly"
+        ], []
+
+    if timeout is None:
+        numerical_issues, numerical_next = numerical_checks()
+    else:
+        _numerical_future = future = _numerical_executor.submit(numerical_checks)
+        try:
+            numerical_issues, numerical_next = future.result(timeout=timeout)
+        except FuturesTimeoutError:
+            return structural_issues, structural_next, None, []
+    return structural_issues, structural_next, numerical_issues, numerical_next
+
+
 @mcp.tool()
-def run_diagnostics(session_id: str) -> Dict[str, Any]:
+def run_diagnostics(session_id: str, numerical_timeout: float = 10.0) -> Dict[str, Any]:
     """Run comprehensive diagnostics on the flowsheet.
 
     Uses IDAES DiagnosticsToolbox to identify structural and
@@ -2050,12 +2231,14 @@ def run_diagnostics(session_id: str) -> Dict[str, Any]:
 
     Args:
         session_id: Session to diagnose
+        numerical_timeout: Seconds to wait for the numerical (Jacobian)
+            checks before returning without them
 
     Returns:
         Diagnostic results including structural and numerical issues
     """
     try:
-        session = session_manager.load(session_id)
+        session = session_manager.load_cached(session_id)
     except FileNotFoundError:
         return {"error": f"Session '{session_id}' not found"}
 
@@ -2067,22 +2250,22 @@ def run_diagnostics(session_id: str) -> Dict[str, Any]:
     }
 
     # Session-level checks
+    total_fixed = 0
     unit_dof = {}
     for unit_id, unit_inst in session.units.items():
         fixed_count = len(unit_inst.fixed_vars)
+        total_fixed += fixed_count
         unit_dof[unit_id] = {"fixed_vars": fixed_count}
 
-    diagnostics["session_checks"]["total_fixed_vars"] = sum(
-        len(u.fixed_vars) for u in session.units.values()
-    )
-    diagnostics["session_checks"]["units"] = unit_dof
-    diagnostics["session_checks"]["connections"] = len(session.connections)
+    diagnostics["session_checks"] = {
+        "total_fixed_vars": total_fixed,
+        "units": unit_dof,
+        "connections": len(session.connections),
+    }
 
-    # Build the Pyomo model for runtime diagnostics
+    # Build (or reuse) the Pyomo model for runtime diagnostics
     try:
-        from utils.model_builder import ModelBuilder, ModelBuildError
-        builder = ModelBuilder(session)
-        m = builder.build()
+        m, _ = _get_or_build_model(session)
     except ImportError as e:
         diagnostics["note"] = f"WaterTAP/IDAES not available: {e}"
         return diagnostics
@@ -2094,42 +2277,43 @@ def run_diagnostics(session_id: str) -> Dict[str, Any]:
     try:
         from idaes.core.util.model_diagnostics import DiagnosticsToolbox
         from idaes.core.util.model_statistics import degrees_of_freedom
-        from io import StringIO
-        import sys
 
+        # Structural results only change with the flowsheet structure
+        structure_key = structural_fingerprint(session)
+        cached = _structural_cache.get(structure_key)
+        if cached is not None:
+            _structural_cache.move_to_end(structure_key)
+            structural, structural_next, dof = cached
+        else:
+            dof = degrees_of_freedom(m)
+        diagnostics["degrees_of_freedom"] = dof
+
+        # Numerical checks (Jacobian, SVD) are meaningless until DOF is 0
         dt = DiagnosticsToolbox(m)
+        found, found_next, numerical, numerical_next = _collect_toolbox_issues(
+            dt, structural=cached is None, numerical=dof == 0, timeout=numerical_timeout
+        )
+        if cached is None:
+            structural, structural_next = found, found_next
+            _structural_cache[structure_key] = (structural, structural_next, dof)
+            while len(_structural_cache) > STRUCTURAL_CACHE_SIZE:
+                _structural_cache.popitem(last=False)
+        next_steps = structural_next + numerical_next
+        if numerical is None:
+            # The abandoned check still holds the model; don't share it
+            model_cache.invalidate(session_id)
+            numerical = [
+                f"Timed out after {numerical_timeout}s; re-run with a larger numerical_timeout"
+            ]
 
-        # Capture structural issues
-        old_stdout = sys.stdout
-        sys.stdout = StringIO()
-        try:
-            dt.report_structural_issues()
-            structural_output = sys.stdout.getvalue()
-        finally:
-            sys.stdout = old_stdout
+        diagnostics["structural_issues"] = structural[:20]
+        diagnostics["numerical_issues"] = numerical[:20]
+        if next_steps:
+            diagnostics["next_steps"] = next_steps
 
-        # Capture numerical issues
-        sys.stdout = StringIO()
-        try:
-            dt.report_numerical_issues()
-            numerical_output = sys.stdout.getvalue()
-        finally:
-            sys.stdout = old_stdout
-
-        # Parse outputs for issues
-        structural_lines = [l.strip() for l in structural_output.split('\n')
-                          if l.strip() and not l.startswith('=') and not l.startswith('-')]
-        numerical_lines = [l.strip() for l in numerical_output.split('\n')
-                         if l.strip() and not l.startswith('=') and not l.startswith('-')]
-
-        diagnostics["structural_issues"] = structural_lines[:20]
-        diagnostics["numerical_issues"] = numerical_lines[:20]
-
-        # Add DOF info
-        dof = degrees_of_freedom(m)
-        diagnostics["degrees_of_freedom"] = dof
         if dof != 0:
             diagnostics["structural_issues"].insert(0, f"Degrees of freedom: {dof} (should be 0)")
+            diagnostics["numerical_issues"] = ["Skipped: degrees of freedom must be 0 first"]
 
     except ImportError:
         diagnostics["note"] = "IDAES DiagnosticsToolbox not available"
@@ -2139,6 +2323,219 @@ def run_diagnostics(session_id: str) -> Dict[str, Any]:
     return diagnostics
 
 
+def _pyomo_nlp(m: Any) -> Any:
+    """Build a PyNumero NLP over the model at its current point.
+
+    PyomoNLP needs exactly one active objective; a constant placeholder is
+    added for the duration of the build when the flowsheet has none (the
+    same approach IDAES diagnostics use).
+
+    Args:
+        m: Built Pyomo model
+
+    Returns:
+        PyomoNLP instance, or None if PyNumero or its ASL library is unavailable
+    """
+    try:
+        from pyomo.contrib.pynumero.interfaces.pyomo_nlp import PyomoNLP
+        from pyomo.common.modeling import unique_component_name
+        from pyomo.environ import Objective
+    except ImportError:
+        return None
+
+    placeholder = None
+    if next(m.component_data_objects(Objective, active=True), None) is None:
+        placeholder = unique_component_name(m, "_diagnostics_objective")
+        m.add_component(placeholder, Objective(expr=0))
+    try:
+        return PyomoNLP(m)
+    except Exception:
+        return None
+    finally:
+        if placeholder is not None:
+            m.del_component(placeholder)
+
+
+def _model_nlp(session: FlowsheetSession, m: Any) -> Any:
+    """PyomoNLP for the session's model, reused while the model is cached.
+
+    NLP construction (writing the model to the ASL) is done once per cached
+    model; on reuse the primals are re-synced from the Pyomo variables, since
+    tools such as initialize_unit change values on the cached model in place.
+
+    Args:
+        session: Session the model was built from
+        m: Model returned by _get_or_build_model(session)
+
+    Returns:
+        PyomoNLP instance, or None if PyNumero is unavailable
+    """
+    nlp = model_cache.derived(session, m, "nlp", lambda: _pyomo_nlp(m))
+    if nlp is not None and nlp.n_primals() > 0:
+        import numpy as np
+
+        # Unset values enter the NLP as 0, as on construction
+        nlp.set_primals(np.fromiter(
+            (0.0 if v.value is None else v.value for v in nlp.get_pyomo_variables()),
+            dtype=float,
+            count=nlp.n_primals(),
+        ))
+    return nlp
+
+
+def _non_primal_vars(m: Any, nlp: Any) -> List[Any]:
+    """Active variables of the model that are not primals of the NLP.
+
+    PyomoNLP only holds unfixed variables that appear in an active
+    constraint or objective, so fixed variables and unreferenced unfixed
+    ones need checking on their own.
+
+    Args:
+        m: Built Pyomo model
+        nlp: PyomoNLP over ``m``
+
+    Returns:
+        List of variable data objects
+    """
+    from pyomo.common.collections import ComponentSet
+    from pyomo.environ import Var
+
+    primals = ComponentSet(nlp.get_pyomo_variables())
+    return [v for v in m.component_data_objects(Var, active=True) if v not in primals]
+
+
+def _model_non_primal_vars(session: FlowsheetSession, m: Any, nlp: Any) -> List[Any]:
+    """_non_primal_vars for the session's model, kept alongside its NLP.
+
+    Args:
+        session: Session the model was built from
+        m: Model returned by _get_or_build_model(session)
+        nlp: PyomoNLP from _model_nlp(session, m)
+
+    Returns:
+        List of variable data objects
+    """
+    return model_cache.derived(session, m, "non_primal_vars", lambda: _non_primal_vars(m, nlp))
+
+
+def _unset_primals(nlp: Any) -> Any:
+    """Boolean mask of NLP primals whose Pyomo variable has no value.
+
+    _model_nlp loads those as 0, so anything computed from them is not a
+    real residual or violation.
+    """
+    import numpy as np
+
+    return np.fromiter(
+        (v.value is None for v in nlp.get_pyomo_variables()),
+        dtype=bool,
+        count=nlp.n_primals(),
+    )
+
+
+class _TopK:
+    """Bounded min-heap keeping the k items with the largest keys.
+
+    Memory stays O(k) however many items are pushed; ties keep the item
+    pushed first, matching a stable descending sort.
+    """
+
+    def __init__(self, k: int):
+        self.k = k
+        self._heap: List[Tuple[float, int, Any]] = []
+        self._count = 0
+
+    def push(self, key: float, item: Any) -> None:
+        """Offer an item; it is kept only if among the k largest so far."""
+        self._count += 1
+        entry = (key, -self._count, item)
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+        elif self.k > 0 and key > self._heap[0][0]:
+            heapq.heapreplace(self._heap, entry)
+
+    def items(self) -> List[Any]:
+        """Kept items, largest key first."""
+        return [item for _, _, item in sorted(self._heap, reverse=True)]
+
+
+def _constraint_residuals(
+    m: Any, nlp: Any, threshold: float, max_results: int
+) -> List[Dict[str, Any]]:
+    """Find the active constraints with the largest residuals.
+
+    Residuals for all constraints are evaluated in one PyomoNLP call and
+    the top ``max_results`` are selected with numpy; only those are turned
+    into result dicts. Falls back to evaluating each constraint body when
+    PyNumero is unavailable.
+
+    Args:
+        m: Built Pyomo model
+        nlp: PyomoNLP from _model_nlp, or None for the fallback
+        threshold: Only report residuals above this value
+        max_results: Maximum number of results to return
+
+    Returns:
+        List of residual dicts, largest residual first
+    """
+    from pyomo.environ import Constraint, value
+
+    if nlp is not None and nlp.n_constraints() > 0:
+        import numpy as np
+
+        g = nlp.evaluate_constraints()
+        resid = np.maximum(np.maximum(nlp.constraints_lb() - g, g - nlp.constraints_ub()), 0.0)
+        candidates = resid > threshold
+
+        # Constraints on unset variables have no evaluable body; the
+        # Jacobian pattern says which rows reference those columns
+        unset = _unset_primals(nlp)
+        if unset.any():
+            jac = nlp.evaluate_jacobian()
+            candidates[jac.row[unset[jac.col]]] = False
+
+        cons = nlp.get_pyomo_constraints()
+        return [
+            {
+                "constraint": cons[i].name,
+                "residual": float(resid[i]),
+                "body_value": value(cons[i].body, exception=False),
+            }
+            for i in top_k_indices(resid, candidates, max_results)
+        ]
+
+    # Loop invariants bound to locals; value(x, False) skips the kwargs dict
+    top = _TopK(max_results)
+    push = top.push
+    _value = value
+    for c in m.component_data_objects(Constraint, active=True):
+        try:
+            body_val = _value(c.body, False)
+            if body_val is None:
+                continue
+
+            # Calculate residual based on constraint type
+            lb = _value(c.lower, False)
+            ub = _value(c.upper, False)
+
+            residual = 0.0
+            if lb is not None and body_val < lb:
+                residual = abs(lb - body_val)
+            elif ub is not None and body_val > ub:
+                residual = abs(body_val - ub)
+
+            if residual > threshold:
+                push(residual, (residual, c, body_val))
+        except Exception:
+            continue
+
+    # Names and dicts only for the survivors
+    return [
+        {"constraint": c.name, "residual": residual, "body_value": body_val}
+        for residual, c, body_val in top.items()
+    ]
+
+
 @mcp.tool()
 def get_constraint_residuals(
     session_id: str,
@@ -2156,15 +2553,13 @@ def get_constraint_residuals(
         List of constraints with large residuals
     """
     try:
-        session = session_manager.load(session_id)
+        session = session_manager.load_cached(session_id)
     except FileNotFoundError:
         return {"error": f"Session '{session_id}' not found"}
 
-    # Build the Pyomo model
+    # Build (or reuse) the Pyomo model
     try:
-        from utils.model_builder import ModelBuilder, ModelBuildError
-        builder = ModelBuilder(session)
-        m = builder.build()
+        m, _ = _get_or_build_model(session)
     except ImportError as e:
         return {
             "session_id": session_id,
@@ -2177,39 +2572,8 @@ def get_constraint_residuals(
         }
 
     # Get constraint residuals
-    residuals = []
     try:
-        from pyomo.environ import Constraint, value
-
-        for c in m.component_data_objects(Constraint, active=True):
-            try:
-                body_val = value(c.body, exception=False)
-                if body_val is None:
-                    continue
-
-                # Calculate residual based on constraint type
-                lb = value(c.lower, exception=False)
-                ub = value(c.upper, exception=False)
-
-                residual = 0.0
-                if lb is not None and body_val < lb:
-                    residual = abs(lb - body_val)
-                elif ub is not None and body_val > ub:
-                    residual = abs(body_val - ub)
-
-                if residual > threshold:
-                    residuals.append({
-                        "constraint": str(c),
-                        "residual": residual,
-                        "body_value": body_val,
-                    })
-            except Exception:
-                continue
-
-        # Sort by residual descending
-        residuals.sort(key=lambda x: x["residual"], reverse=True)
-        residuals = residuals[:max_results]
-
+        residuals = _constraint_residuals(m, _model_nlp(session, m), threshold, max_results)
     except Exception as e:
         return {
             "session_id": session_id,
@@ -2224,6 +2588,119 @@ def get_constraint_residuals(
     }
 
 
+def _bound_violation(val: float, lb: Optional[float], ub: Optional[float],
+                     tolerance: float) -> Optional[Tuple[float, str]]:
+    """Return (violation, type) if val is outside its bounds, else None."""
+    if lb is not None and val < lb - tolerance:
+        return lb - val, "below_lower"
+    if ub is not None and val > ub + tolerance:
+        return val - ub, "above_upper"
+    return None
+
+
+def _violation_dicts(top: _TopK) -> List[Dict[str, Any]]:
+    """Build result dicts for the kept (v, val, lb, ub, violation, type) entries."""
+    return [
+        {
+            "variable": v.name,
+            "value": val,
+            "lower_bound": lb,
+            "upper_bound": ub,
+            "violation": violation,
+            "type": violation_type,
+        }
+        for v, val, lb, ub, violation, violation_type in top.items()
+    ]
+
+
+def _bound_violations(
+    m: Any,
+    nlp: Any,
+    tolerance: float,
+    max_results: int,
+    non_primals: Optional[List[Any]] = None,
+) -> List[Dict[str, Any]]:
+    """Find the variables furthest outside their bounds.
+
+    The NLP primal vector is compared against its bound vectors in one
+    numpy sweep, and dicts are only built for the violators. Variables that
+    are not NLP primals (fixed ones, and unfixed ones no active constraint
+    references) are then checked one by one, so the result matches the
+    fallback, which checks every variable when PyNumero is unavailable.
+    Either way candidates stream through a ``max_results``-sized heap and
+    only the survivors become dicts.
+
+    Args:
+        m: Built Pyomo model
+        nlp: PyomoNLP from _model_nlp, or None for the fallback
+        tolerance: Tolerance for bound violations
+        max_results: Maximum number of results
+        non_primals: Variables not in the NLP, as from _model_non_primal_vars
+            (computed here if not given)
+
+    Returns:
+        List of violation dicts, largest violation first
+    """
+    from pyomo.environ import Var, value
+
+    top = _TopK(max_results)
+    check = _bound_violation
+
+    if nlp is not None:
+        import numpy as np
+
+        x = nlp.get_primals()
+        viol = np.maximum(
+            np.maximum(nlp.primals_lb() - x, x - nlp.primals_ub()) - tolerance, 0.0
+        )
+        # Unset values enter the NLP as 0; they are excluded before the
+        # top-k so they cannot crowd out real violations
+        candidates = viol > 0
+        if np.any(candidates):
+            candidates &= ~_unset_primals(nlp)
+            primals = nlp.get_pyomo_variables()
+            for i in top_k_indices(viol, candidates, max_results):
+                v = primals[i]
+                val = v.value
+                hit = check(val, v.lb, v.ub, tolerance)
+                if hit is not None:
+                    top.push(abs(hit[0]), (v, val, v.lb, v.ub) + hit)
+
+        if non_primals is None:
+            non_primals = _non_primal_vars(m, nlp)
+        for v in non_primals:
+            val = value(v, False)
+            if val is None:
+                continue
+            hit = check(val, v.lb, v.ub, tolerance)
+            if hit is not None:
+                top.push(abs(hit[0]), (v, val, v.lb, v.ub) + hit)
+
+        return _violation_dicts(top)
+
+    # Loop invariants bound to locals; value(x, False) skips the kwargs dict
+    push = top.push
+    _value = value
+    for v in m.component_data_objects(Var, active=True):
+        try:
+            val = _value(v, False)
+            if val is None:
+                continue
+            lb = v.lb
+            if lb is not None:
+                lb = _value(lb, False)
+            ub = v.ub
+            if ub is not None:
+                ub = _value(ub, False)
+            hit = check(val, lb, ub, tolerance)
+            if hit is not None:
+                push(abs(hit[0]), (v, val, lb, ub) + hit)
+        except Exception:
+            continue
+
+    return _violation_dicts(top)
+
+
 @mcp.tool()
 def get_bound_violations(
     session_id: str,
@@ -2241,15 +2718,13 @@ def get_bound_violations(
         List of bound violations
     """
     try:
-        session = session_manager.load(session_id)
+        session = session_manager.load_cached(session_id)
     except FileNotFoundError:
         return {"error": f"Session '{session_id}' not found"}
 
-    # Build the Pyomo model
+    # Build (or reuse) the Pyomo model
     try:
-        from utils.model_builder import ModelBuilder, ModelBuildError
-        builder = ModelBuilder(session)
-        m = builder.build()
+        m, _ = _get_or_build_model(session)
     except ImportError as e:
         return {
             "session_id": session_id,
@@ -2262,45 +2737,10 @@ def get_bound_violations(
         }
 
     # Get bound violations
-    violations = []
     try:
-        from pyomo.environ import Var, value
-
-        for v in m.component_data_objects(Var, active=True):
-            try:
-                val = value(v, exception=False)
-                if val is None:
-                    continue
-
-                lb = value(v.lb, exception=False) if v.lb is not None else None
-                ub = value(v.ub, exception=False) if v.ub is not None else None
-
-                violation = None
-                violation_type = None
-
-                if lb is not None and val < lb - tolerance:
-                    violation = lb - val
-                    violation_type = "below_lower"
-                elif ub is not None and val > ub + tolerance:
-                    violation = val - ub
-                    violation_type = "above_upper"
-
-                if violation is not None:
-                    violations.append({
-                        "variable": str(v),
-                        "value": val,
-                        "lower_bound": lb,
-                        "upper_bound": ub,
-                        "violation": violation,
-                        "type": violation_type,
-                    })
-            except Exception:
-                continue
-
-        # Sort by violation magnitude descending
-        violations.sort(key=lambda x: abs(x["violation"]), reverse=True)
-        violations = violations[:max_results]
-
+        nlp = _model_nlp(session, m)
+        non_primals = _model_non_primal_vars(session, m, nlp) if nlp is not None else None
+        violations = _bound_violations(m, nlp, tolerance, max_results, non_primals)
     except Exception as e:
         return {
             "session_id": session_id,
@@ -2315,6 +2755,68 @@ def get_bound_violations(
     }
 
 
+def _residuals_and_violations(
+    session: FlowsheetSession,
+    m: Any,
+    threshold: float = 1e-6,
+    tolerance: float = 1e-8,
+    max_results: int = 20,
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Compute constraint residuals and bound violations from one NLP.
+
+    Args:
+        session: Session the model was built from
+        m: Model returned by _get_or_build_model(session)
+        threshold: Only report residuals above this value
+        tolerance: Tolerance for bound violations
+        max_results: Maximum number of results per list
+
+    Returns:
+        (constraint_residuals, bound_violations) tuple
+    """
+    nlp = _model_nlp(session, m)
+    non_primals = _model_non_primal_vars(session, m, nlp) if nlp is not None else None
+    return (
+        _constraint_residuals(m, nlp, threshold, max_results),
+        _bound_violations(m, nlp, tolerance, max_results, non_primals),
+    )
+
+
+# Termination condition -> (likely causes, suggested fixes)
+_FAILURE_PATTERNS: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]] = {
+    "infeasible": (
+        ("No feasible solution exists with current constraints and bounds",),
+        (
+            "Check constraint residuals to identify problematic constraints",
+            "Verify feed pressure is above osmotic pressure for RO",
+            "Check that operating conditions are physically achievable",
+        ),
+    ),
+    "maxIterations": (
+        ("Solver hit iteration limit - likely poor scaling or bad initialization",),
+        (
+            "Run calculate_scaling_factors and report_scaling_issues",
+            "Scale small parameters: A_comp (1e12), B_comp (1e8)",
+            "Initialize units sequentially with propagate_state",
+        ),
+    ),
+    "locallyInfeasible": (
+        ("Local minimum is infeasible - bad initial point",),
+        (
+            "Try different initial values",
+            "Initialize from a known feasible solution",
+        ),
+    ),
+    "unbounded": (
+        ("Variables going to infinity - missing constraints",),
+        (
+            "Check that all required variables are fixed",
+            "Verify DOF = 0 before solving",
+        ),
+    ),
+}
+
+
 @mcp.tool()
 def diagnose_failure(
     session_id: str,
@@ -2327,10 +2829,13 @@ def diagnose_failure(
         termination_condition: The solver's termination condition
 
     Returns:
-        Diagnosis with likely causes and suggested fixes
+        Diagnosis with likely causes and suggested fixes. The largest
+        residuals and bound violations of the server's model before solving
+        are reported under ``initial_point_*`` keys; the worker's failure
+        point is not persisted.
     """
     try:
-        session = session_manager.load(session_id)
+        session = session_manager.load_cached(session_id)
     except FileNotFoundError:
         return {"error": f"Session '{session_id}' not found"}
 
@@ -2344,43 +2849,24 @@ def diagnose_failure(
     }
 
     # Pattern matching for common failures
-    if termination_condition == "infeasible":
-        diagnosis["likely_causes"].append(
-            "No feasible solution exists with current constraints and bounds"
-        )
-        diagnosis["suggested_fixes"].extend([
-            "Check constraint residuals to identify problematic constraints",
-            "Verify feed pressure is above osmotic pressure for RO",
-            "Check that operating conditions are physically achievable",
-        ])
-
-    elif termination_condition == "maxIterations":
-        diagnosis["likely_causes"].append(
-            "Solver hit iteration limit - likely poor scaling or bad initialization"
-        )
-        diagnosis["suggested_fixes"].extend([
-            "Run calculate_scaling_factors and report_scaling_issues",
-            "Scale small parameters: A_comp (1e12), B_comp (1e8)",
-            "Initialize units sequentially with propagate_state",
-        ])
+    causes, fixes = _FAILURE_PATTERNS.get(termination_condition, ((), ()))
+    diagnosis["likely_causes"].extend(causes)
+    diagnosis["suggested_fixes"].extend(fixes)
 
-    elif termination_condition == "locallyInfeasible":
-        diagnosis["likely_causes"].append(
-            "Local minimum is infeasible - bad initial point"
-        )
-        diagnosis["suggested_fixes"].extend([
-            "Try different initial values",
-            "Initialize from a known feasible solution",
-        ])
-
-    elif termination_condition == "unbounded":
-        diagnosis["likely_causes"].append(
-            "Variables going to infinity - missing constraints"
+    # Residuals and violations at the initial point, from one model build/NLP
+    try:
+        m, _ = _get_or_build_model(session)
+        residuals, violations = _residuals_and_violations(session, m, max_results=10)
+        diagnosis["initial_point_residuals"] = residuals
+        diagnosis["initial_point_bound_violations"] = violations
+        diagnosis["initial_point_note"] = (
+            "Evaluated on the server's model before solving, not at the point "
+            "where the solver stopped"
         )
-        diagnosis["suggested_fixes"].extend([
-            "Check that all required variables are fixed",
-            "Verify DOF = 0 before solving",
-        ])
+    except ImportError as e:
+        diagnosis["note"] = f"WaterTAP/IDAES not available: {e}"
+    except Exception as e:
+        diagnosis["note"] = f"Residual/bound check failed: {str(e)[:100]}"
 
     return diagnosis
 
@@ -2389,6 +2875,31 @@ def diagnose_failure(
 # ZERO-ORDER SPECIFIC TOOLS (3)
 # ============================================================================
 
+# Unit-block parameters reported back by load_zo_parameters
+_ZO_PARAMETER_NAMES = (
+    "removal_frac_mass_comp",
+    "recovery_frac_mass_H2O",
+    "energy_electric_flow_vol_inlet",
+    "electricity",
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _wt_database(dbpath: str) -> Any:
+    """WaterTAP parameter Database for a path, constructed once per process.
+
+    Args:
+        dbpath: Database name or path, as passed to load_zo_parameters
+
+    Raises:
+        ImportError: If WaterTAP is not installed
+    """
+    # Database class is in watertap.core.wt_database, not zero_order_base
+    from watertap.core.wt_database import Database
+
+    return Database(dbpath)
+
+
 @mcp.tool()
 def load_zo_parameters(
     session_id: str,
@@ -2423,10 +2934,27 @@ def load_zo_parameters(
             "error": f"Unit '{unit_id}' is not a zero-order unit (type: {unit_inst.unit_type})"
         }
 
+    # Same database/subtype/property config as the last load: nothing to redo
+    zo_config = unit_inst.zo_config
+    if (
+        "parameters_loaded" in zo_config
+        and zo_config.get("database") == database
+        and zo_config.get("process_subtype") == process_subtype
+        and zo_config.get("property_package_config") == session.config.property_package_config
+    ):
+        return {
+            "session_id": session_id,
+            "unit_id": unit_id,
+            "database": database,
+            "process_subtype": process_subtype,
+            "parameters_loaded": zo_config["parameters_loaded"],
+            "persisted": True,
+            "success": True,
+            "cached": True,
+        }
+
     # Build model and call load_parameters_from_database
     try:
-        from utils.model_builder import ModelBuilder, ModelBuildError
-
         builder = ModelBuilder(session)
         m = builder.build()
         units = builder.get_units()
@@ -2456,13 +2984,9 @@ def load_zo_parameters(
     try:
         if hasattr(unit_block, "load_parameters_from_database"):
             # Set database on unit config (CORRECT approach per Codex review)
-            # Note: Database class is in watertap.core.wt_database, not zero_order_base
             try:
-                from watertap.core.wt_database import Database
-
                 if database != "default":
-                    db = Database(database)
-                    unit_block.config.database = db
+                    unit_block.config.database = _wt_database(database)
             except ImportError:
                 return {
                     "session_id": session_id,
@@ -2478,29 +3002,8 @@ def load_zo_parameters(
             unit_block.load_parameters_from_database(use_default_removal=True)
 
             # Extract loaded parameter values
-            from pyomo.environ import value
-
-            param_names = [
-                "removal_frac_mass_comp",
-                "recovery_frac_mass_H2O",
-                "energy_electric_flow_vol_inlet",
-                "electricity",
-            ]
-            for pname in param_names:
-                param = getattr(unit_block, pname, None)
-                if param is not None:
-                    try:
-                        if hasattr(param, "__iter__"):
-                            for idx in param:
-                                val = value(param[idx], exception=False)
-                                if val is not None:
-                                    parameters_loaded[f"{pname}[{idx}]"] = val
-                        else:
-                            val = value(param, exception=False)
-                            if val is not None:
-                                parameters_loaded[pname] = val
-                    except Exception:
-                        pass
+            for pname in _ZO_PARAMETER_NAMES:
+                _read_component_values(unit_block, pname, parameters_loaded)
 
         else:
             return {
@@ -2521,6 +3024,7 @@ def load_zo_parameters(
     unit_inst.zo_config["database"] = database
     unit_inst.zo_config["process_subtype"] = process_subtype
     unit_inst.zo_config["parameters_loaded"] = parameters_loaded
+    unit_inst.zo_config["property_package_config"] = dict(session.config.property_package_config)
 
     # Save session with updated unit config
     session_manager.save(session)
@@ -2536,6 +3040,36 @@ def load_zo_parameters(
     }
 
 
+@functools.lru_cache(maxsize=1)
+def _zo_database() -> Any:
+    """Shared WaterTAP zero-order Database instance.
+
+    The Database parses each technology's YAML file on first lookup and
+    keeps it, so reusing one instance across calls avoids re-parsing.
+
+    Raises:
+        ImportError: If WaterTAP is not installed
+    """
+    from watertap.core.zero_order_base import Database as ZODatabase
+
+    return ZODatabase()
+
+
+@functools.lru_cache(maxsize=1)
+def _zo_database_files() -> Tuple[Path, ...]:
+    """YAML files in WaterTAP's techno-economic data directory (listed once).
+
+    Raises:
+        ImportError: If WaterTAP is not installed
+    """
+    import watertap
+
+    data_path = Path(watertap.__file__).parent / "data" / "techno_economic"
+    if not data_path.exists():
+        return ()
+    return tuple(sorted(data_path.glob("*.yaml")))
+
+
 @mcp.tool()
 def list_zo_databases() -> List[Dict[str, Any]]:
     """List available zero-order parameter databases.
@@ -2548,24 +3082,15 @@ def list_zo_databases() -> List[Dict[str, Any]]:
 
     try:
         from watertap.core.zero_order_base import Database as ZODatabase
-        import os
-        from pathlib import Path
 
-        # Get default database path
+        # List available yaml files as databases
         try:
-            import watertap
-
-            watertap_path = Path(watertap.__file__).parent
-            data_path = watertap_path / "data" / "techno_economic"
-
-            if data_path.exists():
-                # List available yaml files as databases
-                for f in data_path.glob("*.yaml"):
-                    databases.append({
-                        "name": f.stem,
-                        "path": str(f),
-                        "description": f"WaterTAP database: {f.stem}",
-                    })
+            for f in _zo_database_files():
+                databases.append({
+                    "name": f.stem,
+                    "path": str(f),
+                    "description": f"WaterTAP database: {f.stem}",
+                })
         except Exception:
             pass
 
@@ -2605,9 +3130,7 @@ def get_zo_unit_parameters(
     """
     # Try to get actual parameters from WaterTAP database
     try:
-        from watertap.core.zero_order_base import Database as ZODatabase
-
-        db = ZODatabase()
+        db = _zo_database()
 
         # Map unit type to database key
         unit_key = unit_type.replace("ZO", "").lower()
@@ -2672,6 +3195,81 @@ def get_zo_unit_parameters(
 # RESULTS TOOLS (3)
 # ============================================================================
 
+# Port names probed for stream tables on an unsolved model
+_STREAM_PORT_NAMES = (
+    "inlet", "outlet", "feed", "permeate", "retentate",
+    "brine", "product", "reject", "vapor", "liquid",
+)
+
+# Unit variables reported by get_unit_results on an unsolved model
+# Common variables to extract for all units
+_COMMON_RESULT_VARS = (
+    "work_mechanical",
+    "work_fluid",
+    "work_isentropic",
+    "heat_duty",
+    "heat",
+    "electricity",
+    "power",
+)
+# RO/NF specific metrics
+_RO_RESULT_VARS = (
+    "recovery_vol_phase",
+    "recovery_mass_phase_comp",
+    "rejection_phase_comp",
+    "flux_mass_phase_comp",
+    "area",
+    "A_comp",
+    "B_comp",
+    "deltaP",
+    "over_pressure_ratio",
+)
+# Pump specific metrics
+_PUMP_RESULT_VARS = (
+    "efficiency_pump",
+    "efficiency_isentropic",
+    "control_volume",
+    "deltaP",
+)
+# Evaporator/crystallizer specific
+_EVAP_RESULT_VARS = (
+    "area",
+    "U",
+    "delta_temperature",
+    "lmtd",
+    "heat_transfer",
+)
+_UNIT_RESULT_VARS = tuple(dict.fromkeys(
+    _COMMON_RESULT_VARS + _RO_RESULT_VARS + _PUMP_RESULT_VARS + _EVAP_RESULT_VARS
+))
+# Variables worth probing per unit category; other categories and
+# unregistered unit types get the full list
+_CATEGORY_RESULT_VARS = {
+    UnitCategory.MEMBRANE: _COMMON_RESULT_VARS + _RO_RESULT_VARS,
+    UnitCategory.MEMBRANE_ZO: _COMMON_RESULT_VARS + _RO_RESULT_VARS,
+    UnitCategory.PUMP: _COMMON_RESULT_VARS + _PUMP_RESULT_VARS,
+    UnitCategory.PUMP_ZO: _COMMON_RESULT_VARS + _PUMP_RESULT_VARS,
+    UnitCategory.ERD: _COMMON_RESULT_VARS + _PUMP_RESULT_VARS,
+    UnitCategory.THERMAL: _COMMON_RESULT_VARS + _PUMP_RESULT_VARS + _EVAP_RESULT_VARS,
+    UnitCategory.CRYSTALLIZER: _COMMON_RESULT_VARS + _EVAP_RESULT_VARS,
+    UnitCategory.FEED: _COMMON_RESULT_VARS,
+    UnitCategory.FEED_ZO: _COMMON_RESULT_VARS,
+    UnitCategory.PRODUCT: _COMMON_RESULT_VARS,
+    UnitCategory.MIXER: _COMMON_RESULT_VARS,
+    UnitCategory.SPLITTER: _COMMON_RESULT_VARS,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _unit_result_vars(unit_type: str) -> Tuple[str, ...]:
+    """Unit variables to report for a unit type, deduplicated, in list order."""
+    spec = UNITS.get(unit_type)
+    names = _CATEGORY_RESULT_VARS.get(spec.category) if spec is not None else None
+    if names is None:
+        return _UNIT_RESULT_VARS
+    return tuple(dict.fromkeys(names))
+
+
 @mcp.tool()
 def get_results(session_id: str) -> Dict[str, Any]:
     """Get solve results for a session.
@@ -2683,7 +3281,7 @@ def get_results(session_id: str) -> Dict[str, Any]:
         Solve status and summary results
     """
     try:
-        session = session_manager.load(session_id)
+        session = session_manager.load_cached(session_id)
     except FileNotFoundError:
         return {"error": f"Session '{session_id}' not found"}
 
@@ -2696,6 +3294,229 @@ def get_results(session_id: str) -> Dict[str, Any]:
     }
 
 
+def _indexed_values(component: Any) -> Dict[str, float]:
+    """Read the set values of an indexed Pyomo component.
+
+    Iterates ``items()`` once instead of re-indexing the component per key;
+    unset entries and entries that fail to evaluate are omitted. Var data
+    is read from ``.value`` directly; only Expressions go through
+    ``value()``.
+
+    Args:
+        component: Indexed Var/Expression/Reference, or None
+
+    Returns:
+        Dict of str(index) -> value
+    """
+    if component is None:
+        return {}
+    from pyomo.environ import Var, value
+
+    out = {}
+    if getattr(component, "ctype", None) is Var:
+        for idx, data in component.items():
+            val = data.value
+            if val is not None:
+                out[str(idx)] = val
+        return out
+
+    for idx, data in component.items():
+        try:
+            val = value(data, False)
+        except Exception:
+            continue
+        if val is not None:
+            out[str(idx)] = val
+    return out
+
+
+def _component_value(component: Any) -> Any:
+    """Read a Pyomo component's value.
+
+    Args:
+        component: Scalar or indexed Var/Expression/Param
+
+    Returns:
+        The value for a scalar, a dict of str(index) -> value for an indexed
+        component, or None if the component is unset or cannot be evaluated
+    """
+    try:
+        indexed = component.is_indexed()
+    except AttributeError:
+        return None
+    if indexed:
+        return _indexed_values(component)
+
+    from pyomo.environ import Var, value
+
+    if getattr(component, "ctype", None) is Var:
+        return component.value
+    try:
+        return value(component, False)
+    except Exception:
+        return None
+
+
+def _read_component_values(block: Any, name: str, out: Dict[str, Any]) -> None:
+    """Copy the values of ``block.<name>`` into ``out``.
+
+    Indexed components are stored as ``name[idx]`` entries, scalars as
+    ``name``. Missing components and unset or unevaluable entries are
+    skipped.
+
+    Args:
+        block: Pyomo block to read from
+        name: Component name on the block
+        out: Dict to add values to
+    """
+    component = getattr(block, name, None)
+    if component is None:
+        return
+    val = _component_value(component)
+    if isinstance(val, dict):
+        for idx, idx_val in val.items():
+            out[f"{name}[{idx}]"] = idx_val
+    elif val is not None:
+        out[name] = val
+
+
+def _solved_stream_kpis(session: FlowsheetSession) -> Dict[str, Any]:
+    """Persisted stream KPIs keyed by "unit.port".
+
+    Sessions store stream KPIs nested as {unit: {port: data}}; the flat
+    form is built once per session state and shared by the result tools.
+
+    Args:
+        session: Session to read
+
+    Returns:
+        Dict of "unit.port" -> port data (empty if the session is unsolved)
+    """
+    def build():
+        kpis = session.results.get("kpis") if isinstance(session.results, dict) else None
+        stream_kpis = (kpis or {}).get("streams") or {}
+        return {
+            f"{unit_id}.{port_name}": port_data
+            for unit_id, ports in stream_kpis.items()
+            for port_name, port_data in ports.items()
+        }
+
+    return session.cached_view("solved_stream_kpis", build)
+
+
+def _unit_port_names(unit_block: Any) -> Tuple[str, ...]:
+    """Names from _STREAM_PORT_NAMES declared as Ports on the unit, in order.
+
+    Checks membership in the block's Port map instead of probing every
+    candidate with getattr, where each missing name raises inside the
+    block's ``__getattr__``.
+
+    Args:
+        unit_block: Built unit block
+
+    Returns:
+        Tuple of port names (all candidates if the block has no component map)
+    """
+    try:
+        from pyomo.network import Port
+
+        ports = unit_block.component_map(Port)
+    except (ImportError, AttributeError):
+        return _STREAM_PORT_NAMES
+    return tuple(name for name in _STREAM_PORT_NAMES if name in ports)
+
+
+def _extract_streams(
+    units: Dict[str, Any],
+    streams: Optional[List[str]] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """Read port state values from built unit blocks.
+
+    Args:
+        units: Unit ID -> built unit block
+        streams: Optional list of "unit.port" keys to restrict extraction to
+
+    Returns:
+        Dict of "unit.port" -> port properties
+    """
+    # Requested ports per unit, so unrequested units/ports are never probed
+    wanted: Optional[Dict[str, set]] = None
+    if streams is not None:
+        wanted = defaultdict(set)
+        for stream_key in streams:
+            unit_id, _, port_name = stream_key.rpartition(".")
+            wanted[unit_id].add(port_name)
+
+    stream_data = {}
+    for unit_id, unit_block in units.items():
+        if wanted is not None and unit_id not in wanted:
+            continue
+        # Check common port names the unit actually declares
+        port_names = _unit_port_names(unit_block)
+        if wanted is not None:
+            port_names = [p for p in port_names if p in wanted[unit_id]]
+
+        for port_name in port_names:
+            port = getattr(unit_block, port_name, None)
+            if port is None:
+                continue
+
+            stream_key = f"{unit_id}.{port_name}"
+            port_data = {}
+            try:
+                # Try to extract state block properties
+                flow_vals = _indexed_values(getattr(port, "flow_mass_phase_comp", None))
+                if flow_vals:
+                    port_data["flow_mass_phase_comp"] = flow_vals
+
+                # Time-indexed scalars: report the last time point
+                for attr, key in (
+                    ("flow_vol", "flow_vol"),
+                    ("temperature", "temperature_K"),
+                    ("pressure", "pressure_Pa"),
+                ):
+                    vals = _indexed_values(getattr(port, attr, None))
+                    if vals:
+                        port_data[key] = next(reversed(vals.values()))
+
+                conc_vals = _indexed_values(getattr(port, "conc_mass_phase_comp", None))
+                if conc_vals:
+                    port_data["conc_mass_phase_comp"] = conc_vals
+
+            except Exception as e:
+                port_data["extraction_error"] = str(e)[:50]
+
+            if port_data:
+                stream_data[stream_key] = port_data
+
+    return stream_data
+
+
+def _extract_unit_performance(unit_block: Any, unit_type: str) -> Dict[str, Any]:
+    """Read performance variables from a built unit block.
+
+    Args:
+        unit_block: Built unit block
+        unit_type: Registered unit type, selecting the variables to probe
+
+    Returns:
+        Dict of variable name -> value, or -> {str(index): value} for
+        indexed variables (the layout of the persisted unit KPIs)
+    """
+    performance = {}
+    try:
+        for var_name in _unit_result_vars(unit_type):
+            component = getattr(unit_block, var_name, None)
+            if component is None:
+                continue
+            val = _component_value(component)
+            if val is not None and val != {}:
+                performance[var_name] = val
+    except Exception as e:
+        performance["extraction_error"] = str(e)[:100]
+    return performance
+
+
 @mcp.tool()
 def get_stream_results(
     session_id: str,
@@ -2714,50 +3535,38 @@ def get_stream_results(
         Stream properties (flow, concentration, T, P) for each stream
     """
     try:
-        session = session_manager.load(session_id)
+        session = session_manager.load_cached(session_id)
     except FileNotFoundError:
         return {"error": f"Session '{session_id}' not found"}
 
     # Check if we have persisted KPIs from a solved session
-    if session.results and isinstance(session.results, dict) and "kpis" in session.results:
-        kpis = session.results["kpis"]
-        stream_kpis = kpis.get("streams", {})
-
-        if stream_kpis:
-            # Convert from unit-based to stream-based format if specific streams requested
-            if streams is not None:
-                filtered_streams = {}
-                for unit_id, ports in stream_kpis.items():
-                    for port_name, port_data in ports.items():
-                        stream_key = f"{unit_id}.{port_name}"
-                        if stream_key in streams:
-                            filtered_streams[stream_key] = port_data
-                return {
-                    "session_id": session_id,
-                    "source": "solved",
-                    "streams": filtered_streams,
-                }
-
-            # Return all streams
-            all_streams = {}
-            for unit_id, ports in stream_kpis.items():
-                for port_name, port_data in ports.items():
-                    stream_key = f"{unit_id}.{port_name}"
-                    all_streams[stream_key] = port_data
-
-            return {
-                "session_id": session_id,
-                "source": "solved",
-                "streams": all_streams,
-            }
+    kpis = session.results.get("kpis") if isinstance(session.results, dict) else None
+    stream_kpis = (kpis or {}).get("streams")
+    if stream_kpis:
+        if streams is not None:
+            # Parse each requested key once and index the nested form, so the
+            # cost scales with the request rather than with every stream
+            # (port names have no dots)
+            filtered_streams = {}
+            for stream_key in dict.fromkeys(streams):
+                unit_id, sep, port_name = stream_key.rpartition(".")
+                if not sep:
+                    continue
+                port_data = stream_kpis.get(unit_id, {}).get(port_name)
+                if port_data is not None:
+                    filtered_streams[stream_key] = port_data
+        else:
+            filtered_streams = dict(_solved_stream_kpis(session))
+        return {
+            "session_id": session_id,
+            "source": "solved",
+            "streams": filtered_streams,
+        }
 
     # Fall back to rebuilding model (returns uninitialized/unsolved values)
     # This path is used when session hasn't been solved yet
     try:
-        from utils.model_builder import ModelBuilder, ModelBuildError
-        builder = ModelBuilder(session)
-        m = builder.build()
-        units = builder.get_units()
+        m, units = _get_or_build_model(session)
     except ImportError as e:
         return {
             "session_id": session_id,
@@ -2770,75 +3579,8 @@ def get_stream_results(
         }
 
     # Extract stream properties
-    stream_data = {}
     try:
-        from pyomo.environ import value
-
-        for unit_id, unit_block in units.items():
-            # Check common port names
-            port_names = ["inlet", "outlet", "feed", "permeate", "retentate",
-                         "brine", "product", "reject", "vapor", "liquid"]
-            for port_name in port_names:
-                port = getattr(unit_block, port_name, None)
-                if port is None:
-                    continue
-
-                stream_key = f"{unit_id}.{port_name}"
-
-                # Check if specific streams were requested
-                if streams is not None and stream_key not in streams:
-                    continue
-
-                port_data = {}
-                try:
-                    # Try to extract state block properties
-                    if hasattr(port, 'flow_mass_phase_comp'):
-                        flow_vals = {}
-                        for idx in port.flow_mass_phase_comp:
-                            try:
-                                flow_vals[str(idx)] = value(port.flow_mass_phase_comp[idx])
-                            except Exception:
-                                pass
-                        if flow_vals:
-                            port_data["flow_mass_phase_comp"] = flow_vals
-
-                    if hasattr(port, 'flow_vol'):
-                        for idx in port.flow_vol:
-                            try:
-                                port_data["flow_vol"] = value(port.flow_vol[idx])
-                            except Exception:
-                                pass
-
-                    if hasattr(port, 'temperature'):
-                        for idx in port.temperature:
-                            try:
-                                port_data["temperature_K"] = value(port.temperature[idx])
-                            except Exception:
-                                pass
-
-                    if hasattr(port, 'pressure'):
-                        for idx in port.pressure:
-                            try:
-                                port_data["pressure_Pa"] = value(port.pressure[idx])
-                            except Exception:
-                                pass
-
-                    if hasattr(port, 'conc_mass_phase_comp'):
-                        conc_vals = {}
-                        for idx in port.conc_mass_phase_comp:
-                            try:
-                                conc_vals[str(idx)] = value(port.conc_mass_phase_comp[idx])
-                            except Exception:
-                                pass
-                        if conc_vals:
-                            port_data["conc_mass_phase_comp"] = conc_vals
-
-                except Exception as e:
-                    port_data["extraction_error"] = str(e)[:50]
-
-                if port_data:
-                    stream_data[stream_key] = port_data
-
+        stream_data = _extract_streams(units, streams)
     except Exception as e:
         return {
             "session_id": session_id,
@@ -2872,7 +3614,7 @@ def get_unit_results(
         Unit-specific performance metrics
     """
     try:
-        session = session_manager.load(session_id)
+        session = session_manager.load_cached(session_id)
     except FileNotFoundError:
         return {"error": f"Session '{session_id}' not found"}
 
@@ -2903,11 +3645,7 @@ def get_unit_results(
 
     # Fall back to rebuilding model (returns uninitialized/unsolved values)
     try:
-        from utils.model_builder import ModelBuilder, ModelBuildError
-
-        builder = ModelBuilder(session)
-        m = builder.build()
-        units = builder.get_units()
+        m, units = _get_or_build_model(session)
     except ImportError as e:
         return {
             "session_id": session_id,
@@ -2932,120 +3670,94 @@ def get_unit_results(
         }
 
     # Extract unit-specific performance metrics
-    performance = {}
+    performance = _extract_unit_performance(unit_block, unit_inst.unit_type)
 
-    try:
-        from pyomo.environ import value
+    return {
+        "session_id": session_id,
+        "unit_id": unit_id,
+        "unit_type": unit_inst.unit_type,
+        "source": "unsolved_model",
+        "warning": "Values are from an unsolved model. Run solve() first.",
+        "performance": performance,
+    }
 
-        # Common variables to extract for all units
-        common_vars = [
-            "work_mechanical",
-            "work_fluid",
-            "work_isentropic",
-            "heat_duty",
-            "heat",
-            "electricity",
-            "power",
-        ]
 
-        for var_name in common_vars:
-            var = getattr(unit_block, var_name, None)
-            if var is not None:
-                try:
-                    if hasattr(var, "__iter__"):
-                        # Indexed variable
-                        for idx in var:
-                            val = value(var[idx], exception=False)
-                            if val is not None:
-                                performance[f"{var_name}[{idx}]"] = val
-                    else:
-                        val = value(var, exception=False)
-                        if val is not None:
-                            performance[var_name] = val
-                except Exception:
-                    pass
-
-        # RO/NF specific metrics
-        ro_vars = [
-            "recovery_vol_phase",
-            "recovery_mass_phase_comp",
-            "rejection_phase_comp",
-            "flux_mass_phase_comp",
-            "area",
-            "A_comp",
-            "B_comp",
-            "deltaP",
-            "over_pressure_ratio",
-        ]
-        for var_name in ro_vars:
-            var = getattr(unit_block, var_name, None)
-            if var is not None:
-                try:
-                    if hasattr(var, "__iter__"):
-                        for idx in var:
-                            val = value(var[idx], exception=False)
-                            if val is not None:
-                                performance[f"{var_name}[{idx}]"] = val
-                    else:
-                        val = value(var, exception=False)
-                        if val is not None:
-                            performance[var_name] = val
-                except Exception:
-                    pass
-
-        # Pump specific metrics
-        pump_vars = [
-            "efficiency_pump",
-            "efficiency_isentropic",
-            "control_volume",
-            "deltaP",
-        ]
-        for var_name in pump_vars:
-            var = getattr(unit_block, var_name, None)
-            if var is not None:
-                try:
-                    if hasattr(var, "__iter__"):
-                        for idx in var:
-                            val = value(var[idx], exception=False)
-                            if val is not None:
-                                performance[f"{var_name}[{idx}]"] = val
-                    else:
-                        val = value(var, exception=False)
-                        if val is not None:
-                            performance[var_name] = val
-                except Exception:
-                    pass
-
-        # Evaporator/crystallizer specific
-        evap_vars = [
-            "area",
-            "U",
-            "delta_temperature",
-            "lmtd",
-            "heat_transfer",
-        ]
-        for var_name in evap_vars:
-            var = getattr(unit_block, var_name, None)
-            if var is not None:
-                try:
-                    val = value(var, exception=False)
-                    if val is not None:
-                        performance[var_name] = val
-                except Exception:
-                    pass
+@mcp.tool()
+def get_all_results(session_id: str) -> Dict[str, Any]:
+    """Get stream, unit and costing results in one call.
+
+    Loads the session and builds (or reuses) the model once for all three
+    extractions. After a successful solve, returns persisted KPIs.
+
+    Args:
+        session_id: Session to get results for
+
+    Returns:
+        Streams, per-unit performance and costing (None if not configured)
+    """
+    try:
+        session = session_manager.load_cached(session_id)
+    except FileNotFoundError:
+        return {"error": f"Session '{session_id}' not found"}
+
+    kpis = session.results.get("kpis") if isinstance(session.results, dict) else None
+    if kpis and (kpis.get("streams") or kpis.get("units")):
+        return {
+            "session_id": session_id,
+            "source": "solved",
+            "streams": dict(_solved_stream_kpis(session)),
+            "units": kpis.get("units", {}),
+            "costing": kpis.get("costing"),
+        }
 
+    # Fall back to rebuilding model (returns uninitialized/unsolved values)
+    try:
+        m, units = _get_or_build_model(session)
+    except ImportError as e:
+        return {
+            "session_id": session_id,
+            "error": f"WaterTAP/IDAES not available: {e}",
+        }
     except Exception as e:
-        performance["extraction_error"] = str(e)[:100]
+        return {
+            "session_id": session_id,
+            "error": f"Model build failed: {e}",
+        }
 
-    return {
+    result = {
         "session_id": session_id,
-        "unit_id": unit_id,
-        "unit_type": unit_inst.unit_type,
         "source": "unsolved_model",
         "warning": "Values are from an unsolved model. Run solve() first.",
-        "performance": performance,
+        "streams": {},
+        "units": {
+            unit_id: _extract_unit_performance(
+                unit_block, session.units[unit_id].unit_type
+            )
+            for unit_id, unit_block in units.items()
+            if unit_id in session.units
+        },
+        "costing": None,
     }
 
+    # Streams cover translator blocks too, as in get_stream_results; only
+    # the unit performance above needs a registered unit type
+    stream_blocks = {
+        block_id: units[block_id]
+        for block_id in (*session.units, *session.translators)
+        if block_id in units
+    }
+    try:
+        result["streams"] = _extract_streams(stream_blocks)
+    except Exception as e:
+        result["stream_error"] = str(e)[:100]
+
+    try:
+        result["costing"] = extract_costing(m, units)
+    except Exception as e:
+        result["costing_error"] = str(e)[:100]
+
+    return result
+
 
 # ============================================================================
 # COSTING TOOLS
@@ -3249,7 +3961,7 @@ def list_costed_units(session_id: str) -> Dict[str, Any]:
         List of units with costing status
     """
     try:
-        session = session_manager.load(session_id)
+        session = session_manager.load_cached(session_id)
     except FileNotFoundError:
         return {"error": f"Session '{session_id}' not found"}
 
@@ -3296,7 +4008,7 @@ def compute_costing(
         Computed costing results including LCOW, CapEx, OpEx
     """
     try:
-        session = session_manager.load(session_id)
+        session = session_manager.load_cached(session_id)
     except FileNotFoundError:
         return {"error": f"Session '{session_id}' not found"}
 
@@ -3306,9 +4018,6 @@ def compute_costing(
         }
 
     try:
-        from utils.model_builder import ModelBuilder, ModelBuildError
-        from pyomo.environ import value
-
         builder = ModelBuilder(session)
         m = builder.build()
     except ImportError as e:
@@ -3329,8 +4038,6 @@ def compute_costing(
             "error": "Costing block not created. Ensure units have costing enabled.",
         }
 
-    costing_block = m.fs.costing
-
     # Extract costing results
     results = {
         "session_id": session_id,
@@ -3338,57 +4045,7 @@ def compute_costing(
     }
 
     try:
-        # Total capital cost
-        if hasattr(costing_block, "total_capital_cost"):
-            results["total_capital_cost"] = value(
-                costing_block.total_capital_cost, exception=False
-            )
-
-        # Total operating cost
-        if hasattr(costing_block, "total_operating_cost"):
-            results["total_operating_cost"] = value(
-                costing_block.total_operating_cost, exception=False
-            )
-
-        # LCOW
-        if hasattr(costing_block, "LCOW"):
-            results["LCOW"] = value(costing_block.LCOW, exception=False)
-
-        # Specific energy consumption
-        if hasattr(costing_block, "specific_energy_consumption"):
-            results["specific_energy_consumption"] = value(
-                costing_block.specific_energy_consumption, exception=False
-            )
-
-        # Aggregate electricity
-        if hasattr(costing_block, "aggregate_flow_electricity"):
-            results["aggregate_electricity"] = value(
-                costing_block.aggregate_flow_electricity, exception=False
-            )
-
-        # Unit-level costs
-        unit_costs = {}
-        units = builder.get_units()
-        for unit_id, unit_block in units.items():
-            if hasattr(unit_block, "costing"):
-                unit_costing = unit_block.costing
-                unit_cost_data = {}
-
-                if hasattr(unit_costing, "capital_cost"):
-                    unit_cost_data["capital_cost"] = value(
-                        unit_costing.capital_cost, exception=False
-                    )
-                if hasattr(unit_costing, "fixed_operating_cost"):
-                    unit_cost_data["fixed_operating_cost"] = value(
-                        unit_costing.fixed_operating_cost, exception=False
-                    )
-
-                if unit_cost_data:
-                    unit_costs[unit_id] = unit_cost_data
-
-        if unit_costs:
-            results["unit_costs"] = unit_costs
-
+        results.update(extract_costing(m, builder.get_units()) or {})
     except Exception as e:
         results["extraction_error"] = str(e)[:100]
 
@@ -3406,16 +4063,23 @@ def get_costing(session_id: str) -> Dict[str, Any]:
         Costing breakdown (LCOW, CapEx, OpEx) if costing configured
     """
     try:
-        session = session_manager.load(session_id)
+        session = session_manager.load_cached(session_id)
     except FileNotFoundError:
         return {"error": f"Session '{session_id}' not found"}
 
-    # Build the Pyomo model to extract costing data
-    try:
-        from utils.model_builder import ModelBuilder, ModelBuildError
+    # Solved values persisted with the KPIs; no model needed
+    kpis = session.results.get("kpis") if isinstance(session.results, dict) else None
+    if kpis and kpis.get("costing"):
+        return {
+            "session_id": session_id,
+            "costing_configured": True,
+            "source": "solved",
+            **kpis["costing"],
+        }
 
-        builder = ModelBuilder(session)
-        m = builder.build()
+    # Build (or reuse) the Pyomo model to extract costing data
+    try:
+        m, units = _get_or_build_model(session)
     except ImportError as e:
         return {
             "session_id": session_id,
@@ -3436,84 +4100,10 @@ def get_costing(session_id: str) -> Dict[str, Any]:
     }
 
     try:
-        from pyomo.environ import value
-
-        # Check for WaterTAP costing block on flowsheet
-        fs = m.fs
-        costing_block = getattr(fs, "costing", None)
-
-        if costing_block is not None:
+        costing = extract_costing(m, units)
+        if costing is not None:
             costing_data["costing_configured"] = True
-
-            # Extract LCOW if available
-            lcow = getattr(costing_block, "LCOW", None)
-            if lcow is not None:
-                try:
-                    costing_data["LCOW"] = value(lcow, exception=False)
-                except Exception:
-                    pass
-
-            # Extract capital cost
-            capital = getattr(costing_block, "total_capital_cost", None)
-            if capital is not None:
-                try:
-                    costing_data["total_capital_cost"] = value(capital, exception=False)
-                except Exception:
-                    pass
-
-            # Extract operating cost
-            operating = getattr(costing_block, "total_operating_cost", None)
-            if operating is not None:
-                try:
-                    costing_data["total_operating_cost"] = value(operating, exception=False)
-                except Exception:
-                    pass
-
-            # Extract specific energy consumption
-            sec = getattr(costing_block, "specific_energy_consumption", None)
-            if sec is not None:
-                try:
-                    costing_data["specific_energy_consumption"] = value(sec, exception=False)
-                except Exception:
-                    pass
-
-            # Extract electricity cost
-            elec_cost = getattr(costing_block, "aggregate_flow_electricity", None)
-            if elec_cost is not None:
-                try:
-                    costing_data["aggregate_electricity"] = value(elec_cost, exception=False)
-                except Exception:
-                    pass
-
-            # Check for unit-level costing
-            unit_costs = {}
-            for unit_id in session.units:
-                unit_block = getattr(fs, unit_id, None)
-                if unit_block is None:
-                    continue
-                unit_costing = getattr(unit_block, "costing", None)
-                if unit_costing is not None:
-                    unit_cost_data = {}
-                    # Capital cost
-                    cap = getattr(unit_costing, "capital_cost", None)
-                    if cap is not None:
-                        try:
-                            unit_cost_data["capital_cost"] = value(cap, exception=False)
-                        except Exception:
-                            pass
-                    # Fixed operating cost
-                    fixed_op = getattr(unit_costing, "fixed_operating_cost", None)
-                    if fixed_op is not None:
-                        try:
-                            unit_cost_data["fixed_operating_cost"] = value(fixed_op, exception=False)
-                        except Exception:
-                            pass
-                    if unit_cost_data:
-                        unit_costs[unit_id] = unit_cost_data
-
-            if unit_costs:
-                costing_data["unit_costs"] = unit_costs
-
+            costing_data.update(costing)
         else:
             costing_data["note"] = (
                 "Costing block not found. To enable costing:\n"
@@ -3635,7 +4225,6 @@ def connect_units(
         return {"error": f"Session '{session_id}' not found"}
 
     # Check if we can detect property packages for these units
-    from utils.auto_translator import check_connection_compatibility
 
     # Get unit property packages from config if available
     src_unit_inst = session.units.get(source_unit)
@@ -3653,7 +4242,6 @@ def connect_units(
 
         if src_pkg_name and dst_pkg_name:
             try:
-                from core.property_registry import PropertyPackageType
                 source_pkg = PropertyPackageType[src_pkg_name]
                 dest_pkg = PropertyPackageType[dst_pkg_name]
             except (KeyError, ValueError):
@@ -3736,10 +4324,14 @@ def build_and_solve(
         Job ID for background execution
     """
     try:
-        session = session_manager.load(session_id)
+        session = session_manager.load_cached(session_id)
     except FileNotFoundError:
         return {"error": f"Session '{session_id}' not found"}
 
+    # The solve runs in the worker; later fallbacks get a fresh build rather
+    # than one left in place by initialize_* calls
+    model_cache.invalidate(session_id)
+
     # Submit as background job with full pipeline
     params = {
         "run_full_pipeline": True,
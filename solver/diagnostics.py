@@ -4,10 +4,14 @@ Provides tools for diagnosing solver failures and model issues.
 Wraps IDAES DiagnosticsToolbox and provides failure pattern matching.
 """
 
-from dataclasses import dataclass, field
+import functools
+from dataclasses import dataclass, field, fields
 from enum import Enum
+from math import isnan
 from typing import Any, Dict, List, Optional, Tuple
 
+from .dof_resolver import DOFResolver
+
 
 class DiagnosticType(Enum):
     """Type of diagnostic check."""
@@ -18,7 +22,7 @@ class DiagnosticType(Enum):
     JACOBIAN_ANALYSIS = "jacobian_analysis"
 
 
-@dataclass
+@dataclass(slots=True)
 class ConstraintResidual:
     """Constraint residual information."""
     constraint_name: str
@@ -28,7 +32,7 @@ class ConstraintResidual:
     is_equality: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class BoundViolation:
     """Variable bound violation."""
     variable_name: str
@@ -38,7 +42,7 @@ class BoundViolation:
     violation_type: str = ""  # "below_lower", "above_upper"
 
 
-@dataclass
+@dataclass(slots=True)
 class DiagnosticResult:
     """Result of diagnostic analysis."""
     diagnostic_type: DiagnosticType
@@ -48,6 +52,39 @@ class DiagnosticResult:
     suggestions: List[str] = field(default_factory=list)
 
 
+@functools.lru_cache(maxsize=1)
+def _toolbox_class() -> Any:
+    """IDAES DiagnosticsToolbox class, or None if IDAES is not installed.
+
+    Imported on first use (IDAES is slow to import) and remembered, so the
+    import is attempted once per process.
+    """
+    try:
+        from idaes.core.util.model_diagnostics import DiagnosticsToolbox
+    except ImportError:
+        return None
+    return DiagnosticsToolbox
+
+
+# (lowercase constraint-name substring, likely cause, suggested fix) for
+# infeasible solves
+_INFEASIBLE_PATTERNS: Tuple[Tuple[str, str, str], ...] = (
+    (
+        "flux_mass",
+        "RO membrane flux constraint violated - likely insufficient feed pressure",
+        "Increase feed pressure to at least 1.5x osmotic pressure",
+    ),
+    (
+        "solubility",
+        "Crystallizer solubility constraint violated",
+        "Check that feed concentration can reach saturation at operating temperature",
+    ),
+)
+
+# Failures where a non-zero DOF is checked before scanning residuals
+_DOF_FIRST_CONDITIONS = frozenset({"maxIterations", "locallyInfeasible"})
+
+
 class DiagnosticsRunner:
     """Runner for model diagnostics.
 
@@ -62,15 +99,23 @@ class DiagnosticsRunner:
             model: Pyomo model
         """
         self._model = model
-        self._toolbox = None
+        # (model, toolbox) for the last model diagnosed
+        self._toolbox: Optional[Tuple[Any, Any]] = None
 
     def _get_toolbox(self, model: Any) -> Any:
-        """Get or create DiagnosticsToolbox."""
-        try:
-            from idaes.core.util.model_diagnostics import DiagnosticsToolbox
-            return DiagnosticsToolbox(model)
-        except ImportError:
+        """Get or create the DiagnosticsToolbox for a model.
+
+        The toolbox is reused while the same model is passed, so structural
+        and numerical runs on one model share it.
+        """
+        if self._toolbox is not None and self._toolbox[0] is model:
+            return self._toolbox[1]
+        toolbox_class = _toolbox_class()
+        if toolbox_class is None:
             return None
+        toolbox = toolbox_class(model)
+        self._toolbox = (model, toolbox)
+        return toolbox
 
     def run_structural_diagnostics(self, model: Any) -> DiagnosticResult:
         """Run structural diagnostics on model.
@@ -168,6 +213,101 @@ class DiagnosticsRunner:
                 summary=f"Numerical diagnostics failed: {e}",
             )
 
+    def _scan_residuals_and_violations(
+        self,
+        model: Any,
+        threshold: float,
+        tolerance: float,
+        max_results: int,
+        residuals: bool = True,
+        violations: bool = True,
+    ) -> Tuple[List[ConstraintResidual], List[BoundViolation]]:
+        """Collect the largest constraint residuals and bound violations.
+
+        Walks the active blocks once, reading each block's constraints and
+        variables in the same visit, then compares values against bounds in
+        vectorized passes. Names are formatted only for the entries that are
+        returned.
+
+        Args:
+            model: Pyomo model
+            threshold: Only report residuals above this
+            tolerance: Tolerance for bound violations
+            max_results: Maximum number of each to return
+            residuals: Whether to collect constraint residuals
+            violations: Whether to collect bound violations
+
+        Returns:
+            (residuals, violations), each sorted largest first
+        """
+        from pyomo.environ import Constraint, Var, value
+
+        # Values and bounds, compared in vectorized passes below; missing
+        # bounds are stored as -inf/inf
+        inf = float("inf")
+        con_data: List[Any] = []
+        con_bodies: List[float] = []
+        con_lowers: List[float] = []
+        con_uppers: List[float] = []
+        con_equality: List[bool] = []
+        var_data: List[Any] = []
+        var_vals: List[float] = []
+        var_lbs: List[float] = []
+        var_ubs: List[float] = []
+
+        for block in model.block_data_objects(active=True):
+            if residuals:
+                for c in block.component_data_objects(
+                    Constraint, active=True, descend_into=False
+                ):
+                    # Only evaluation can raise; the checks below are plain ifs
+                    try:
+                        body = value(c.body, exception=False)
+                        if body is None:
+                            continue
+                        equality = c.equality
+                        lower = value(c.lower, exception=False)
+                        upper = lower if equality else value(c.upper, exception=False)
+                    except Exception:
+                        continue
+                    # NaN never compares past a bound; residual is |body - bound|
+                    # for equalities, so one without a bound has nothing to report
+                    if isnan(body) or (equality and lower is None):
+                        continue
+                    con_data.append(c)
+                    con_bodies.append(body)
+                    con_lowers.append(-inf if lower is None else lower)
+                    con_uppers.append(inf if upper is None else upper)
+                    con_equality.append(equality)
+
+            if violations:
+                for v in block.component_data_objects(Var, descend_into=False):
+                    try:
+                        val = v.value
+                        if val is None:
+                            continue
+                        lb = v.lb
+                        ub = v.ub
+                    except Exception:
+                        continue
+                    var_data.append(v)
+                    var_vals.append(val)
+                    var_lbs.append(-inf if lb is None else lb)
+                    var_ubs.append(inf if ub is None else ub)
+
+        found_residuals = (
+            _constraint_residuals(
+                con_data, con_bodies, con_lowers, con_uppers, con_equality,
+                threshold, max_results,
+            )
+            if con_data else []
+        )
+        found_violations = (
+            _bound_violations(var_data, var_vals, var_lbs, var_ubs, tolerance, max_results)
+            if var_data else []
+        )
+        return found_residuals, found_violations
+
     def get_constraint_residuals(
         self,
         model: Any,
@@ -185,74 +325,16 @@ class DiagnosticsRunner:
             DiagnosticResult with ConstraintResidual details
         """
         try:
-            from pyomo.environ import Constraint, value
-
-            residuals = []
-
-            for c in model.component_data_objects(Constraint, active=True, descend_into=True):
-                try:
-                    body = value(c.body, exception=False)
-                    if body is None:
-                        continue
-
-                    if c.equality:
-                        # Equality constraint: residual = |body - bound|
-                        bound = value(c.lower, exception=False)
-                        if bound is not None:
-                            residual = abs(body - bound)
-                            if residual > threshold:
-                                residuals.append(ConstraintResidual(
-                                    constraint_name=str(c),
-                                    residual=residual,
-                                    body_value=body,
-                                    bound=bound,
-                                    is_equality=True,
-                                ))
-                    else:
-                        # Inequality - check both bounds
-                        lower = value(c.lower, exception=False)
-                        upper = value(c.upper, exception=False)
-
-                        if lower is not None and body < lower:
-                            residual = lower - body
-                            if residual > threshold:
-                                residuals.append(ConstraintResidual(
-                                    constraint_name=str(c),
-                                    residual=residual,
-                                    body_value=body,
-                                    bound=lower,
-                                    is_equality=False,
-                                ))
-                        elif upper is not None and body > upper:
-                            residual = body - upper
-                            if residual > threshold:
-                                residuals.append(ConstraintResidual(
-                                    constraint_name=str(c),
-                                    residual=residual,
-                                    body_value=body,
-                                    bound=upper,
-                                    is_equality=False,
-                                ))
-                except Exception:
-                    continue
-
-            # Sort by residual magnitude
-            residuals.sort(key=lambda r: r.residual, reverse=True)
-            residuals = residuals[:max_results]
-
-            return DiagnosticResult(
-                diagnostic_type=DiagnosticType.CONSTRAINT_RESIDUALS,
-                issues_found=len(residuals),
-                details=residuals,
-                summary=f"Found {len(residuals)} constraints with residual > {threshold}",
+            residuals, _ = self._scan_residuals_and_violations(
+                model, threshold, 0.0, max_results, violations=False
             )
-
         except Exception as e:
             return DiagnosticResult(
                 diagnostic_type=DiagnosticType.CONSTRAINT_RESIDUALS,
                 issues_found=-1,
                 summary=f"Failed to get residuals: {e}",
             )
+        return _residual_result(residuals, threshold)
 
     def get_bound_violations(
         self,
@@ -271,72 +353,34 @@ class DiagnosticsRunner:
             DiagnosticResult with BoundViolation details
         """
         try:
-            from pyomo.environ import Var, value
-
-            violations = []
-
-            for v in model.component_data_objects(Var, active=True, descend_into=True):
-                try:
-                    val = value(v, exception=False)
-                    if val is None:
-                        continue
-
-                    lb = v.lb
-                    ub = v.ub
-
-                    if lb is not None and val < lb - tolerance:
-                        violations.append(BoundViolation(
-                            variable_name=str(v),
-                            value=val,
-                            lower_bound=lb,
-                            upper_bound=ub,
-                            violation_type="below_lower",
-                        ))
-                    elif ub is not None and val > ub + tolerance:
-                        violations.append(BoundViolation(
-                            variable_name=str(v),
-                            value=val,
-                            lower_bound=lb,
-                            upper_bound=ub,
-                            violation_type="above_upper",
-                        ))
-                except Exception:
-                    continue
-
-            # Sort by violation magnitude
-            def violation_magnitude(v):
-                if v.violation_type == "below_lower":
-                    return v.lower_bound - v.value
-                else:
-                    return v.value - v.upper_bound
-
-            violations.sort(key=violation_magnitude, reverse=True)
-            violations = violations[:max_results]
-
-            return DiagnosticResult(
-                diagnostic_type=DiagnosticType.BOUND_VIOLATIONS,
-                issues_found=len(violations),
-                details=violations,
-                summary=f"Found {len(violations)} bound violations",
+            _, violations = self._scan_residuals_and_violations(
+                model, 0.0, tolerance, max_results, residuals=False
             )
-
         except Exception as e:
             return DiagnosticResult(
                 diagnostic_type=DiagnosticType.BOUND_VIOLATIONS,
                 issues_found=-1,
                 summary=f"Failed to check bounds: {e}",
             )
+        return _violation_result(violations)
 
     def diagnose_failure(
         self,
         model: Any,
         termination_condition: str,
+        force_full: bool = False,
     ) -> Dict[str, Any]:
         """Diagnose a solver failure.
 
+        For iteration-limit and local-infeasibility failures on a model
+        whose DOF is not 0, the DOF is reported as the cause and the
+        residual/bound scan is skipped, since the model must be
+        re-specified before residuals mean anything.
+
         Args:
             model: Pyomo model that failed to solve
             termination_condition: The solver's termination condition
+            force_full: Scan residuals and bounds even when DOF != 0
 
         Returns:
             Dict with diagnosis and suggestions
@@ -349,9 +393,32 @@ class DiagnosticsRunner:
             "suggested_fixes": [],
         }
 
-        # Get residuals and violations
-        residuals = self.get_constraint_residuals(model)
-        violations = self.get_bound_violations(model)
+        if not force_full and termination_condition in _DOF_FIRST_CONDITIONS:
+            try:
+                dof = DOFResolver().get_dof(model)
+            except Exception:
+                dof = 0
+            # -999 is get_dof's "could not count" marker; scan as usual
+            if dof not in (0, -999):
+                results["dof"] = dof
+                results["likely_causes"].append(
+                    f"Model is not square (DOF = {dof}); "
+                    + ("too few variables fixed" if dof > 0 else "too many variables fixed")
+                )
+                results["suggested_fixes"].append(
+                    "Fix or unfix variables until DOF = 0 (check_dof), then re-solve"
+                )
+                return results
+
+        # Get residuals and violations in one pass over the model
+        try:
+            found_residuals, found_violations = self._scan_residuals_and_violations(
+                model, threshold=1e-6, tolerance=1e-8, max_results=20
+            )
+        except Exception:
+            found_residuals, found_violations = [], []
+        residuals = _residual_result(found_residuals, 1e-6)
+        violations = _violation_result(found_violations)
 
         results["constraint_residuals"] = [
             {"name": r.constraint_name, "residual": r.residual}
@@ -364,21 +431,12 @@ class DiagnosticsRunner:
 
         # Pattern matching for common failures
         if termination_condition == "infeasible":
-            if any("flux_mass" in str(r.constraint_name) for r in residuals.details):
-                results["likely_causes"].append(
-                    "RO membrane flux constraint violated - likely insufficient feed pressure"
-                )
-                results["suggested_fixes"].append(
-                    "Increase feed pressure to at least 1.5x osmotic pressure"
-                )
-
-            if any("solubility" in str(r.constraint_name).lower() for r in residuals.details):
-                results["likely_causes"].append(
-                    "Crystallizer solubility constraint violated"
-                )
-                results["suggested_fixes"].append(
-                    "Check that feed concentration can reach saturation at operating temperature"
-                )
+            # One lowercased string of all names, searched once per pattern
+            names = "\n".join(r.constraint_name for r in residuals.details).lower()
+            for pattern, cause, fix in _INFEASIBLE_PATTERNS:
+                if pattern in names:
+                    results["likely_causes"].append(cause)
+                    results["suggested_fixes"].append(fix)
 
         elif termination_condition == "maxIterations":
             results["likely_causes"].append(
@@ -402,6 +460,153 @@ class DiagnosticsRunner:
         return results
 
 
+def top_k_indices(values: Any, mask: Any, k: int) -> Any:
+    """Indices of the k largest masked entries, largest first.
+
+    Args:
+        values: 1-D numpy array
+        mask: Boolean array selecting candidate entries
+        k: Number of indices to return
+
+    Returns:
+        numpy index array
+    """
+    import numpy as np
+
+    idx = np.flatnonzero(mask)
+    if k <= 0:
+        return idx[:0]
+    if len(idx) > k:
+        # Partial selection; only the k survivors are sorted
+        idx = idx[np.argpartition(-values[idx], k - 1)[:k]]
+    return idx[np.argsort(-values[idx], kind="stable")]
+
+
+def _constraint_residuals(
+    con_data: List[Any],
+    bodies: List[float],
+    lowers: List[float],
+    uppers: List[float],
+    equalities: List[bool],
+    threshold: float,
+    max_results: int,
+) -> List[ConstraintResidual]:
+    """Find the largest residuals among collected constraints.
+
+    Equality constraints report ``|body - bound|``. Inequalities report the distance past whichever
+    bound is violated.
+
+    Args:
+        con_data: Constraint data objects
+        bodies: Their body values
+        lowers: Their lower bounds (-inf if none)
+        uppers: Their upper bounds (inf if none)
+        equalities: Whether each constraint is an equality
+        threshold: Only report residuals above this
+        max_results: Maximum number to return
+
+    Returns:
+        ConstraintResidual list, largest first
+    """
+    import numpy as np
+
+    n = len(bodies)
+    body = np.fromiter(bodies, dtype=float, count=n)
+    lower = np.fromiter(lowers, dtype=float, count=n)
+    upper = np.fromiter(uppers, dtype=float, count=n)
+
+    equality = np.fromiter(equalities, dtype=bool, count=n)
+    below = ~equality & (body < lower)
+    above = ~equality & ~below & (body > upper)
+    # Filled in place under each mask, so only one float temporary is
+    # allocated however many constraints there are
+    residual = np.zeros(n)
+    with np.errstate(invalid="ignore"):
+        np.subtract(body, lower, out=residual, where=equality)
+        np.abs(residual, out=residual, where=equality)
+        np.subtract(lower, body, out=residual, where=below)
+        np.subtract(body, upper, out=residual, where=above)
+
+    found = []
+    for i in top_k_indices(residual, residual > threshold, max_results):
+        found.append(ConstraintResidual(
+            constraint_name=str(con_data[i]),
+            residual=float(residual[i]),
+            body_value=bodies[i],
+            bound=uppers[i] if above[i] else lowers[i],
+            is_equality=bool(equality[i]),
+        ))
+    return found
+
+
+def _bound_violations(
+    var_data: List[Any],
+    vals: List[float],
+    lbs: List[float],
+    ubs: List[float],
+    tolerance: float,
+    max_results: int,
+) -> List[BoundViolation]:
+    """Find the largest bound violations among collected variables.
+
+    Args:
+        var_data: Variable data objects
+        vals: Their values
+        lbs: Their lower bounds (-inf if none)
+        ubs: Their upper bounds (inf if none)
+        tolerance: Tolerance for bound violations
+        max_results: Maximum number to return
+
+    Returns:
+        BoundViolation list, largest first
+    """
+    import numpy as np
+
+    n = len(vals)
+    val_arr = np.fromiter(vals, dtype=float, count=n)
+    lb_arr = np.fromiter(lbs, dtype=float, count=n)
+    ub_arr = np.fromiter(ubs, dtype=float, count=n)
+
+    below = val_arr < lb_arr - tolerance
+    above = ~below & (val_arr > ub_arr + tolerance)
+    magnitude = np.zeros(n)
+    with np.errstate(invalid="ignore"):
+        np.subtract(lb_arr, val_arr, out=magnitude, where=below)
+        np.subtract(val_arr, ub_arr, out=magnitude, where=above)
+
+    found = []
+    for i in top_k_indices(magnitude, below | above, max_results):
+        lb, ub = lbs[i], ubs[i]
+        found.append(BoundViolation(
+            variable_name=str(var_data[i]),
+            value=vals[i],
+            lower_bound=None if lb == -np.inf else lb,
+            upper_bound=None if ub == np.inf else ub,
+            violation_type="below_lower" if below[i] else "above_upper",
+        ))
+    return found
+
+
+def _residual_result(residuals: List[ConstraintResidual], threshold: float) -> DiagnosticResult:
+    """Wrap collected residuals in a DiagnosticResult."""
+    return DiagnosticResult(
+        diagnostic_type=DiagnosticType.CONSTRAINT_RESIDUALS,
+        issues_found=len(residuals),
+        details=residuals,
+        summary=f"Found {len(residuals)} constraints with residual > {threshold}",
+    )
+
+
+def _violation_result(violations: List[BoundViolation]) -> DiagnosticResult:
+    """Wrap collected bound violations in a DiagnosticResult."""
+    return DiagnosticResult(
+        diagnostic_type=DiagnosticType.BOUND_VIOLATIONS,
+        issues_found=len(violations),
+        details=violations,
+        summary=f"Found {len(violations)} bound violations",
+    )
+
+
 def run_diagnostics(model: Any) -> Dict[str, Any]:
     """Run comprehensive diagnostics on a model.
 
@@ -413,9 +618,13 @@ def run_diagnostics(model: Any) -> Dict[str, Any]:
     """
     runner = DiagnosticsRunner(model)
 
+    def as_dict(result: DiagnosticResult) -> Dict[str, Any]:
+        # Slotted dataclasses have no __dict__; same shallow field dict
+        return {f.name: getattr(result, f.name) for f in fields(result)}
+
     return {
-        "structural": runner.run_structural_diagnostics(model).__dict__,
-        "numerical": runner.run_numerical_diagnostics(model).__dict__,
-        "constraint_residuals": runner.get_constraint_residuals(model).__dict__,
-        "bound_violations": runner.get_bound_violations(model).__dict__,
+        "structural": as_dict(runner.run_structural_diagnostics(model)),
+        "numerical": as_dict(runner.run_numerical_diagnostics(model)),
+        "constraint_residuals": as_dict(runner.get_constraint_residuals(model)),
+        "bound_violations": as_dict(runner.get_bound_violations(model)),
     }
@@ -4,14 +4,31 @@ Provides tools for analyzing and resolving degrees of freedom in WaterTAP models
 Wraps IDAES `degrees_of_freedom` utility and provides unit-specific guidance.
 """
 
+import ast
+import functools
+import re
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 if TYPE_CHECKING:
     from typing import Dict as DictType
 
 
+@functools.lru_cache(maxsize=1)
+def _idaes_degrees_of_freedom() -> Any:
+    """IDAES degrees_of_freedom, or None if IDAES is not installed.
+
+    Remembered after the first attempt: a failed import is not cached in
+    sys.modules and would search sys.path again on every call.
+    """
+    try:
+        from idaes.core.util.model_statistics import degrees_of_freedom
+    except ImportError:
+        return None
+    return degrees_of_freedom
+
+
 class DOFStatus(Enum):
     """Status of degrees of freedom analysis."""
     READY = "ready"           # DOF = 0, ready to solve
@@ -20,7 +37,7 @@ class DOFStatus(Enum):
     ERROR = "error"           # Could not determine DOF
 
 
-@dataclass
+@dataclass(slots=True)
 class VariableSuggestion:
     """Suggestion for fixing a variable."""
     var_path: str
@@ -31,19 +48,20 @@ class VariableSuggestion:
     priority: int = 1  # Lower = higher priority
 
 
-@dataclass
+@dataclass(slots=True)
 class DOFAnalysis:
     """Result of DOF analysis for a unit or flowsheet."""
     unit_id: str
     dof: int
     status: DOFStatus
+    # Variable listings are only filled in when status is not READY
     fixed_variables: List[str] = field(default_factory=list)
     unfixed_variables: List[str] = field(default_factory=list)
     suggestions: List[VariableSuggestion] = field(default_factory=list)
     message: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class FlowsheetDOFAnalysis:
     """Result of DOF analysis for an entire flowsheet."""
     total_dof: int
@@ -67,6 +85,9 @@ class DOFResolver:
             model: Optional Pyomo model reference
         """
         self._model = model
+        # id(block) -> DOF, only while analyze_flowsheet runs (the model
+        # cannot change underneath it)
+        self._dof_cache: Optional[Dict[int, int]] = None
 
     def get_dof(self, block: Any) -> int:
         """Get degrees of freedom for a block.
@@ -77,28 +98,45 @@ class DOFResolver:
         Returns:
             Degrees of freedom count
         """
-        try:
-            from idaes.core.util.model_statistics import degrees_of_freedom
-            return degrees_of_freedom(block)
-        except ImportError:
+        if self._dof_cache is not None:
+            dof = self._dof_cache.get(id(block))
+            if dof is None:
+                dof = self._dof_cache[id(block)] = self._compute_dof(block)
+            return dof
+        return self._compute_dof(block)
+
+    def _compute_dof(self, block: Any) -> int:
+        """Compute degrees of freedom for a block without caching."""
+        degrees_of_freedom = _idaes_degrees_of_freedom()
+        if degrees_of_freedom is None:
             # Fallback if IDAES not available
             return self._manual_dof_count(block)
+        return degrees_of_freedom(block)
 
     def _manual_dof_count(self, block: Any) -> int:
         """Manual DOF calculation when IDAES unavailable.
 
         DOF = n_variables - n_equality_constraints
+
+        Iterates each component's data directly rather than through
+        component_data_objects, which adds a generator layer per element.
         """
         try:
-            from pyomo.environ import Var, Constraint
-
-            n_vars = sum(1 for v in block.component_data_objects(
-                Var, active=True, descend_into=True
-            ) if not v.fixed)
-
-            n_cons = sum(1 for c in block.component_data_objects(
-                Constraint, active=True, descend_into=True
-            ))
+            from pyomo.environ import Constraint, Var
+
+            n_vars = 0
+            for var in block.component_objects(Var, active=True, descend_into=True):
+                for v in var.values():
+                    if not v.fixed:
+                        n_vars += 1
+
+            # Individual constraint data can be deactivated inside an
+            # active indexed constraint
+            n_cons = 0
+            for con in block.component_objects(Constraint, active=True, descend_into=True):
+                for c in con.values():
+                    if c.active:
+                        n_cons += 1
 
             return n_vars - n_cons
         except Exception:
@@ -132,9 +170,12 @@ class DOFResolver:
             status = DOFStatus.OVERSPECIFIED
             message = f"Unit has {abs(dof)} too many fixed variable(s)"
 
-        # Get fixed/unfixed variables
-        fixed_vars = self._get_fixed_variables(unit, unit_id)
-        unfixed_vars = self._get_unfixed_variables(unit, unit_id)
+        # Get fixed/unfixed variables; a square unit needs no listing, so
+        # the per-variable name formatting is skipped
+        if status == DOFStatus.READY:
+            fixed_vars, unfixed_vars = [], []
+        else:
+            fixed_vars, unfixed_vars = self._partition_variables(unit, unit_id)
 
         # Generate suggestions if underspecified and spec available
         suggestions = []
@@ -170,20 +211,25 @@ class DOFResolver:
         unit_analyses = {}
         all_suggestions = []
 
-        # Iterate over components that look like units
-        for name in dir(flowsheet):
-            if name.startswith('_'):
-                continue
-            obj = getattr(flowsheet, name)
+        # Iterate over sub-blocks that look like units
+        units = {}
+        for name, obj in self._child_blocks(flowsheet):
             if hasattr(obj, 'inlet') or hasattr(obj, 'outlet'):
                 # This looks like a unit
+                units[name] = obj
+
+        self._dof_cache = self._batch_dof(flowsheet, units)
+        try:
+            for name, obj in units.items():
                 spec = unit_specs.get(name) if unit_specs else None
                 analysis = self.analyze_unit(obj, name, spec)
                 unit_analyses[name] = analysis
                 all_suggestions.extend(analysis.suggestions)
 
-        # Get overall DOF
-        total_dof = self.get_overall_dof(flowsheet)
+            # Get overall DOF
+            total_dof = self.get_overall_dof(flowsheet)
+        finally:
+            self._dof_cache = None
 
         # Determine overall status
         if total_dof == 0:
@@ -204,6 +250,47 @@ class DOFResolver:
             message=message,
         )
 
+    def _child_blocks(self, flowsheet: Any) -> List[Tuple[str, Any]]:
+        """List (name, block) for the flowsheet's direct sub-blocks.
+
+        Enumerates Block components only, rather than probing every
+        attribute from dir(); objects that are not Pyomo blocks fall back
+        to the public attributes.
+        """
+        try:
+            from pyomo.environ import Block
+
+            return [
+                (b.local_name, b)
+                for b in flowsheet.component_objects(Block, descend_into=False)
+            ]
+        except (ImportError, AttributeError):
+            return [
+                (name, getattr(flowsheet, name))
+                for name in dir(flowsheet)
+                if not name.startswith('_')
+            ]
+
+    def _batch_dof(self, flowsheet: Any, units: Dict[str, Any]) -> Dict[int, int]:
+        """Seed the DOF cache for all units and the flowsheet in one pass.
+
+        Uses batch_degrees_of_freedom, which matches the IDAES definition;
+        without IDAES (or on failure) the cache starts empty and each block
+        is counted on first use.
+
+        Returns:
+            Dict of id(block) -> DOF
+        """
+        if _idaes_degrees_of_freedom() is None:
+            return {}
+        try:
+            unit_dof, total_dof = batch_degrees_of_freedom(flowsheet, units)
+        except Exception:
+            return {}
+        cache = {id(units[unit_id]): dof for unit_id, dof in unit_dof.items()}
+        cache[id(flowsheet)] = total_dof
+        return cache
+
     def get_overall_dof(self, flowsheet: Any) -> int:
         """Get overall DOF for entire flowsheet.
 
@@ -215,32 +302,28 @@ class DOFResolver:
         """
         return self.get_dof(flowsheet)
 
-    def _get_fixed_variables(self, block: Any, prefix: str) -> List[str]:
-        """Get list of fixed variables in a block."""
-        fixed = []
-        try:
-            from pyomo.environ import Var
-            for v in block.component_data_objects(Var, active=True, descend_into=True):
-                if v.fixed:
-                    # Get relative path from block
-                    name = str(v).replace(str(block) + ".", "")
-                    fixed.append(f"{prefix}.{name}")
-        except Exception:
-            pass
-        return fixed
+    def _partition_variables(self, block: Any, prefix: str) -> Tuple[List[str], List[str]]:
+        """Split a block's variables into fixed and unfixed paths in one walk.
 
-    def _get_unfixed_variables(self, block: Any, prefix: str) -> List[str]:
-        """Get list of unfixed variables in a block."""
+        Returns:
+            (fixed, unfixed) lists of "prefix.relative_name" paths
+        """
+        fixed = []
         unfixed = []
         try:
             from pyomo.environ import Var
+
+            block_prefix = str(block) + "."
+            cut = len(block_prefix)
             for v in block.component_data_objects(Var, active=True, descend_into=True):
-                if not v.fixed:
-                    name = str(v).replace(str(block) + ".", "")
-                    unfixed.append(f"{prefix}.{name}")
+                # Get relative path from block
+                name = str(v)
+                if name.startswith(block_prefix):
+                    name = name[cut:]
+                (fixed if v.fixed else unfixed).append(f"{prefix}.{name}")
         except Exception:
             pass
-        return unfixed
+        return fixed, unfixed
 
     def _generate_suggestions(
         self,
@@ -255,11 +338,16 @@ class DOFResolver:
         if not hasattr(unit_spec, 'required_fixes'):
             return suggestions
 
+        # Indexed specs ("permeate.pressure[0]") match a fixed path exactly;
+        # plain names ("A_comp") match any fixed index of that variable
+        fixed_paths = frozenset(already_fixed)
+        fixed_names = frozenset(f.partition("[")[0] for f in already_fixed)
+
         for i, var_spec in enumerate(unit_spec.required_fixes):
             var_path = f"{unit_id}.{var_spec.name}"
 
             # Skip if already fixed
-            if any(var_path in f for f in already_fixed):
+            if var_path in (fixed_paths if "[" in var_path else fixed_names):
                 continue
 
             suggestions.append(VariableSuggestion(
@@ -278,6 +366,111 @@ class DOFResolver:
         return suggestions
 
 
+def batch_degrees_of_freedom(
+    flowsheet: Any,
+    units: Dict[str, Any],
+) -> Tuple[Dict[str, int], int]:
+    """Compute per-unit and flowsheet DOF in a single pass over the model.
+
+    Uses the IDAES definition (unfixed variables appearing in active equality
+    constraints minus the number of those constraints), but walks the
+    flowsheet's constraints once instead of calling degrees_of_freedom on
+    every unit and then again on the flowsheet. Each constraint is credited
+    to the unit block that contains it; arc and other flowsheet-level
+    constraints only count toward the total.
+
+    Args:
+        flowsheet: Flowsheet block (typically m.fs)
+        units: Dict of unit_id -> unit block
+
+    Returns:
+        Tuple of (DOF per unit ID, flowsheet DOF)
+    """
+    from pyomo.core.expr.visitor import identify_variables
+    from pyomo.environ import Constraint
+
+    unit_of_block = {id(block): unit_id for unit_id, block in units.items()}
+    owner_cache: Dict[int, Optional[str]] = {}
+
+    def owning_unit(block: Any) -> Optional[str]:
+        key = id(block)
+        if key not in owner_cache:
+            unit_id = None
+            b = block
+            while b is not None and b is not flowsheet:
+                unit_id = unit_of_block.get(id(b))
+                if unit_id is not None:
+                    break
+                b = b.parent_block()
+            owner_cache[key] = unit_id
+        return owner_cache[key]
+
+    unit_cons = dict.fromkeys(units, 0)
+    unit_vars: Dict[str, set] = {unit_id: set() for unit_id in units}
+    all_vars: set = set()
+    n_cons = 0
+
+    for con in flowsheet.component_data_objects(Constraint, active=True, descend_into=True):
+        if not con.equality:
+            continue
+        var_ids = {id(v) for v in identify_variables(con.body, include_fixed=False)}
+        n_cons += 1
+        all_vars |= var_ids
+
+        unit_id = owning_unit(con.parent_block())
+        if unit_id is not None:
+            unit_cons[unit_id] += 1
+            unit_vars[unit_id] |= var_ids
+
+    unit_dof = {unit_id: len(unit_vars[unit_id]) - unit_cons[unit_id] for unit_id in units}
+    return unit_dof, len(all_vars) - n_cons
+
+
+# One path step: ".attr", "attr" or "[index]"
+_PATH_TOKEN = re.compile(r"\.?([^.\[\]]+)|\[([^\]]*)\]")
+
+
+def _parse_index(text: str) -> Any:
+    """Parse the text between brackets into a Pyomo index.
+
+    Python literals are used as-is ("0" -> 0, "0,'H2O'" -> (0, "H2O"));
+    unquoted names are taken as strings ("Liq,H2O" -> ("Liq", "H2O")).
+    """
+    try:
+        return ast.literal_eval(text)
+    except (ValueError, SyntaxError):
+        pass
+    parts = []
+    for part in text.split(","):
+        part = part.strip()
+        try:
+            parts.append(ast.literal_eval(part))
+        except (ValueError, SyntaxError):
+            parts.append(part.strip("'\""))
+    return parts[0] if len(parts) == 1 else tuple(parts)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_var_path(var_path: str) -> Tuple[Tuple[bool, Any], ...]:
+    """Split a variable path into (is_index, key) steps, once per path.
+
+    Example: "RO.A_comp[0,'H2O']" -> ((False, "RO"), (False, "A_comp"),
+    (True, (0, "H2O"))).
+    """
+    return tuple(
+        (False, attr) if attr else (True, _parse_index(index))
+        for attr, index in _PATH_TOKEN.findall(var_path)
+    )
+
+
+def _resolve_var_path(block: Any, var_path: str) -> Any:
+    """Follow a parsed variable path from a block."""
+    obj = block
+    for is_index, key in _parse_var_path(var_path):
+        obj = obj[key] if is_index else getattr(obj, key)
+    return obj
+
+
 def fix_variable(block: Any, var_path: str, value: float) -> bool:
     """Fix a variable to a specific value.
 
@@ -290,20 +483,7 @@ def fix_variable(block: Any, var_path: str, value: float) -> bool:
         True if successful, False otherwise
     """
     try:
-        # Navigate to the variable
-        parts = var_path.replace("]", "").replace("[", ".").split(".")
-        obj = block
-        for part in parts:
-            if part.startswith("'") or part.startswith('"'):
-                # String index
-                obj = obj[part.strip("'\"")]
-            elif part.isdigit():
-                obj = obj[int(part)]
-            else:
-                obj = getattr(obj, part)
-
-        # Fix the variable
-        obj.fix(value)
+        _resolve_var_path(block, var_path).fix(value)
         return True
     except Exception:
         return False
@@ -320,17 +500,7 @@ def unfix_variable(block: Any, var_path: str) -> bool:
         True if successful, False otherwise
     """
     try:
-        parts = var_path.replace("]", "").replace("[", ".").split(".")
-        obj = block
-        for part in parts:
-            if part.startswith("'") or part.startswith('"'):
-                obj = obj[part.strip("'\"")]
-            elif part.isdigit():
-                obj = obj[int(part)]
-            else:
-                obj = getattr(obj, part)
-
-        obj.unfix()
+        _resolve_var_path(block, var_path).unfix()
         return True
     except Exception:
         return False
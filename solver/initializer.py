@@ -7,12 +7,29 @@ IMPORTANT: Uses utils.topo_sort.compute_initialization_order which delegates
 to IDAES SequentialDecomposition. NO custom topological sort fallbacks.
 """
 
+import functools
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Dict, List, Optional, Tuple
 
 from utils.topo_sort import compute_initialization_order, SequentialDecompositionError
 
+from .dof_resolver import DOFResolver
+
+
+@functools.lru_cache(maxsize=1)
+def _idaes_propagate_state() -> Any:
+    """IDAES propagate_state, or None if IDAES is not installed.
+
+    Looked up on first use rather than at import so that importing the
+    solver package does not load IDAES.
+    """
+    try:
+        from idaes.core.util.initialization import propagate_state
+    except ImportError:
+        return None
+    return propagate_state
+
 
 class InitMethod(Enum):
     """Initialization method for a unit."""
@@ -35,8 +52,8 @@ class InitializationResult:
     """Result of initializing a unit."""
     unit_id: str
     status: InitStatus
-    dof_before: int = 0
-    dof_after: int = 0
+    dof_before: Optional[int] = None  # None when skipped without counting
+    dof_after: Optional[int] = None
     solve_status: str = ""
     message: str = ""
 
@@ -78,6 +95,7 @@ class FlowsheetInitializer:
         """
         self._flowsheet = flowsheet
         self._model = model
+        self._resolver = DOFResolver()
 
     def get_initialization_order(
         self,
@@ -119,12 +137,12 @@ class FlowsheetInitializer:
         Returns:
             True if successful
         """
+        propagate_state = _idaes_propagate_state()
+        if propagate_state is None:
+            return self._manual_propagate_state(source_port, dest_port)
         try:
-            from idaes.core.util.initialization import propagate_state
             propagate_state(arc=(source_port, dest_port))
             return True
-        except ImportError:
-            return self._manual_propagate_state(source_port, dest_port)
         except Exception:
             return False
 
@@ -133,17 +151,37 @@ class FlowsheetInitializer:
         source_port: Any,
         dest_port: Any,
     ) -> bool:
-        """Manual state propagation when IDAES not available."""
+        """Manual state propagation when IDAES not available.
+
+        Pyomo ports list their members in ``vars``, so they are copied by
+        name without reflecting over the port; other objects fall back to
+        matching public attributes.
+        """
         try:
+            src_members = getattr(source_port, "vars", None)
+            if isinstance(src_members, dict):
+                dst_members = getattr(dest_port, "vars", {})
+                for name, src_var in src_members.items():
+                    dst_var = dst_members.get(name)
+                    if dst_var is None:
+                        continue
+                    if src_var.is_indexed():
+                        for idx in src_var:
+                            dst_var[idx].set_value(src_var[idx].value)
+                    else:
+                        dst_var.set_value(src_var.value)
+                return True
+
             # Get state vars from source
             for var_name in dir(source_port):
                 if var_name.startswith('_'):
                     continue
-                src_var = getattr(source_port, var_name)
-                if hasattr(src_var, 'value') and hasattr(dest_port, var_name):
-                    dst_var = getattr(dest_port, var_name)
-                    if hasattr(dst_var, 'set_value'):
-                        dst_var.set_value(src_var.value)
+                try:
+                    value = getattr(source_port, var_name).value
+                    set_value = getattr(dest_port, var_name).set_value
+                except AttributeError:
+                    continue
+                set_value(value)
             return True
         except Exception:
             return False
@@ -168,21 +206,19 @@ class FlowsheetInitializer:
         Returns:
             InitializationResult
         """
-        from .dof_resolver import DOFResolver
+        # Skipped units (Feed, Product) are not counted; their DOF stays
+        # None rather than looking square
+        if method == InitMethod.NONE:
+            return InitializationResult(
+                unit_id=unit_id,
+                status=InitStatus.SKIPPED,
+                message="No initialization required",
+            )
 
-        resolver = DOFResolver()
+        resolver = self._resolver
         dof_before = resolver.get_dof(unit)
 
         try:
-            if method == InitMethod.NONE:
-                return InitializationResult(
-                    unit_id=unit_id,
-                    status=InitStatus.SKIPPED,
-                    dof_before=dof_before,
-                    dof_after=dof_before,
-                    message="No initialization required",
-                )
-
             kwargs = {}
             if state_args:
                 kwargs["state_args"] = state_args
@@ -245,28 +281,32 @@ class FlowsheetInitializer:
         init_order = self.get_initialization_order(units, connections, tear_streams)
         results = []
 
-        for unit_id in init_order:
-            if unit_id not in units:
-                continue
+        # dest_unit -> incoming connections, so each unit's upstream lookup
+        # does not rescan every connection
+        incoming: Dict[str, List[Dict]] = {}
+        for conn in connections:
+            incoming.setdefault(conn.get("dest_unit"), []).append(conn)
+
+        unit_methods = unit_methods or {}
+        state_args = state_args or {}
 
+        # Order entries without a built unit (e.g. arcs) are dropped up front
+        for unit_id in [u for u in init_order if u in units]:
             unit = units[unit_id]
-            method = (unit_methods or {}).get(unit_id, InitMethod.INITIALIZE)
-            args = (state_args or {}).get(unit_id)
+            method = unit_methods.get(unit_id, InitMethod.INITIALIZE)
+            args = state_args.get(unit_id)
 
             # Propagate state from upstream units
-            for conn in connections:
-                if conn.get("dest_unit") == unit_id:
-                    src_unit_id = conn.get("source_unit")
-                    if src_unit_id in units:
-                        src_port_name = conn.get("source_port", "outlet")
-                        dst_port_name = conn.get("dest_port", "inlet")
-
-                        src_unit = units[src_unit_id]
-                        if hasattr(src_unit, src_port_name) and hasattr(unit, dst_port_name):
-                            self.propagate_state(
-                                getattr(src_unit, src_port_name),
-                                getattr(unit, dst_port_name),
-                            )
+            for conn in incoming.get(unit_id, ()):
+                src_unit_id = conn.get("source_unit")
+                if src_unit_id in units:
+                    src_port_name = conn.get("source_port", "outlet")
+                    dst_port_name = conn.get("dest_port", "inlet")
+
+                    src_port = getattr(units[src_unit_id], src_port_name, None)
+                    dst_port = getattr(unit, dst_port_name, None)
+                    if src_port is not None and dst_port is not None:
+                        self.propagate_state(src_port, dst_port)
 
             # Initialize the unit
             result = self.initialize_unit(unit, unit_id, method, args)
@@ -79,6 +79,33 @@ class TestResultsSourceIndication:
         finally:
             server.session_manager = original_sm
 
+    def test_get_all_results_solved_source(self, seawater_pump_session, session_manager):
+        """After solve, get_all_results returns persisted streams, units and costing."""
+        import server
+        from core.session import SessionStatus
+
+        original_sm = server.session_manager
+        server.session_manager = session_manager
+
+        try:
+            seawater_pump_session.results = {
+                "kpis": {
+                    "streams": {"Feed": {"outlet": {"flow_mass": 1.0}}},
+                    "units": {"Pump1": {"work_mechanical[0.0]": 100.0}},
+                }
+            }
+            seawater_pump_session.status = SessionStatus.SOLVED
+            session_manager.save(seawater_pump_session)
+
+            result = server.get_all_results(seawater_pump_session.config.session_id)
+
+            assert result.get("source") == "solved"
+            assert result["streams"] == {"Feed.outlet": {"flow_mass": 1.0}}
+            assert result["units"] == {"Pump1": {"work_mechanical[0.0]": 100.0}}
+            assert result["costing"] is None
+        finally:
+            server.session_manager = original_sm
+
     def test_results_fallback_fields_present(self, seawater_pump_session, session_manager):
         """Fallback path should include all required fields."""
         import server
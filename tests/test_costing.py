@@ -251,6 +251,23 @@ class TestCostingPersistence:
         # Cleanup
         srv.delete_session(session_id)
 
+    def test_get_costing_served_from_persisted_kpis(self):
+        """Solved costing in the KPIs is returned without building the model."""
+        result = srv.create_session(property_package="SEAWATER")
+        session_id = result["session_id"]
+
+        session = srv.session_manager.load(session_id)
+        session.set_solved({"kpis": {"costing": {"LCOW": 0.45}}})
+        srv.session_manager.save(session)
+
+        result = srv.get_costing(session_id)
+        assert result["source"] == "solved"
+        assert result["costing_configured"] is True
+        assert result["LCOW"] == 0.45
+
+        # Cleanup
+        srv.delete_session(session_id)
+
 
 class TestModelBuilderCosting:
     """Test costing creation in ModelBuilder.
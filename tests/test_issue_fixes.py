@@ -275,6 +275,30 @@ class TestIssue5_ZOProcessSubtype:
         )
         assert has_tool, "load_zo_parameters tool MUST exist in server.py"
 
+    def test_identical_reload_is_cached(self):
+        """Reloading with the same database/subtype returns the recorded parameters."""
+        import server
+
+        session_id = server.create_session(
+            property_package="ZERO_ORDER",
+            property_package_config={"database": "default", "solute_list": ["tds"]},
+        )["session_id"]
+        session = server.session_manager.load(session_id)
+        unit = session.add_unit("nf", "NanofiltrationZO")
+        unit.zo_config.update({
+            "database": "default",
+            "process_subtype": None,
+            "parameters_loaded": {"recovery_frac_mass_H2O[0]": 0.8},
+            "property_package_config": dict(session.config.property_package_config),
+        })
+        server.session_manager.save(session)
+
+        result = server.load_zo_parameters(session_id, "nf")
+        assert result["cached"] is True
+        assert result["parameters_loaded"] == {"recovery_frac_mass_H2O[0]": 0.8}
+
+        server.delete_session(session_id)
+
 
 class TestIssue7_DeadCodeRemoval:
     """Test Issue 7: Dead code file should be removed."""
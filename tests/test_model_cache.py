@@ -0,0 +1,146 @@
+"""Tests for the built-model cache."""
+
+import os
+import sys
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.property_registry import PropertyPackageType
+from core.session import FlowsheetSession, SessionConfig
+from utils.model_cache import ModelCache, session_fingerprint, structural_fingerprint
+
+
+def _session():
+    config = SessionConfig(default_property_package=PropertyPackageType.SEAWATER)
+    session = FlowsheetSession(config=config)
+    session.add_unit("RO", "ReverseOsmosis0D")
+    return session
+
+
+class TestSessionFingerprint:
+    """Tests for session_fingerprint."""
+
+    def test_stable_for_unchanged_session(self):
+        """Same state gives the same fingerprint."""
+        session = _session()
+        copy = FlowsheetSession.from_dict(session.to_dict())
+        assert session_fingerprint(session) == session_fingerprint(copy)
+
+    def test_changes_with_fixed_vars(self):
+        """Fixing a variable changes the fingerprint."""
+        session = _session()
+        before = session_fingerprint(session)
+        session.fix_variable("RO", "A_comp", 4.2e-12)
+        assert session_fingerprint(session) != before
+
+    def test_ignores_timestamps(self):
+        """Timestamps and names do not force a rebuild."""
+        session = _session()
+        before = session_fingerprint(session)
+        copy = FlowsheetSession.from_dict(session.to_dict())
+        copy.config.updated_at = "2030-01-01T00:00:00"
+        copy.config.name = "renamed"
+        assert session_fingerprint(copy) == before
+
+
+class TestStructuralFingerprint:
+    """Tests for structural_fingerprint."""
+
+    def test_ignores_fixed_values(self):
+        """Changing a fixed value keeps the structure; fixing a new var does not."""
+        session = _session()
+        session.fix_variable("RO", "A_comp", 4.2e-12)
+        before = structural_fingerprint(session)
+
+        session.fix_variable("RO", "A_comp", 5.0e-12)
+        assert structural_fingerprint(session) == before
+
+        session.fix_variable("RO", "B_comp", 3.5e-8)
+        assert structural_fingerprint(session) != before
+
+    def test_tracks_fixed_feed_state(self):
+        """Fixing feed state changes the structure; new feed values do not."""
+        session = _session()
+        before = structural_fingerprint(session)
+
+        session.feed_state = {"state_args": {"pressure": 101325.0}}
+        session.clear_views()
+        with_feed = structural_fingerprint(session)
+        assert with_feed != before
+
+        session.feed_state = {"state_args": {"pressure": 2e5}}
+        session.clear_views()
+        assert structural_fingerprint(session) == with_feed
+
+
+class TestModelCache:
+    """Tests for ModelCache."""
+
+    def test_hit_and_miss(self):
+        """Cached model is returned until the session changes."""
+        cache = ModelCache(enabled=True)
+        session = _session()
+        assert cache.get(session) is None
+
+        model, units = object(), {"RO": object()}
+        cache.put(session, model, units)
+        assert cache.get(session) == (model, units)
+
+        session.fix_variable("RO", "A_comp", 4.2e-12)
+        assert cache.get(session) is None
+
+    def test_lru_eviction(self):
+        """Oldest session is evicted beyond maxsize."""
+        cache = ModelCache(maxsize=2, enabled=True)
+        sessions = [_session() for _ in range(3)]
+        for s in sessions:
+            cache.put(s, object(), {})
+
+        assert cache.get(sessions[0]) is None
+        assert cache.get(sessions[1]) is not None
+        assert cache.get(sessions[2]) is not None
+
+    def test_invalidate(self):
+        """invalidate drops the entry."""
+        cache = ModelCache(enabled=True)
+        session = _session()
+        cache.put(session, object(), {})
+        cache.invalidate(session.config.session_id)
+        assert cache.get(session) is None
+
+    def test_derived_built_once_per_entry(self):
+        """Derived objects are reused until the cached model is replaced."""
+        cache = ModelCache(enabled=True)
+        session = _session()
+        model = object()
+        cache.put(session, model, {})
+
+        builds = []
+
+        def build():
+            builds.append(1)
+            return len(builds)
+
+        assert cache.derived(session, model, "nlp", build) == 1
+        assert cache.derived(session, model, "nlp", build) == 1
+
+        # A model that is not the cached one is never stored against
+        assert cache.derived(session, object(), "nlp", build) == 2
+
+        cache.put(session, object(), {})
+        assert cache.derived(session, model, "nlp", build) == 3
+
+    def test_disabled(self, monkeypatch):
+        """MCP_DISABLE_MODEL_CACHE=1 turns caching off."""
+        monkeypatch.setenv("MCP_DISABLE_MODEL_CACHE", "1")
+        cache = ModelCache()
+        session = _session()
+        cache.put(session, object(), {})
+        assert cache.get(session) is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
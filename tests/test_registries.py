@@ -16,6 +16,7 @@ from core.property_registry import (
 from core.translator_registry import (
     TRANSLATORS,
     get_translator,
+    get_translator_by_name,
     find_translator_chain,
     list_translators,
 )
@@ -161,6 +162,12 @@ class TestTranslatorRegistry:
         # MCAS → Seawater does NOT exist
         assert get_translator(PropertyPackageType.MCAS, PropertyPackageType.SEAWATER) is None
 
+    def test_get_translator_by_name(self):
+        """Name-keyed lookup should match the enum-keyed registry."""
+        spec = get_translator_by_name("ASM1", "ADM1")
+        assert spec is get_translator(PropertyPackageType.ASM1, PropertyPackageType.ADM1)
+        assert get_translator_by_name("SEAWATER", "NACL") is None
+
     def test_translator_chain_same_package(self):
         """Same package should return empty chain (direct connection)."""
         chain = find_translator_chain(PropertyPackageType.SEAWATER, PropertyPackageType.SEAWATER)
@@ -116,6 +116,22 @@ class TestFlowsheetSession:
         session.remove_unit("RO1")
         assert "RO1" not in session.units
 
+    def test_remove_unit_returns_removed_connections(self):
+        """Removing a unit drops and returns its connections."""
+        config = SessionConfig(default_property_package=PropertyPackageType.SEAWATER)
+        session = FlowsheetSession(config=config)
+
+        session.add_unit("pump", "Pump")
+        session.add_unit("RO", "ReverseOsmosis0D")
+        session.add_unit("product", "Product")
+        session.add_connection("pump", "outlet", "RO", "inlet")
+        session.add_connection("RO", "permeate", "product", "inlet")
+
+        removed = session.remove_unit("pump")
+
+        assert [(c.source_unit, c.dest_unit) for c in removed] == [("pump", "RO")]
+        assert [(c.source_unit, c.dest_unit) for c in session.connections] == [("RO", "product")]
+
     def test_remove_unit_not_found(self):
         """Removing non-existent unit should raise."""
         config = SessionConfig(default_property_package=PropertyPackageType.SEAWATER)
@@ -140,6 +156,23 @@ class TestFlowsheetSession:
         assert conn.dest_unit == "RO"
         assert conn.dest_port == "inlet"
 
+    def test_adjacency(self):
+        """Adjacency index groups connections by source and tracks edits."""
+        config = SessionConfig(default_property_package=PropertyPackageType.SEAWATER)
+        session = FlowsheetSession(config=config)
+
+        session.add_unit("RO", "ReverseOsmosis0D")
+        session.add_unit("product", "Product")
+        session.add_unit("brine", "Product")
+        session.add_connection("RO", "permeate", "product", "inlet")
+        assert [c.dest_unit for c in session.adjacency()["RO"]] == ["product"]
+
+        session.add_connection("RO", "retentate", "brine", "inlet")
+        assert [c.dest_unit for c in session.adjacency()["RO"]] == ["product", "brine"]
+
+        session.remove_unit("product")
+        assert [c.dest_unit for c in session.adjacency()["RO"]] == ["brine"]
+
     def test_add_connection_invalid_source(self):
         """Adding connection with invalid source should raise."""
         config = SessionConfig(default_property_package=PropertyPackageType.SEAWATER)
@@ -160,6 +193,25 @@ class TestFlowsheetSession:
         assert "A_comp" in session.units["RO"].fixed_vars
         assert session.units["RO"].fixed_vars["A_comp"] == 4.2e-12
 
+    def test_cached_view_cleared_on_mutation(self):
+        """Derived views are rebuilt after the session changes."""
+        config = SessionConfig(default_property_package=PropertyPackageType.SEAWATER)
+        session = FlowsheetSession(config=config)
+        session.add_unit("RO", "ReverseOsmosis0D")
+
+        calls = []
+
+        def build():
+            calls.append(1)
+            return len(calls)
+
+        assert session.cached_view("n", build) == 1
+        assert session.cached_view("n", build) == 1
+
+        session.fix_variable("RO", "A_comp", 4.2e-12)
+        assert session.cached_view("n", build) == 2
+        assert "_views" not in session.to_dict()
+
     def test_fix_variable_unit_not_found(self):
         """Fixing variable on non-existent unit should raise."""
         config = SessionConfig(default_property_package=PropertyPackageType.SEAWATER)
@@ -289,6 +341,20 @@ class TestSessionManager:
         assert loaded.config.session_id == session.config.session_id
         assert "RO" in loaded.units
 
+    def test_failed_save_leaves_no_temp_file(self, temp_dir, monkeypatch):
+        """A save that fails midway removes its temporary file."""
+        manager = SessionManager(storage_dir=temp_dir)
+        config = SessionConfig(default_property_package=PropertyPackageType.SEAWATER)
+        session = FlowsheetSession(config=config)
+
+        def fail():
+            raise RuntimeError("serialization failed")
+
+        monkeypatch.setattr(session, "to_dict", fail)
+        with pytest.raises(RuntimeError):
+            manager.save(session)
+        assert os.listdir(temp_dir) == []
+
     def test_list_sessions(self, temp_dir):
         """List all sessions."""
         manager = SessionManager(storage_dir=temp_dir)
@@ -336,6 +402,64 @@ class TestSessionManager:
         with pytest.raises(FileNotFoundError):
             manager.load("nonexistent-id")
 
+    def test_load_cached_reuses_until_file_changes(self, temp_dir):
+        """load_cached should reuse the session until another writer saves."""
+        manager = SessionManager(storage_dir=temp_dir)
+
+        config = SessionConfig(default_property_package=PropertyPackageType.SEAWATER)
+        session = FlowsheetSession(config=config)
+        manager.save(session)
+        session_id = session.config.session_id
+
+        first = manager.load_cached(session_id)
+        assert manager.load_cached(session_id) is first
+
+        # Another process (e.g. the CLI) writes the file
+        other = SessionManager(storage_dir=temp_dir)
+        changed = other.load(session_id)
+        changed.add_unit("RO", "ReverseOsmosis0D")
+        other.save(changed)
+
+        reloaded = manager.load_cached(session_id)
+        assert reloaded is not first
+        assert "RO" in reloaded.units
+
+        manager.delete(session_id)
+        with pytest.raises(FileNotFoundError):
+            manager.load_cached(session_id)
+
+    def test_warm_start_roundtrip(self, temp_dir):
+        """Warm start is returned only for the matching fingerprint."""
+        manager = SessionManager(storage_dir=temp_dir)
+
+        config = SessionConfig(default_property_package=PropertyPackageType.SEAWATER)
+        session = FlowsheetSession(config=config)
+        manager.save(session)
+        session_id = session.config.session_id
+
+        assert manager.load_warm_start(session_id, "abc") is None
+        manager.save_warm_start(session_id, "abc", {"fs.RO.area": 50.0})
+        assert manager.load_warm_start(session_id, "abc") == {"fs.RO.area": 50.0}
+        assert manager.load_warm_start(session_id, "other") is None
+
+        # Not listed as a session, and removed with the session
+        assert len(manager.list_sessions()) == 1
+        manager.delete(session_id)
+        assert manager.load_warm_start(session_id, "abc") is None
+
+    def test_load_session_with_nan(self, temp_dir):
+        """NaN written by the stdlib encoder still loads."""
+        import math
+
+        manager = SessionManager(storage_dir=temp_dir)
+        config = SessionConfig(default_property_package=PropertyPackageType.SEAWATER)
+        session = FlowsheetSession(config=config)
+        session.results = {"kpis": {"units": {"RO": {"area": float("nan")}}}}
+        manager.save(session)
+
+        loaded = manager.load(session.config.session_id)
+        assert math.isnan(loaded.results["kpis"]["units"]["RO"]["area"])
+
     def test_session_persistence(self, temp_dir):
         """Session should persist to disk."""
         manager = SessionManager(storage_dir=temp_dir)
@@ -47,6 +47,80 @@ class TestDOFResolver:
         # Should not crash when model is None
         assert resolver._model is None
 
+    def test_analyze_flowsheet_counts_each_block_once(self, monkeypatch):
+        """A unit reachable under two names has its DOF computed once."""
+        class FakeUnit:
+            inlet = None
+
+        class FakeFlowsheet:
+            pass
+
+        unit = FakeUnit()
+        fs = FakeFlowsheet()
+        fs.RO = unit
+        fs.RO_alias = unit
+
+        calls = []
+        resolver = DOFResolver()
+        monkeypatch.setattr(resolver, "_compute_dof", lambda block: calls.append(block) or 0)
+
+        result = resolver.analyze_flowsheet(fs)
+        assert set(result.unit_analyses) == {"RO", "RO_alias"}
+        assert calls.count(unit) == 1
+        assert calls.count(fs) == 1
+        assert resolver._dof_cache is None
+
+    def test_suggestions_skip_fixed_variables(self):
+        """Required fixes already fixed at any index are not suggested."""
+        from core.unit_registry import VariableSpec
+
+        class FakeSpec:
+            required_fixes = [
+                VariableSpec("A_comp", "Water permeability", "m/s/Pa"),
+                VariableSpec("A", "Area", "m^2"),
+                VariableSpec("permeate.pressure[0]", "Permeate pressure", "Pa"),
+            ]
+
+        resolver = DOFResolver()
+        suggestions = resolver._generate_suggestions(
+            "RO", FakeSpec(), ["RO.A_comp[0.0,H2O]", "RO.permeate.pressure[0]"], 3
+        )
+        assert [s.var_path for s in suggestions] == ["RO.A"]
+
+
+class TestVariablePaths:
+    """Tests for fix_variable/unfix_variable path handling."""
+
+    def test_fix_indexed_variable(self):
+        """Attribute and tuple-index steps are followed to the variable."""
+        from solver.dof_resolver import fix_variable, unfix_variable
+
+        class FakeVarData:
+            fixed_to = None
+
+            def fix(self, value):
+                self.fixed_to = value
+
+            def unfix(self):
+                self.fixed_to = None
+
+        class FakeUnit:
+            pass
+
+        class FakeFlowsheet:
+            pass
+
+        data = FakeVarData()
+        fs = FakeFlowsheet()
+        fs.RO = FakeUnit()
+        fs.RO.A_comp = {(0, "H2O"): data}
+
+        assert fix_variable(fs, "RO.A_comp[0,'H2O']", 4.2e-12)
+        assert data.fixed_to == 4.2e-12
+        assert unfix_variable(fs, "RO.A_comp[0,'H2O']")
+        assert data.fixed_to is None
+        assert not fix_variable(fs, "RO.B_comp[0,'TDS']", 1.0)
+
 
 class TestScalingTools:
     """Tests for scaling tools."""
@@ -91,6 +165,78 @@ class TestFlowsheetInitializer:
         init = FlowsheetInitializer()
         assert init is not None
 
+    def test_initialize_flowsheet_propagates_upstream_ports(self, monkeypatch):
+        """Each unit receives state from every connection into it."""
+        from solver.initializer import InitStatus
+
+        class FakeUnit:
+            inlet = "inlet"
+            outlet = "outlet"
+
+        units = {"Feed": FakeUnit(), "Mix": FakeUnit(), "Pump": FakeUnit()}
+        connections = [
+            {"source_unit": "Feed", "dest_unit": "Mix"},
+            {"source_unit": "Pump", "dest_unit": "Mix"},
+            {"source_unit": "Mix", "dest_unit": "Pump"},
+        ]
+
+        init = FlowsheetInitializer()
+        propagated = []
+        monkeypatch.setattr(
+            init, "get_initialization_order", lambda u, c, t: ["Feed", "Mix", "Pump"]
+        )
+        monkeypatch.setattr(
+            init, "propagate_state", lambda src, dst: propagated.append((src, dst))
+        )
+        monkeypatch.setattr(
+            init, "initialize_unit",
+            lambda unit, unit_id, method, args: InitializationResult(
+                unit_id=unit_id, status=InitStatus.SUCCESS
+            ),
+        )
+
+        result = init.initialize_flowsheet(None, units, connections)
+        assert result.success
+        assert len(propagated) == 3
+
+    def test_initialize_unit_none_skips_dof(self, monkeypatch):
+        """InitMethod.NONE returns SKIPPED without counting DOF."""
+        from solver.initializer import InitMethod, InitStatus
+
+        init = FlowsheetInitializer()
+        monkeypatch.setattr(init._resolver, "get_dof", lambda block: pytest.fail("DOF counted"))
+        result = init.initialize_unit(object(), "Feed", InitMethod.NONE)
+        assert result.status == InitStatus.SKIPPED
+        assert result.dof_before is None and result.dof_after is None
+
+    def test_manual_propagate_state_uses_port_members(self):
+        """Port members listed in vars are copied, indexed ones per index."""
+        class FakeVarData:
+            def __init__(self, value=None):
+                self.value = value
+
+            def set_value(self, value):
+                self.value = value
+
+            def is_indexed(self):
+                return False
+
+        class FakeIndexedVar(dict):
+            def is_indexed(self):
+                return True
+
+        class FakePort:
+            def __init__(self, pressure, flow):
+                self.vars = {
+                    "pressure": FakeVarData(pressure),
+                    "flow": FakeIndexedVar({"H2O": FakeVarData(flow)}),
+                }
+
+        src, dst = FakePort(2e5, 1.0), FakePort(None, None)
+        assert FlowsheetInitializer()._manual_propagate_state(src, dst)
+        assert dst.vars["pressure"].value == 2e5
+        assert dst.vars["flow"]["H2O"].value == 1.0
+
 
 class TestDiagnosticsRunner:
     """Tests for diagnostics runner."""
@@ -100,6 +246,40 @@ class TestDiagnosticsRunner:
         runner = DiagnosticsRunner()
         assert runner is not None
 
+    def test_toolbox_reused_per_model(self, monkeypatch):
+        """One toolbox is built per model and shared between runs."""
+        from solver import diagnostics
+
+        class FakeToolbox:
+            built = 0
+
+            def __init__(self, model):
+                FakeToolbox.built += 1
+
+        monkeypatch.setattr(diagnostics, "_toolbox_class", lambda: FakeToolbox)
+        runner = DiagnosticsRunner()
+        model, other = object(), object()
+
+        assert runner._get_toolbox(model) is runner._get_toolbox(model)
+        assert FakeToolbox.built == 1
+        runner._get_toolbox(other)
+        assert FakeToolbox.built == 2
+
+    def test_diagnose_failure_reports_dof_first(self, monkeypatch):
+        """Iteration-limit failures on a non-square model stop at the DOF."""
+        from solver import diagnostics
+
+        monkeypatch.setattr(diagnostics.DOFResolver, "get_dof", lambda self, block: 2)
+        runner = DiagnosticsRunner()
+
+        result = runner.diagnose_failure(object(), "maxIterations")
+        assert result["dof"] == 2
+        assert "DOF = 2" in result["likely_causes"][0]
+
+        # Infeasibility still goes to the residual scan
+        result = runner.diagnose_failure(object(), "infeasible")
+        assert "dof" not in result
+
 
 class TestHygienePipeline:
     """Tests for hygiene pipeline."""
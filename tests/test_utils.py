@@ -9,6 +9,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from utils.topo_sort import (
     compute_initialization_order,
+    parse_tear_streams,
     SequentialDecompositionError,
 )
 from utils.state_translator import (
@@ -74,6 +75,11 @@ class TestInitializationOrder:
         order = compute_initialization_order(units, connections, tear_streams=[("B", "A")])
         assert len(order) == 2
 
+    def test_parse_tear_streams(self):
+        """Both tear stream formats parse; unknown names are skipped."""
+        pairs = parse_tear_streams(["arc_Mixer_RO", "RO : Mixer", "bogus"])
+        assert pairs == [("Mixer", "RO"), ("RO", "Mixer")]
+
 
 class TestStateTranslator:
     """Tests for state translator."""
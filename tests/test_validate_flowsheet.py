@@ -137,6 +137,37 @@ class TestValidateFlowsheetDOF:
         # Cleanup
         srv.delete_session(session_id)
 
+    def test_batch_fix_is_all_or_nothing(self):
+        """A failing entry in fix_variables_batch leaves the session unchanged."""
+        result = srv.create_session(property_package="SEAWATER")
+        session_id = result["session_id"]
+        srv.create_unit(session_id, unit_type="Pump", unit_id="pump1")
+
+        result = srv.fix_variables_batch(session_id, [
+            {"unit_id": "pump1", "var_name": "efficiency_pump", "value": 0.8},
+            {"unit_id": "missing", "var_name": "efficiency_pump", "value": 0.8},
+        ])
+        assert "error" in result
+        assert srv.get_session(session_id)["units"]["pump1"]["fixed_vars"] == {}
+
+        result = srv.fix_variables_batch(session_id, [
+            {"unit_id": "pump1", "var_name": "efficiency_pump", "value": 0.8},
+            "pump1.efficiency_pump=0.8",
+        ])
+        assert result["error"].startswith("fixes[1]:")
+        assert srv.get_session(session_id)["units"]["pump1"]["fixed_vars"] == {}
+
+        result = srv.fix_variables_batch(session_id, [
+            {"unit_id": "pump1", "var_name": "efficiency_pump", "value": 0.7},
+            {"unit_id": "pump1", "var_name": "efficiency_pump", "value": 0.8},
+            {"unit_id": "pump1", "var_name": "control_volume.properties_out[0].pressure", "value": 5e5},
+        ])
+        assert result["count"] == 2
+        assert len(srv.get_session(session_id)["units"]["pump1"]["fixed_vars"]) == 2
+
+        # Cleanup
+        srv.delete_session(session_id)
+
 
 class TestValidateFlowsheetUnconnectedUnits:
     """Test unconnected unit detection."""
@@ -156,6 +156,21 @@ class TestWaterTAPState:
         assert state.temperature_C == 30
         assert state.components["NaCl"] == 50000
 
+    def test_to_feed_state(self):
+        """feed_state record carries the spec fields plus state_args."""
+        state = WaterTAPState(
+            flow_vol_m3_hr=100,
+            temperature_C=30,
+            components={"TDS": 35000},
+        )
+        feed = state.to_feed_state(PropertyPackageType.SEAWATER)
+
+        assert feed["flow_vol_m3_hr"] == 100
+        assert feed["temperature_C"] == 30
+        assert feed["components"] == {"TDS": 35000}
+        assert feed["concentration_units"] == "mg/L"
+        assert feed["state_args"] == state.to_state_args(PropertyPackageType.SEAWATER)
+
 
 class TestElectroneutrality:
     """Tests for electroneutrality in MCAS conversions."""
@@ -2,6 +2,7 @@
 """Utility modules for WaterTAP MCP server."""
 
 from .job_manager import JobManager, Job, JobStatus
+from .model_cache import ModelCache, session_fingerprint, structural_fingerprint
 
 # Note: model_builder requires WaterTAP/IDAES, only import in worker.py
 # from .model_builder import ModelBuilder, ModelBuildError
@@ -10,4 +11,7 @@ __all__ = [
     "JobManager",
     "Job",
     "JobStatus",
+    "ModelCache",
+    "session_fingerprint",
+    "structural_fingerprint",
 ]
@@ -0,0 +1,76 @@
+"""Costing result extraction for WaterTAP flowsheets.
+
+Shared by the worker (to persist costing alongside KPIs after a solve) and
+by get_costing (to read an unsolved model), so both report the same fields.
+"""
+
+from typing import Any, Dict, Optional
+
+# Flowsheet costing block attribute -> reported key
+_SYSTEM_COSTING_VARS = (
+    ("LCOW", "LCOW"),
+    ("total_capital_cost", "total_capital_cost"),
+    ("total_operating_cost", "total_operating_cost"),
+    ("specific_energy_consumption", "specific_energy_consumption"),
+    ("aggregate_flow_electricity", "aggregate_electricity"),
+)
+
+# Unit costing block attribute -> reported key
+_UNIT_COSTING_VARS = (
+    ("capital_cost", "capital_cost"),
+    ("fixed_operating_cost", "fixed_operating_cost"),
+)
+
+
+def extract_costing(model: Any, units: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Extract system and unit costing values from a model.
+
+    Args:
+        model: Built Pyomo model with a flowsheet at ``model.fs``
+        units: Unit ID -> built unit block (as from ModelBuilder.get_units)
+
+    Returns:
+        Dict of costing values (LCOW, total_capital_cost, ..., unit_costs),
+        or None if the model has no flowsheet costing block
+    """
+    from pyomo.environ import value
+
+    fs = getattr(model, "fs", None)
+    costing_block = getattr(fs, "costing", None)
+    if costing_block is None:
+        return None
+
+    def read_into(out: Dict[str, Any], block: Any, attr: str, key: str) -> None:
+        component = getattr(block, attr, None)
+        if component is None:
+            return
+        try:
+            out[key] = value(component, exception=False)
+        except Exception:
+            pass
+
+    costing = {}
+    for attr, key in _SYSTEM_COSTING_VARS:
+        read_into(costing, costing_block, attr, key)
+
+    unit_costs = {}
+    for unit_id, unit_block in units.items():
+        unit_costing = getattr(unit_block, "costing", None)
+        if unit_costing is None:
+            continue
+        # One handler per unit; fields read before a failure are kept.
+        # Unset values are reported as None, not dropped
+        unit_cost_data = {}
+        try:
+            for attr, key in _UNIT_COSTING_VARS:
+                component = getattr(unit_costing, attr, None)
+                if component is not None:
+                    unit_cost_data[key] = value(component, exception=False)
+        except Exception:
+            pass
+        if unit_cost_data:
+            unit_costs[unit_id] = unit_cost_data
+
+    if unit_costs:
+        costing["unit_costs"] = unit_costs
+    return costing
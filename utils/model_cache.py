@@ -0,0 +1,184 @@
+"""In-process cache of built Pyomo models.
+
+Building a WaterTAP flowsheet (property packages, unit blocks, arcs) is the
+dominant cost of every model-backed tool, and the result depends only on the
+session's structural state. ModelCache keeps the most recently built models
+keyed by session ID and a fingerprint of that state, so a sequence of tool
+calls on an unchanged session builds the model once.
+
+Set MCP_DISABLE_MODEL_CACHE=1 to always rebuild (useful when debugging).
+"""
+
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# Session fields that feed into ModelBuilder.build()
+_FINGERPRINT_FIELDS = ("units", "connections", "translators", "feed_state", "costing_config")
+
+# Config fields that do not affect the built model
+_IGNORED_CONFIG_FIELDS = ("name", "description", "created_at", "updated_at")
+
+
+def session_fingerprint(session: Any) -> str:
+    """Hash the parts of a session that determine the built model.
+
+    Args:
+        session: FlowsheetSession to fingerprint
+
+    Returns:
+        Hex digest that changes whenever a rebuild would produce a different model
+    """
+    def compute() -> str:
+        data = session.to_dict()
+        payload = {field: data[field] for field in _FINGERPRINT_FIELDS}
+        payload["config"] = {
+            k: v for k, v in data["config"].items() if k not in _IGNORED_CONFIG_FIELDS
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str).encode()
+        return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+    return session.cached_view("model_fingerprint", compute)
+
+
+def structural_fingerprint(session: Any) -> str:
+    """Hash the parts of a session that determine the model's structure.
+
+    Like session_fingerprint, but only the names of fixed variables (and
+    which feed state variables/indices are fixed) count, and scaling
+    factors, feed values and ZO parameter records are ignored, so the
+    fingerprint survives value-only edits. Structural diagnostics
+    (degrees of freedom, structural singularity) can be reused under it.
+
+    Args:
+        session: FlowsheetSession to fingerprint
+
+    Returns:
+        Hex digest of the flowsheet structure
+    """
+    def compute() -> str:
+        data = session.to_dict()
+        # ModelBuilder fixes every Feed's state from feed_state["state_args"],
+        # so the fixed keys (and indices) change the DOF; values do not
+        state_args = (data["feed_state"] or {}).get("state_args") or {}
+        payload = {
+            "feed_state": {
+                key: sorted(map(str, val)) if isinstance(val, dict) else None
+                for key, val in state_args.items()
+            },
+            "units": {
+                unit_id: {
+                    "unit_type": unit["unit_type"],
+                    "config": unit["config"],
+                    "fixed_vars": sorted(unit["fixed_vars"]),
+                    "costing_enabled": unit.get("costing_enabled", False),
+                }
+                for unit_id, unit in data["units"].items()
+            },
+            "connections": data["connections"],
+            "translators": data["translators"],
+            "costing_config": data["costing_config"],
+            "config": {
+                k: v for k, v in data["config"].items() if k not in _IGNORED_CONFIG_FIELDS
+            },
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str).encode()
+        return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+    return session.cached_view("structural_fingerprint", compute)
+
+
+class ModelCache:
+    """LRU cache of (model, units) per session, validated by fingerprint."""
+
+    def __init__(self, maxsize: int = 4, enabled: Optional[bool] = None):
+        """Initialize model cache.
+
+        Args:
+            maxsize: Maximum number of built models kept in memory
+            enabled: Force caching on/off (default: on unless
+                MCP_DISABLE_MODEL_CACHE=1)
+        """
+        if enabled is None:
+            enabled = os.environ.get("MCP_DISABLE_MODEL_CACHE", "") != "1"
+        self.enabled = enabled
+        self.maxsize = maxsize
+        # session_id -> (fingerprint, model, units, derived), most recently used last
+        self._entries: "OrderedDict[str, Tuple[str, Any, Dict[str, Any], Dict[str, Any]]]" = (
+            OrderedDict()
+        )
+
+    def get(self, session: Any) -> Optional[Tuple[Any, Dict[str, Any]]]:
+        """Get the cached model for a session if its state is unchanged.
+
+        Args:
+            session: FlowsheetSession to look up
+
+        Returns:
+            (model, units) tuple, or None on a miss
+        """
+        if not self.enabled:
+            return None
+        session_id = session.config.session_id
+        entry = self._entries.get(session_id)
+        if entry is None:
+            return None
+        if entry[0] != session_fingerprint(session):
+            del self._entries[session_id]
+            return None
+        self._entries.move_to_end(session_id)
+        return entry[1], entry[2]
+
+    def put(self, session: Any, model: Any, units: Dict[str, Any]) -> None:
+        """Store a freshly built model for a session.
+
+        Args:
+            session: FlowsheetSession the model was built from
+            model: Built Pyomo model
+            units: Unit ID -> unit block mapping from the builder
+        """
+        if not self.enabled:
+            return
+        session_id = session.config.session_id
+        self._entries[session_id] = (session_fingerprint(session), model, units, {})
+        self._entries.move_to_end(session_id)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def derived(self, session: Any, model: Any, key: str, build: Callable[[], Any]) -> Any:
+        """Get an object derived from a cached model, building it once.
+
+        Derived objects (e.g. a PyNumero NLP over the model) live and die with
+        the cache entry. If ``model`` is not the cached model for the session,
+        the object is built without being stored.
+
+        Args:
+            session: FlowsheetSession the model was built from
+            model: Model the object is derived from
+            key: Name of the derived object
+            build: Zero-argument callable producing the object
+
+        Returns:
+            Cached or freshly built object
+        """
+        entry = self._entries.get(session.config.session_id) if self.enabled else None
+        if entry is None or entry[1] is not model or entry[0] != session_fingerprint(session):
+            return build()
+        derived = entry[3]
+        if key not in derived:
+            derived[key] = build()
+        return derived[key]
+
+    def invalidate(self, session_id: str) -> None:
+        """Drop the cached model for a session.
+
+        Args:
+            session_id: Session whose model should be rebuilt on next use
+        """
+        self._entries.pop(session_id, None)
+
+    def clear(self) -> None:
+        """Drop all cached models."""
+        self._entries.clear()
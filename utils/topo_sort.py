@@ -9,6 +9,7 @@ Two modes:
    This is acceptable since we're just planning, not actually initializing.
 """
 
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
 
@@ -196,6 +197,42 @@ def _compute_order_from_connections(
     return result
 
 
+@lru_cache(maxsize=256)
+def parse_tear_stream(name: str) -> Optional[Tuple[str, str]]:
+    """Parse a tear stream name into a (source unit, destination unit) pair.
+
+    Accepts "src_unit:dest_unit" and arc names of the form "arc_Source_Dest"
+    (split on the last underscore, so the destination unit ID must not
+    contain one).
+
+    Args:
+        name: Tear stream name
+
+    Returns:
+        (source, destination) tuple, or None if the name is not recognized
+    """
+    if ":" in name:
+        src, dst = name.split(":", 1)
+        return src.strip(), dst.strip()
+    if name.startswith("arc_"):
+        parts = name[4:].rsplit("_", 1)
+        if len(parts) == 2:
+            return parts[0], parts[1]
+    return None
+
+
+def parse_tear_streams(names: List[str]) -> List[Tuple[str, str]]:
+    """Parse tear stream names, skipping unrecognized ones.
+
+    Args:
+        names: Tear stream names (see parse_tear_stream)
+
+    Returns:
+        List of (source, destination) unit pairs
+    """
+    return [pair for pair in map(parse_tear_stream, names) if pair is not None]
+
+
 # Backward compatibility exports (but these raise errors if IDAES unavailable)
 def get_sequential_decomposition_order(model: Any, tear_streams: Optional[List[Tuple[str, str]]] = None) -> List[str]:
     """Get initialization order using IDAES SequentialDecomposition.
@@ -25,6 +25,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from utils.job_manager import update_job_from_worker, JobStatus
+from utils.costing import extract_costing
 
 
 def update_status(jobs_dir: Path, job_id: str, **kwargs):
@@ -60,6 +61,55 @@ def persist_results_to_session(jobs_dir: Path, session_id: str, result: dict, su
         print(f"Warning: Failed to persist results to session: {e}", file=sys.stderr)
 
 
+# Common port names in WaterTAP
+_KPI_PORT_NAMES = [
+    'inlet', 'outlet', 'permeate', 'retentate', 'feed', 'product', 'brine',
+    'feed_inlet', 'feed_outlet', 'product_outlet', 'waste_outlet',
+]
+
+# Common state variable names
+_KPI_STATE_VARS = [
+    'flow_mass_phase_comp', 'flow_mol_phase_comp', 'flow_vol',
+    'temperature', 'pressure', 'conc_mass_phase_comp', 'conc_mol_phase_comp',
+    'mass_frac_phase_comp', 'mole_frac_phase_comp',
+]
+
+# Common unit KPI names
+_KPI_UNIT_VARS = [
+    'recovery_frac_mass_H2O', 'recovery_vol_phase', 'specific_energy_consumption',
+    'area', 'flux_mass_io_phase_comp', 'dens_mass_phase', 'work_mechanical',
+    'deltaP', 'efficiency_pump', 'recovery_frac',
+]
+
+
+def _kpi_registry(units: dict) -> list:
+    """Locate the KPI variables present on each unit.
+
+    Args:
+        units: Dict of unit_id -> unit_block
+
+    Returns:
+        List of (unit_id, port_name, var_name, var) tuples; port_name is None
+        for unit-level KPIs
+    """
+    registry = []
+    for unit_id, unit_block in units.items():
+        for port_name in _KPI_PORT_NAMES:
+            port = getattr(unit_block, port_name, None)
+            if port is None:
+                continue
+            for var_name in _KPI_STATE_VARS:
+                var = getattr(port, var_name, None)
+                if var is not None:
+                    registry.append((unit_id, port_name, var_name, var))
+
+        for kpi_name in _KPI_UNIT_VARS:
+            kpi_var = getattr(unit_block, kpi_name, None)
+            if kpi_var is not None:
+                registry.append((unit_id, None, kpi_name, kpi_var))
+    return registry
+
+
 def _extract_solved_kpis(model, units: dict) -> dict:
     """Extract key performance indicators from solved model.
 
@@ -72,89 +122,79 @@ def _extract_solved_kpis(model, units: dict) -> dict:
     """
     from pyomo.environ import value
 
+    def to_float(component):
+        val = value(component, exception=False)
+        return float(val) if val is not None else None
+
     kpis = {
         "streams": {},
         "units": {},
     }
 
-    # Common port names in WaterTAP
-    port_names = [
-        'inlet', 'outlet', 'permeate', 'retentate', 'feed', 'product', 'brine',
-        'feed_inlet', 'feed_outlet', 'product_outlet', 'waste_outlet',
-    ]
-
-    # Common state variable names
-    state_vars = [
-        'flow_mass_phase_comp', 'flow_mol_phase_comp', 'flow_vol',
-        'temperature', 'pressure', 'conc_mass_phase_comp', 'conc_mol_phase_comp',
-        'mass_frac_phase_comp', 'mole_frac_phase_comp',
-    ]
-
-    # Common unit KPI names
-    unit_kpi_names = [
-        'recovery_frac_mass_H2O', 'recovery_vol_phase', 'specific_energy_consumption',
-        'area', 'flux_mass_io_phase_comp', 'dens_mass_phase', 'work_mechanical',
-        'deltaP', 'efficiency_pump', 'recovery_frac',
-    ]
+    for unit_id, port_name, var_name, var in _kpi_registry(units):
+        try:
+            if hasattr(var, '__iter__') and not isinstance(var, str):
+                # Indexed variable
+                data = {str(idx): to_float(var_data) for idx, var_data in var.items()}
+            else:
+                # Scalar variable
+                data = to_float(var)
+        except Exception as e:
+            # Log extraction failure instead of silent pass
+            where = f"{unit_id}.{port_name}" if port_name else unit_id
+            print(f"Warning: Failed to extract {var_name} from {where}: {e}", file=sys.stderr)
+            continue
+
+        # Unset values are persisted as None (null), so readers can tell a
+        # variable that was not computed from one that does not exist
+        if port_name is None:
+            kpis["units"].setdefault(unit_id, {})[var_name] = data
+        else:
+            kpis["streams"].setdefault(unit_id, {}).setdefault(port_name, {})[var_name] = data
 
-    for unit_id, unit_block in units.items():
-        unit_streams = {}
+    # Costing, so get_costing can answer without rebuilding the model
+    try:
+        costing = extract_costing(model, units)
+    except Exception as e:
+        print(f"Warning: Failed to extract costing: {e}", file=sys.stderr)
+        costing = None
+    if costing is not None:
+        kpis["costing"] = costing
 
-        # Extract stream data from ports
-        for port_name in port_names:
-            port = getattr(unit_block, port_name, None)
-            if port is None:
-                continue
+    return kpis
 
-            stream_data = {}
-            for var_name in state_vars:
-                var = getattr(port, var_name, None)
-                if var is not None:
-                    try:
-                        if hasattr(var, '__iter__') and not isinstance(var, str):
-                            # Indexed variable
-                            stream_data[var_name] = {
-                                str(idx): float(value(var[idx])) if value(var[idx]) is not None else None
-                                for idx in var
-                            }
-                        else:
-                            # Scalar variable
-                            val = value(var)
-                            stream_data[var_name] = float(val) if val is not None else None
-                    except Exception as e:
-                        # Log extraction failure instead of silent pass
-                        print(f"Warning: Failed to extract {var_name} from {unit_id}.{port_name}: {e}", file=sys.stderr)
-
-            if stream_data:
-                unit_streams[port_name] = stream_data
-
-        if unit_streams:
-            kpis["streams"][unit_id] = unit_streams
-
-        # Extract unit-level KPIs
-        unit_kpis = {}
-        for kpi_name in unit_kpi_names:
-            kpi_var = getattr(unit_block, kpi_name, None)
-            if kpi_var is not None:
-                try:
-                    if hasattr(kpi_var, '__iter__') and not isinstance(kpi_var, str):
-                        # Indexed variable
-                        unit_kpis[kpi_name] = {
-                            str(idx): float(value(kpi_var[idx])) if value(kpi_var[idx]) is not None else None
-                            for idx in kpi_var
-                        }
-                    else:
-                        # Scalar variable
-                        val = value(kpi_var)
-                        unit_kpis[kpi_name] = float(val) if val is not None else None
-                except Exception as e:
-                    # Log extraction failure instead of silent pass
-                    print(f"Warning: Failed to extract KPI {kpi_name} from {unit_id}: {e}", file=sys.stderr)
 
-        if unit_kpis:
-            kpis["units"][unit_id] = unit_kpis
+def _collect_warm_start(model) -> dict:
+    """Collect values of unfixed variables for a later warm start.
 
-    return kpis
+    Args:
+        model: Solved Pyomo model
+
+    Returns:
+        Dict of variable name -> value
+    """
+    from pyomo.environ import Var
+
+    return {
+        v.name: v.value
+        for v in model.component_data_objects(Var, descend_into=True)
+        if not v.fixed and v.value is not None
+    }
+
+
+def _apply_warm_start(model, values: dict) -> None:
+    """Load variable values saved by _collect_warm_start into a fresh model.
+
+    Args:
+        model: Freshly built Pyomo model with the same structure
+        values: Dict of variable name -> value
+    """
+    from pyomo.environ import Var
+
+    for v in model.component_data_objects(Var, descend_into=True):
+        val = values.get(v.name)
+        if val is not None and not v.fixed:
+            v.set_value(val, skip_validation=True)
 
 
 def run_full_pipeline(jobs_dir: Path, job_id: str, session_id: str, params: dict):
@@ -328,6 +368,14 @@ def run_solve(jobs_dir: Path, job_id: str, session_id: str, params: dict):
         session_manager = SessionManager(jobs_dir.parent / "flowsheets")
         session = session_manager.load(session_id)
 
+        # Warm start: the server sets skip_preprocessing when the session is
+        # unchanged since its last optimal solve
+        from utils.model_cache import session_fingerprint
+        fingerprint = session_fingerprint(session)
+        warm_start = None
+        if params.get("skip_preprocessing"):
+            warm_start = session_manager.load_warm_start(session_id, fingerprint)
+
         # Build the Pyomo model from session state
         from utils.model_builder import ModelBuilder, ModelBuildError
 
@@ -358,50 +406,47 @@ def run_solve(jobs_dir: Path, job_id: str, session_id: str, params: dict):
         # Apply scaling
         iscale.calculate_scaling_factors(m)
 
-        update_status(jobs_dir, job_id, progress=60, message="Initializing flowsheet...")
-
-        # Get initialization order using IDAES SequentialDecomposition
-        from utils.topo_sort import compute_initialization_order, SequentialDecompositionError
+        if warm_start is not None:
+            update_status(jobs_dir, job_id, progress=60,
+                         message="Session unchanged since last solve, warm-starting from previous solution...")
+            _apply_warm_start(m, warm_start)
+        else:
+            update_status(jobs_dir, job_id, progress=60, message="Initializing flowsheet...")
 
-        connections = [
-            {
-                "src_unit": conn.source_unit,
-                "src_port": conn.source_port,
-                "dest_unit": conn.dest_unit,
-                "dest_port": conn.dest_port,
-            }
-            for conn in session.connections
-        ]
+            # Get initialization order using IDAES SequentialDecomposition
+            from utils.topo_sort import compute_initialization_order, SequentialDecompositionError
 
-        try:
-            init_order = compute_initialization_order(
-                units={uid: units.get(uid) for uid in session.units.keys()},
-                connections=connections,
-                tear_streams=None,
-                model=m,
-            )
-        except SequentialDecompositionError as e:
-            # FAIL LOUDLY - SequentialDecomposition is required
-            update_status(
-                jobs_dir, job_id,
-                status=JobStatus.FAILED,
-                error=f"IDAES SequentialDecomposition failed: {e}. Check flowsheet structure.",
-            )
-            return
+            connections = session.connection_dicts()
 
-        # Initialize units in SequentialDecomposition order
-        for unit_id in init_order:
-            if unit_id not in units:
-                continue
-            unit_block = units[unit_id]
             try:
-                if hasattr(unit_block, 'initialize_build'):
-                    unit_block.initialize_build()
-                elif hasattr(unit_block, 'initialize'):
-                    unit_block.initialize()
-            except Exception as e:
-                update_status(jobs_dir, job_id, progress=65,
-                             message=f"Init warning for {unit_id}: {e}")
+                init_order = compute_initialization_order(
+                    units={uid: units.get(uid) for uid in session.units.keys()},
+                    connections=connections,
+                    tear_streams=None,
+                    model=m,
+                )
+            except SequentialDecompositionError as e:
+                # FAIL LOUDLY - SequentialDecomposition is required
+                update_status(
+                    jobs_dir, job_id,
+                    status=JobStatus.FAILED,
+                    error=f"IDAES SequentialDecomposition failed: {e}. Check flowsheet structure.",
+                )
+                return
+
+            # Initialize units in SequentialDecomposition order
+            for unit_id in init_order:
+                if unit_id not in units:
+                    continue
+                unit_block = units[unit_id]
+                try:
+                    if hasattr(unit_block, 'initialize_build'):
+                        unit_block.initialize_build()
+                    elif hasattr(unit_block, 'initialize'):
+                        unit_block.initialize()
+                except Exception as e:
+                    update_status(jobs_dir, job_id, progress=65,
+                                 message=f"Init warning for {unit_id}: {e}")
 
         update_status(jobs_dir, job_id, progress=70, message="Solving...")
 
@@ -459,6 +504,7 @@ def run_solve(jobs_dir: Path, job_id: str, session_id: str, params: dict):
             "termination_condition": termination,
             "solve_time": safe_float(solve_time_raw),
             "iterations": safe_int(iterations_raw),
+            "warm_started": warm_start is not None,
         }
 
         if termination == "optimal":
@@ -470,11 +516,19 @@ def run_solve(jobs_dir: Path, job_id: str, session_id: str, params: dict):
                 print(f"Warning: Failed to extract KPIs: {e}", file=sys.stderr)
                 result["kpis"] = {}
 
+            # Snapshot the solution so an unchanged re-solve can skip init
+            try:
+                session_manager.save_warm_start(session_id, fingerprint, _collect_warm_start(m))
+                result["preprocess_fingerprint"] = fingerprint
+            except Exception as e:
+                print(f"Warning: Failed to save warm start: {e}", file=sys.stderr)
+
             update_status(
                 jobs_dir, job_id,
                 status=JobStatus.COMPLETED,
                 progress=100,
-                message="Solve completed successfully",
+                message="Solve completed successfully"
+                        + (" (warm start, initialization skipped)" if warm_start is not None else ""),
                 result=result,
             )
             # Persist results to session (includes KPIs)
@@ -550,15 +604,7 @@ def run_initialize(jobs_dir: Path, job_id: str, session_id: str, params: dict):
         # Get initialization order using IDAES SequentialDecomposition
         from utils.topo_sort import compute_initialization_order, SequentialDecompositionError
 
-        connections = [
-            {
-                "src_unit": conn.source_unit,
-                "src_port": conn.source_port,
-                "dest_unit": conn.dest_unit,
-                "dest_port": conn.dest_port,
-            }
-            for conn in session.connections
-        ]
+        connections = session.connection_dicts()
 
         # Use params-provided order if given (for manual override), otherwise compute via SequentialDecomposition
         if "init_order" in params: